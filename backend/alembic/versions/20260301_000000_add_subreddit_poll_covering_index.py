@@ -0,0 +1,41 @@
+"""Add covering index for the subreddit polling stale check
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-03-01
+
+get_subreddits_to_poll joins global_subreddit_polls on subreddit_name and
+filters on last_poll_at; poll_subreddit then reads last_post_timestamp.
+INCLUDE-ing both columns lets Postgres answer these from the index alone.
+
+reddit_leads needs no new index: the existing-lead check filters on
+(campaign_id, reddit_post_id) and selects reddit_post_id, which the
+uq_campaign_post unique index already covers.
+
+IMPORTANT: All DDL is fully idempotent using SQL-level checks (IF NOT EXISTS)
+to handle concurrent execution from multiple Railway instances.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_global_subreddit_polls_name_last_poll
+            ON global_subreddit_polls (subreddit_name)
+            INCLUDE (last_poll_at, last_post_timestamp);
+    """))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_global_subreddit_polls_name_last_poll', table_name='global_subreddit_polls')
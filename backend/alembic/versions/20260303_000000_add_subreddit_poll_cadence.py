@@ -0,0 +1,49 @@
+"""Add adaptive poll cadence columns to global_subreddit_polls
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-03-03
+
+avg_posts_per_hour is an EWMA of each subreddit's new-post rate and
+next_poll_at the time it is next due, so quiet subreddits are polled less
+often than busy ones. Rows without next_poll_at fall back to the fixed
+max-age check.
+
+IMPORTANT: All DDL is fully idempotent using SQL-level checks (DO/EXCEPTION)
+to handle concurrent execution from multiple Railway instances.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        DO $$ BEGIN
+            ALTER TABLE global_subreddit_polls ADD COLUMN avg_posts_per_hour DOUBLE PRECISION NOT NULL DEFAULT 0;
+        EXCEPTION
+            WHEN duplicate_column THEN null;
+        END $$;
+    """))
+
+    conn.execute(sa.text("""
+        DO $$ BEGIN
+            ALTER TABLE global_subreddit_polls ADD COLUMN next_poll_at TIMESTAMP;
+        EXCEPTION
+            WHEN duplicate_column THEN null;
+        END $$;
+    """))
+
+
+def downgrade() -> None:
+    op.drop_column('global_subreddit_polls', 'next_poll_at')
+    op.drop_column('global_subreddit_polls', 'avg_posts_per_hour')
@@ -0,0 +1,43 @@
+"""Add indexes for the scheduled-polling expiry filters
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-03-05
+
+run_scheduled_polls filters users on trial_ends_at (free-trial users only)
+and subscription_ends_at in SQL. A partial index on trial_ends_at keeps the
+free-trial check cheap without indexing every paid user's NULL.
+
+IMPORTANT: All DDL is fully idempotent using SQL-level checks (IF NOT EXISTS)
+to handle concurrent execution from multiple Railway instances.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_users_trial_ends_at_free_trial
+            ON users (trial_ends_at)
+            WHERE subscription_tier = 'FREE_TRIAL';
+    """))
+
+    conn.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_users_subscription_ends_at
+            ON users (subscription_ends_at);
+    """))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_subscription_ends_at', table_name='users')
+    op.drop_index('ix_users_trial_ends_at_free_trial', table_name='users')
@@ -0,0 +1,40 @@
+"""Add covering index for the admin usage aggregation
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-03-07
+
+get_all_users_usage filters usage_tracking on date, groups by user_id and
+sums the counters. INCLUDE-ing the counter columns lets Postgres answer it
+with an index-only scan instead of reading every heap row in the range.
+
+The upsert in usage_tracking needs no new index: its conflict target
+(user_id, api_type, date) is the existing uq_user_api_date constraint.
+
+IMPORTANT: All DDL is fully idempotent using SQL-level checks (IF NOT EXISTS)
+to handle concurrent execution from multiple Railway instances.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_usage_covering
+            ON usage_tracking (date, user_id)
+            INCLUDE (call_count, input_tokens, output_tokens);
+    """))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_usage_covering', table_name='usage_tracking')
@@ -0,0 +1,42 @@
+"""Drop the redundant subreddit polling covering index
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-03-09
+
+ix_global_subreddit_polls_name_last_poll (0008) duplicates the unique index
+on subreddit_name. Since 0009 the stale check in get_subreddits_to_poll
+loads whole rows and filters on next_poll_at, so the INCLUDE columns never
+give an index-only scan; the index only adds write cost to every poll.
+
+IMPORTANT: All DDL is fully idempotent using SQL-level checks (IF EXISTS)
+to handle concurrent execution from multiple Railway instances.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        DROP INDEX IF EXISTS ix_global_subreddit_polls_name_last_poll;
+    """))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        CREATE INDEX IF NOT EXISTS ix_global_subreddit_polls_name_last_poll
+            ON global_subreddit_polls (subreddit_name)
+            INCLUDE (last_poll_at, last_post_timestamp);
+    """))
@@ -49,6 +49,7 @@ from app.services.stripe_billing import (
     handle_subscription_updated,
     handle_subscription_deleted,
     handle_invoice_payment_failed,
+    run_webhook_handler,
 )
 
 router = APIRouter()
@@ -1336,7 +1337,7 @@ def run_campaign_now(
     
     try:
         polling_service = RedditPollingService()
-        summary = polling_service.poll_campaign_immediately(db, campaign_id)
+        summary = polling_service.poll_campaign_immediately(db, campaign_id, bypass_cache=True)
         
         return {
             "message": "Campaign polling completed",
@@ -1488,8 +1489,9 @@ async def run_campaign_stream(
                     logger.info(f"Client disconnected from SSE stream for campaign {campaign_id}")
                     break
 
-                yield f"event: {event['type']}\n"
-                yield f"data: {json.dumps(event['data'])}\n\n"
+                # One chunk per event: each yield is a separate ASGI send
+                data = json.dumps(event['data'], separators=(',', ':'))
+                yield f"event: {event['type']}\ndata: {data}\n\n"
 
         except Exception as e:
             logger.error(f"Error in SSE stream for campaign {campaign_id}: {e}", exc_info=True)
@@ -1779,7 +1781,7 @@ class CheckoutRequest(BaseModel):
 
 
 @router.post("/billing/create-checkout-session")
-def create_stripe_checkout(
+async def create_stripe_checkout(
     request: CheckoutRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -1798,7 +1800,7 @@ def create_stripe_checkout(
     cancel_url = request.cancel_url or f"{frontend_url}/reddit?checkout=cancelled"
 
     try:
-        result = create_checkout_session(
+        result = await create_checkout_session(
             user=current_user,
             tier_code=request.tier_code,
             db=db,
@@ -1814,7 +1816,7 @@ def create_stripe_checkout(
 
 
 @router.post("/billing/create-portal-session")
-def create_stripe_portal(
+async def create_stripe_portal(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -1833,7 +1835,7 @@ def create_stripe_portal(
     return_url = f"{frontend_url}/reddit"
 
     try:
-        result = create_customer_portal_session(
+        result = await create_customer_portal_session(
             user=current_user,
             db=db,
             return_url=return_url,
@@ -1855,6 +1857,10 @@ async def stripe_webhook(
     Handle Stripe webhook events.
 
     This endpoint receives events from Stripe when subscription status changes.
+    The Stripe endpoint must be subscribed to checkout.session.completed,
+    customer.subscription.created/updated/deleted and invoice.payment_failed.
+    subscription_ends_at is set by subscription.created after a checkout; if
+    checkout.session.completed lands first, it retrieves the subscription.
     """
     if not settings.STRIPE_WEBHOOK_SECRET:
         raise HTTPException(status_code=500, detail="Webhook not configured")
@@ -1881,16 +1887,18 @@ async def stripe_webhook(
 
     try:
         if event_type == "checkout.session.completed":
-            handle_checkout_completed(event_object, db)
+            await handle_checkout_completed(event_object, db)
 
-        elif event_type == "customer.subscription.updated":
-            handle_subscription_updated(event_object, db)
+        elif event_type in ("customer.subscription.created", "customer.subscription.updated"):
+            await run_webhook_handler(
+                handle_subscription_updated, event_object, db, event_created=event.get("created")
+            )
 
         elif event_type == "customer.subscription.deleted":
-            handle_subscription_deleted(event_object, db)
+            await run_webhook_handler(handle_subscription_deleted, event_object, db)
 
         elif event_type == "invoice.payment_failed":
-            handle_invoice_payment_failed(event_object, db)
+            await run_webhook_handler(handle_invoice_payment_failed, event_object, db)
 
         else:
             logger.info(f"Unhandled event type: {event_type}")
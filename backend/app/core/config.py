@@ -41,6 +41,14 @@ class Settings(BaseSettings):
             return v.replace("postgres://", "postgresql://", 1)
         return v
 
+    # Connection pool (ignored for SQLite). Sized for the scheduler and
+    # distribution thread pools plus concurrent SSE polls.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Compiled SQL statements cached per engine (SQLAlchemy default: 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+
     redis_url: str = "redis://localhost:6379/0"
 
     llm_provider: str = "gemini"
@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.core.config import settings
@@ -10,15 +11,31 @@ class Base(DeclarativeBase):
 
 # Configure engine based on database type
 connect_args = {}
+engine_kwargs = {}
 if settings.database_url.startswith("sqlite"):
     # SQLite: enable WAL mode for better concurrent access
     connect_args = {"check_same_thread": False}
+else:
+    # One process-wide pool reused by every session (API requests, SSE polls,
+    # worker threads); recycle before server-side idle timeouts drop sockets
+    engine_kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    if make_url(settings.database_url).drivername in ("postgresql", "postgresql+psycopg2"):
+        # psycopg2: batch executemany UPDATE/DELETE (lead score writes) into
+        # paged statements too, not only INSERTs
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
 
 engine = create_engine(
     settings.database_url,
     future=True,
     connect_args=connect_args,
     pool_pre_ping=True,  # Check connection health before use
+    # Room for every distinct statement shape, so repeats skip SQL compilation
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **engine_kwargs,
 )
 
 # Enable WAL mode for SQLite (better concurrent read/write)
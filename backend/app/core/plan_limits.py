@@ -9,7 +9,7 @@ Defines the resource limits for each subscription tier:
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Set
 from app.models.tables import SubscriptionTier
 
 
@@ -24,6 +24,9 @@ class PlanLimits:
     max_auto_suggestions: int  # Max suggestions auto-generated per poll (rest on-demand)
     plan_name: str  # Display name
     next_tier: Optional[str] = None  # Tier to upgrade to
+    # Keyword prefilter: posts sharing fewer words with the business description
+    # skip the LLM, unless they are among a subreddit's top PREFILTER_TOP_K
+    min_keyword_overlap: int = 1
 
 
 # Plan limits configuration
@@ -137,13 +140,17 @@ PLAN_LIMITS = {
 }
 
 
-def is_admin_user(user_id: int) -> bool:
-    """Check if user is an admin (bypasses all subscription limits)"""
+def get_admin_user_ids() -> Set[int]:
+    """Parse the configured admin user IDs"""
     from app.core.config import settings
     if not settings.ADMIN_USER_IDS:
-        return False
-    admin_ids = {int(x.strip()) for x in settings.ADMIN_USER_IDS.split(",") if x.strip()}
-    return user_id in admin_ids
+        return set()
+    return {int(x.strip()) for x in settings.ADMIN_USER_IDS.split(",") if x.strip()}
+
+
+def is_admin_user(user_id: int) -> bool:
+    """Check if user is an admin (bypasses all subscription limits)"""
+    return user_id in get_admin_user_ids()
 
 
 def get_plan_limits(tier: SubscriptionTier, user_id: Optional[int] = None) -> PlanLimits:
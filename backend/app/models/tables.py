@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, DateTime, Enum, Float, ForeignKey, Boolean, UniqueConstraint
+from sqlalchemy import String, Text, DateTime, Enum, Float, ForeignKey, Boolean, UniqueConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db import Base
@@ -52,6 +52,14 @@ class SubscriptionTier(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Expiry filters in the scheduled-polling scan (run_scheduled_polls)
+        Index(
+            'ix_users_trial_ends_at_free_trial', 'trial_ends_at',
+            postgresql_where=text("subscription_tier = 'FREE_TRIAL'"),
+        ),
+        Index('ix_users_subscription_ends_at', 'subscription_ends_at'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(256), unique=True, index=True)
@@ -362,6 +370,11 @@ class UsageTracking(Base):
     __tablename__ = "usage_tracking"
     __table_args__ = (
         UniqueConstraint('user_id', 'api_type', 'date', name='uq_user_api_date'),
+        # Covering index for the admin aggregation in get_all_users_usage (Postgres INCLUDE)
+        Index(
+            'ix_usage_covering', 'date', 'user_id',
+            postgresql_include=['call_count', 'input_tokens', 'output_tokens'],
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -396,6 +409,10 @@ class GlobalSubredditPoll(Base):
     poll_count: Mapped[int] = mapped_column(default=0)
     total_posts_found: Mapped[int] = mapped_column(default=0)
 
+    # Adaptive cadence: EWMA of new posts per hour and when the subreddit is next due
+    avg_posts_per_hour: Mapped[float] = mapped_column(Float, default=0)
+    next_poll_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
 
 class SubredditCache(Base):
     """
@@ -2,8 +2,11 @@
 Apify Reddit Providers
 使用 Apify actors 替代 PRAW 进行 Reddit 数据抓取
 """
+import asyncio
 import logging
+import threading
 import time
+import weakref
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -14,6 +17,9 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the shared sync and async clients (Apify + dataset fetches)
+CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
 
 class ApifyRedditProvider:
     """
@@ -29,6 +35,43 @@ class ApifyRedditProvider:
         self.base_url = "https://api.apify.com/v2"
         self.community_search_actor = settings.apify_reddit_community_search_actor
         self.reddit_scraper_actor = settings.apify_reddit_scraper_actor
+        self._client: Optional[httpx.Client] = None
+        # 每个 event loop 一个 AsyncClient；loop 被回收时条目自动消失
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._clients_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """返回共享的 httpx.Client（provider 是单例，连接在多次调用间复用）"""
+        with self._clients_lock:
+            if self._client is None:
+                self._client = httpx.Client(limits=CLIENT_LIMITS)
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        返回当前 event loop 的 httpx.AsyncClient（同一 loop 上的多次 poll 复用连接池）
+
+        AsyncClient 绑定创建时的 event loop；provider 是进程级单例，而 scheduler /
+        distribution 的每个工作线程各有自己的 loop（见 run_poll_sync），
+        所以按 loop 分别保存 client。
+        """
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(limits=CLIENT_LIMITS)
+                self._async_clients[loop] = client
+        return client
+
+    async def aclose_async_client(self) -> None:
+        """关闭当前 event loop 的 AsyncClient（loop 关闭前调用）"""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
         
     def _call_actor(
         self, 
@@ -51,65 +94,127 @@ class ApifyRedditProvider:
             # 启动 actor
             url = f"{self.base_url}/acts/{actor_id}/runs?token={self.api_token}"
             
-            with httpx.Client(timeout=timeout) as client:
-                logger.info(f"Starting Apify actor {actor_id}")
-                response = client.post(url, json=run_input)
-                response.raise_for_status()
-                
-                run_data = response.json()
-                run_id = run_data["data"]["id"]
-                default_dataset_id = run_data["data"]["defaultDatasetId"]
+            client = self._get_client()
+            logger.info(f"Starting Apify actor {actor_id}")
+            response = client.post(url, json=run_input, timeout=timeout)
+            response.raise_for_status()
+            
+            run_data = response.json()
+            run_id = run_data["data"]["id"]
+            default_dataset_id = run_data["data"]["defaultDatasetId"]
+            
+            logger.info(f"Actor run started: {run_id}")
+            
+            # 等待运行完成
+            status_url = f"{self.base_url}/acts/{actor_id}/runs/{run_id}?token={self.api_token}"
+            
+            max_attempts = timeout // 5  # 每 5 秒检查一次
+            for attempt in range(max_attempts):
+                time.sleep(5)
                 
-                logger.info(f"Actor run started: {run_id}")
+                status_response = client.get(status_url, timeout=timeout)
+                status_response.raise_for_status()
+                status_data = status_response.json()
                 
-                # 等待运行完成
-                status_url = f"{self.base_url}/acts/{actor_id}/runs/{run_id}?token={self.api_token}"
+                status = status_data["data"]["status"]
+                logger.info(f"Actor status: {status} (attempt {attempt + 1}/{max_attempts})")
                 
-                max_attempts = timeout // 5  # 每 5 秒检查一次
-                for attempt in range(max_attempts):
-                    time.sleep(5)
+                if status == "SUCCEEDED":
+                    # 获取结果
+                    dataset_url = f"{self.base_url}/datasets/{default_dataset_id}/items?token={self.api_token}"
+                    dataset_response = client.get(dataset_url, timeout=timeout)
+                    dataset_response.raise_for_status()
                     
-                    status_response = client.get(status_url)
-                    status_response.raise_for_status()
-                    status_data = status_response.json()
+                    results = dataset_response.json()
+                    logger.info(f"Actor completed successfully, returned {len(results)} items")
                     
-                    status = status_data["data"]["status"]
-                    logger.info(f"Actor status: {status} (attempt {attempt + 1}/{max_attempts})")
-                    
-                    if status == "SUCCEEDED":
-                        # 获取结果
-                        dataset_url = f"{self.base_url}/datasets/{default_dataset_id}/items?token={self.api_token}"
-                        dataset_response = client.get(dataset_url)
-                        dataset_response.raise_for_status()
-                        
-                        results = dataset_response.json()
-                        logger.info(f"Actor completed successfully, returned {len(results)} items")
-                        
-                        # DEBUG: Print first 2 items to see actual field names
-                        if results and len(results) > 0:
-                            logger.info("=" * 80)
-                            logger.info("DEBUG: First item from Apify (showing all fields):")
-                            import json
-                            logger.info(json.dumps(results[0], indent=2))
-                            if len(results) > 1:
-                                logger.info("=" * 80)
-                                logger.info("DEBUG: Second item from Apify:")
-                                logger.info(json.dumps(results[1], indent=2))
+                    # DEBUG: Print first 2 items to see actual field names
+                    if results and len(results) > 0:
+                        logger.info("=" * 80)
+                        logger.info("DEBUG: First item from Apify (showing all fields):")
+                        import json
+                        logger.info(json.dumps(results[0], indent=2))
+                        if len(results) > 1:
                             logger.info("=" * 80)
-                        
-                        return results
+                            logger.info("DEBUG: Second item from Apify:")
+                            logger.info(json.dumps(results[1], indent=2))
+                        logger.info("=" * 80)
                     
-                    elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
-                        logger.error(f"Actor run failed with status: {status}")
-                        return []
-                
-                logger.warning(f"Actor run timed out after {timeout}s")
-                return []
+                    return results
                 
+                elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
+                    logger.error(f"Actor run failed with status: {status}")
+                    return []
+            
+            logger.warning(f"Actor run timed out after {timeout}s")
+            return []
+            
         except Exception as e:
             logger.error(f"Error calling Apify actor {actor_id}: {e}")
             return []
     
+    async def _call_actor_async(
+        self,
+        actor_id: str,
+        run_input: dict,
+        timeout: int = 300
+    ) -> List[Dict[str, Any]]:
+        """
+        _call_actor 的异步版本：由 event loop 直接驱动 HTTP 请求，不占用线程池
+
+        Args:
+            actor_id: Actor ID
+            run_input: Actor 输入参数
+            timeout: 超时时间（秒）
+
+        Returns:
+            Actor 运行结果
+        """
+        try:
+            client = self._get_async_client()
+            url = f"{self.base_url}/acts/{actor_id}/runs?token={self.api_token}"
+
+            logger.info(f"Starting Apify actor {actor_id}")
+            response = await client.post(url, json=run_input, timeout=timeout)
+            response.raise_for_status()
+
+            run_data = response.json()
+            run_id = run_data["data"]["id"]
+            default_dataset_id = run_data["data"]["defaultDatasetId"]
+
+            logger.info(f"Actor run started: {run_id}")
+
+            status_url = f"{self.base_url}/acts/{actor_id}/runs/{run_id}?token={self.api_token}"
+
+            max_attempts = timeout // 5  # 每 5 秒检查一次
+            for attempt in range(max_attempts):
+                await asyncio.sleep(5)
+
+                status_response = await client.get(status_url, timeout=timeout)
+                status_response.raise_for_status()
+                status = status_response.json()["data"]["status"]
+                logger.info(f"Actor status: {status} (attempt {attempt + 1}/{max_attempts})")
+
+                if status == "SUCCEEDED":
+                    dataset_url = f"{self.base_url}/datasets/{default_dataset_id}/items?token={self.api_token}"
+                    dataset_response = await client.get(dataset_url, timeout=timeout)
+                    dataset_response.raise_for_status()
+
+                    results = dataset_response.json()
+                    logger.info(f"Actor completed successfully, returned {len(results)} items")
+                    return results
+
+                elif status in ["FAILED", "ABORTED", "TIMED-OUT"]:
+                    logger.error(f"Actor run failed with status: {status}")
+                    return []
+
+            logger.warning(f"Actor run timed out after {timeout}s")
+            return []
+
+        except Exception as e:
+            logger.error(f"Error calling Apify actor {actor_id}: {e}")
+            return []
+
     def search_communities(
         self, 
         search_queries: List[str],  # 改为支持多个关键词
@@ -203,7 +308,36 @@ class ApifyRedditProvider:
             - subreddit_name: Subreddit 名称
         """
         logger.info(f"Scraping r/{subreddit_name} (sort={sort}, limit={max_posts}, time={time_filter})")
-        
+        run_input = self._build_scrape_input(subreddit_name, max_posts, sort, time_filter)
+        results = self._call_actor(self.reddit_scraper_actor, run_input)
+        return self._normalize_scraped_posts(results, subreddit_name)
+
+    async def scrape_subreddit_async(
+        self,
+        subreddit_name: str,
+        max_posts: int = 100,
+        sort: str = "new",
+        time_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        scrape_subreddit 的异步版本（参数与返回格式相同）
+
+        通过共享的 httpx.AsyncClient 调用 Apify，event loop 直接驱动请求，
+        不再需要 asyncio.to_thread 包装。
+        """
+        logger.info(f"Scraping r/{subreddit_name} (sort={sort}, limit={max_posts}, time={time_filter})")
+        run_input = self._build_scrape_input(subreddit_name, max_posts, sort, time_filter)
+        results = await self._call_actor_async(self.reddit_scraper_actor, run_input)
+        return self._normalize_scraped_posts(results, subreddit_name)
+
+    def _build_scrape_input(
+        self,
+        subreddit_name: str,
+        max_posts: int,
+        sort: str,
+        time_filter: Optional[str]
+    ) -> Dict[str, Any]:
+        """构建 Reddit Scraper actor 的输入参数"""
         # 构建 Reddit URL
         base_url = f"https://www.reddit.com/r/{subreddit_name}/"
         
@@ -230,9 +364,14 @@ class ApifyRedditProvider:
         }
         
         logger.info(f"Apify config: startUrl={base_url}, withinCommunity={subreddit_name}, sort={sort}, time={time_filter}")
-        
-        results = self._call_actor(self.reddit_scraper_actor, run_input)
-        
+        return run_input
+
+    def _normalize_scraped_posts(
+        self,
+        results: List[Dict[str, Any]],
+        subreddit_name: str
+    ) -> List[Dict[str, Any]]:
+        """将 Reddit Scraper actor 的原始结果转换为统一的帖子格式"""
         # 标准化输出格式
         posts = []
         for idx, item in enumerate(results):
@@ -3,7 +3,7 @@ Reddit Provider Factory
 根据配置选择使用 Apify 或 RapidAPI
 """
 import logging
-from typing import Union
+from typing import Dict, Union
 
 from app.core.config import settings
 from app.providers.reddit.apify import ApifyRedditProvider
@@ -16,10 +16,13 @@ logger = logging.getLogger(__name__)
 # Type alias for Reddit providers
 RedditProvider = Union[ApifyRedditProvider, RapidAPIRedditProvider]
 
+# 每种 provider 一个进程级实例，复用其 HTTP 连接池
+_providers: Dict[str, RedditProvider] = {}
+
 
 def get_reddit_provider() -> RedditProvider:
     """
-    根据配置返回对应的 Reddit Provider
+    根据配置返回对应的 Reddit Provider（进程内单例）
 
     配置项: REDDIT_API_PROVIDER
     - "official" 或 "apify": 使用 Apify (默认)
@@ -28,12 +31,22 @@ def get_reddit_provider() -> RedditProvider:
     Returns:
         ApifyRedditProvider 或 RapidAPIRedditProvider 实例
     """
-    provider_type = settings.reddit_api_provider.lower()
-
-    if provider_type == "rapidapi":
-        logger.info("Using RapidAPI Reddit Provider")
-        return RapidAPIRedditProvider()
-    else:
-        # 默认使用 Apify (包括 "official" 和 "apify")
-        logger.info("Using Apify Reddit Provider")
-        return ApifyRedditProvider()
+    provider_type = "rapidapi" if settings.reddit_api_provider.lower() == "rapidapi" else "apify"
+
+    provider = _providers.get(provider_type)
+    if provider is None:
+        if provider_type == "rapidapi":
+            logger.info("Using RapidAPI Reddit Provider")
+            provider = RapidAPIRedditProvider()
+        else:
+            # 默认使用 Apify (包括 "official" 和 "apify")
+            logger.info("Using Apify Reddit Provider")
+            provider = ApifyRedditProvider()
+        _providers[provider_type] = provider
+    return provider
+
+
+async def aclose_provider_clients() -> None:
+    """关闭所有已创建 provider 在当前 event loop 上的 AsyncClient（loop 关闭前调用）"""
+    for provider in list(_providers.values()):
+        await provider.aclose_async_client()
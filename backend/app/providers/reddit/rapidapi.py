@@ -2,7 +2,10 @@
 RapidAPI Reddit Provider
 Plan B: 使用 RapidAPI 替代 Apify 进行 Reddit 数据抓取
 """
+import asyncio
 import logging
+import threading
+import weakref
 from typing import List, Dict, Any, Optional
 
 import httpx
@@ -12,6 +15,9 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the shared sync and async clients
+CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
 
 class RapidAPIRedditProvider:
     """
@@ -25,6 +31,43 @@ class RapidAPIRedditProvider:
         self.api_key = settings.rapidapi_key
         self.host = settings.rapidapi_reddit_host
         self.base_url = f"https://{self.host}"
+        self._client: Optional[httpx.Client] = None
+        # 每个 event loop 一个 AsyncClient；loop 被回收时条目自动消失
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._clients_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """返回共享的 httpx.Client（provider 是单例，连接在多次调用间复用）"""
+        with self._clients_lock:
+            if self._client is None:
+                self._client = httpx.Client(limits=CLIENT_LIMITS)
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        返回当前 event loop 的 httpx.AsyncClient（同一 loop 上的多次 poll 复用连接池）
+
+        AsyncClient 绑定创建时的 event loop；provider 是进程级单例，而 scheduler /
+        distribution 的每个工作线程各有自己的 loop（见 run_poll_sync），
+        所以按 loop 分别保存 client。
+        """
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(limits=CLIENT_LIMITS)
+                self._async_clients[loop] = client
+        return client
+
+    async def aclose_async_client(self) -> None:
+        """关闭当前 event loop 的 AsyncClient（loop 关闭前调用）"""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
 
     def _make_request(
         self,
@@ -55,14 +98,59 @@ class RapidAPIRedditProvider:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            with httpx.Client(timeout=timeout) as client:
-                logger.info(f"RapidAPI request: {endpoint} with params: {params}")
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
+            client = self._get_client()
+            logger.info(f"RapidAPI request: {endpoint} with params: {params}")
+            response = client.get(url, headers=headers, params=params, timeout=timeout)
+            response.raise_for_status()
 
-                data = response.json()
-                logger.info(f"RapidAPI response status: {data.get('status', 'unknown')}")
-                return data
+            data = response.json()
+            logger.info(f"RapidAPI response status: {data.get('status', 'unknown')}")
+            return data
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"RapidAPI HTTP error: {e.response.status_code} - {e.response.text}")
+            return {"status": "error", "body": {}}
+        except Exception as e:
+            logger.error(f"RapidAPI request error: {e}")
+            return {"status": "error", "body": {}}
+
+    async def _make_request_async(
+        self,
+        endpoint: str,
+        params: dict,
+        timeout: int = 30
+    ) -> Dict[str, Any]:
+        """
+        _make_request 的异步版本，使用共享的 httpx.AsyncClient
+
+        Args:
+            endpoint: API endpoint (e.g., "/subreddit_new")
+            params: Query parameters
+            timeout: 超时时间（秒）
+
+        Returns:
+            API 响应 JSON
+        """
+        if not self.api_key or not self.host:
+            logger.error("RapidAPI credentials not configured")
+            return {"status": "error", "body": {}}
+
+        headers = {
+            "x-rapidapi-host": self.host,
+            "x-rapidapi-key": self.api_key,
+        }
+
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            client = self._get_async_client()
+            logger.info(f"RapidAPI request: {endpoint} with params: {params}")
+            response = await client.get(url, headers=headers, params=params, timeout=timeout)
+            response.raise_for_status()
+
+            data = response.json()
+            logger.info(f"RapidAPI response status: {data.get('status', 'unknown')}")
+            return data
 
         except httpx.HTTPStatusError as e:
             logger.error(f"RapidAPI HTTP error: {e.response.status_code} - {e.response.text}")
@@ -197,54 +285,98 @@ class RapidAPIRedditProvider:
                 params["after"] = after
 
             response = self._make_request("/subreddit_new", params)
-
-            if response.get("status") != "success":
-                logger.warning(f"RapidAPI scrape failed for r/{subreddit_name}")
+            after = self._collect_page(response, subreddit_name, posts, max_posts)
+            if not after:
                 break
 
-            body = response.get("body", {})
-            data = body.get("data", {})
-            children = data.get("children", [])
+        logger.info(f"RapidAPI: Scraped {len(posts)} posts from r/{subreddit_name}")
+        return posts
 
-            if not children:
-                logger.info(f"No more posts for r/{subreddit_name}")
-                break
+    async def scrape_subreddit_async(
+        self,
+        subreddit_name: str,
+        max_posts: int = 100,
+        sort: str = "new",
+        time_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        scrape_subreddit 的异步版本（参数与返回格式相同）
 
-            for item in children:
-                if item.get("kind") != "t3":  # t3 = post
-                    continue
+        分页请求由 event loop 直接驱动，不再需要 asyncio.to_thread 包装。
+        """
+        logger.info(f"RapidAPI: Scraping r/{subreddit_name} (max_posts={max_posts})")
 
-                post_data = item.get("data", {})
+        posts = []
+        after = None  # 分页游标
 
-                # 跳过 NSFW
-                if post_data.get("over_18", False):
-                    continue
+        while len(posts) < max_posts:
+            params = {"subreddit": subreddit_name}
+            if after:
+                params["after"] = after
 
-                post = {
-                    "id": post_data.get("id", ""),
-                    "title": post_data.get("title", ""),
-                    "content": post_data.get("selftext", ""),
-                    "author": post_data.get("author", "[deleted]"),
-                    "score": post_data.get("score", 0) or post_data.get("ups", 0),
-                    "num_comments": post_data.get("num_comments", 0),
-                    "created_utc": post_data.get("created_utc"),
-                    "url": f"https://reddit.com{post_data.get('permalink', '')}",
-                    "subreddit_name": subreddit_name,
-                    "flair": post_data.get("link_flair_text", ""),
-                }
-                posts.append(post)
-
-                if len(posts) >= max_posts:
-                    break
-
-            # 获取下一页游标
-            after = data.get("after")
+            response = await self._make_request_async("/subreddit_new", params)
+            after = self._collect_page(response, subreddit_name, posts, max_posts)
             if not after:
                 break
 
         logger.info(f"RapidAPI: Scraped {len(posts)} posts from r/{subreddit_name}")
         return posts
 
+    def _collect_page(
+        self,
+        response: Dict[str, Any],
+        subreddit_name: str,
+        posts: List[Dict[str, Any]],
+        max_posts: int
+    ) -> Optional[str]:
+        """
+        解析一页 /subreddit_new 响应，将帖子追加到 posts
+
+        Returns:
+            下一页游标；没有更多帖子（或请求失败）时返回 None
+        """
+        if response.get("status") != "success":
+            logger.warning(f"RapidAPI scrape failed for r/{subreddit_name}")
+            return None
+
+        body = response.get("body", {})
+        data = body.get("data", {})
+        children = data.get("children", [])
+
+        if not children:
+            logger.info(f"No more posts for r/{subreddit_name}")
+            return None
+
+        for item in children:
+            if item.get("kind") != "t3":  # t3 = post
+                continue
+
+            post_data = item.get("data", {})
+
+            # 跳过 NSFW
+            if post_data.get("over_18", False):
+                continue
+
+            post = {
+                "id": post_data.get("id", ""),
+                "title": post_data.get("title", ""),
+                "content": post_data.get("selftext", ""),
+                "author": post_data.get("author", "[deleted]"),
+                "score": post_data.get("score", 0) or post_data.get("ups", 0),
+                "num_comments": post_data.get("num_comments", 0),
+                "created_utc": post_data.get("created_utc"),
+                "url": f"https://reddit.com{post_data.get('permalink', '')}",
+                "subreddit_name": subreddit_name,
+                "flair": post_data.get("link_flair_text", ""),
+            }
+            posts.append(post)
+
+            if len(posts) >= max_posts:
+                break
+
+        # 获取下一页游标
+        return data.get("after")
+
     def scrape_multiple_subreddits(
         self,
         subreddit_names: List[str],
@@ -8,6 +8,16 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive pool for OpenAI calls (reused across client instances)
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(limits=httpx.Limits(max_connections=32, max_keepalive_connections=32))
+    return _http_client
+
 
 class OpenAIClient:
     def __init__(self):
@@ -24,7 +34,7 @@ class OpenAIClient:
             "messages": messages,
             "temperature": temperature,
         }
-        response = httpx.post(
+        response = _get_http_client().post(
             f"{self.base_url}/chat/completions",
             headers=self._headers(),
             json=payload,
@@ -44,7 +54,7 @@ class OpenAIClient:
             "input": texts,
             "dimensions": settings.openai_embedding_dimensions,
         }
-        response = httpx.post(
+        response = _get_http_client().post(
             f"{self.base_url}/embeddings",
             headers=self._headers(),
             json=payload,
@@ -95,9 +105,6 @@ class GeminiClient:
         return {"embeddings": [{"values": emb.values} for emb in embeddings]}
 
 
-from typing import Optional
-
-
 def get_llm_client(provider: Optional[str] = None):
     selected = (provider or settings.llm_provider).lower()
     if selected == "gemini":
@@ -7,7 +7,7 @@ Two-phase scoring for efficiency:
 """
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from functools import lru_cache
 
 from app.services.langchain.config import get_llm
@@ -271,31 +271,28 @@ class BatchScoringService:
                     "suggested_dm": ""
                 }
 
-    async def batch_quick_score(
+    async def iter_quick_score(
         self,
         posts: List[Dict[str, Any]],
         business_description: str,
-        on_progress: Optional[callable] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
         """
-        Phase 1: TRUE batch scoring - multiple posts per LLM call.
-
-        Instead of 1 LLM call per post, we batch posts together:
-        - 99 posts with batch_size=10 = ~10 LLM calls (not 99!)
-        - ~66% token savings from shared system prompt
+        Phase 1 as a stream: yield each batch's scored posts as soon as its
+        LLM call finishes (in completion order), so callers can persist
+        results while the remaining batches are still in flight.
+        LLM calls are added to llm_calls_made without resetting it, so
+        several streams can share one service.
 
         Args:
             posts: List of post dicts
             business_description: Business description for scoring
-            on_progress: Optional callback(current, total) for progress updates
 
-        Returns:
-            List of scored post dicts with relevancy_score, relevancy_reason, has_suggestions
+        Yields:
+            Scored post dicts for one batch, with relevancy_score, relevancy_reason, has_suggestions
         """
         if not posts:
-            return []
+            return
 
-        self.llm_calls_made = 0  # Reset counter
         total_posts = len(posts)
         num_batches = (total_posts + self.batch_size - 1) // self.batch_size
 
@@ -311,39 +308,68 @@ class BatchScoringService:
         ]
 
         semaphore = asyncio.Semaphore(self.max_concurrent)
-        scored_posts = []
-        posts_processed = 0
 
-        async def score_batch_with_progress(batch: List[Dict], batch_index: int):
-            nonlocal posts_processed
-            results = await self._score_batch(batch, business_description, semaphore)
-            posts_processed += len(batch)
-            if on_progress:
-                on_progress(posts_processed, total_posts)
-            return results
+        async def score_batch_safe(batch: List[Dict], batch_index: int):
+            try:
+                return await self._score_batch(batch, business_description, semaphore)
+            except Exception as e:
+                logger.error(f"Batch {batch_index} failed: {e}")
+                # Default scores for failed batch
+                return [
+                    {
+                        **post,
+                        "relevancy_score": 50,
+                        "relevancy_reason": f"Batch error: {str(e)}",
+                        "has_suggestions": False
+                    }
+                    for post in batch
+                ]
 
-        # Process batches concurrently
+        # Process batches concurrently, yielding in completion order
         tasks = [
-            score_batch_with_progress(batch, i)
+            asyncio.ensure_future(score_batch_safe(batch, i))
             for i, batch in enumerate(batches)
         ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave LLM calls running
+            for task in tasks:
+                task.cancel()
 
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def batch_quick_score(
+        self,
+        posts: List[Dict[str, Any]],
+        business_description: str,
+        on_progress: Optional[callable] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Phase 1: TRUE batch scoring - multiple posts per LLM call.
 
-        # Flatten results
-        for batch_index, result in enumerate(batch_results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch {batch_index} failed: {result}")
-                # Add default scores for failed batch
-                for post in batches[batch_index]:
-                    scored_posts.append({
-                        **post,
-                        "relevancy_score": 50,
-                        "relevancy_reason": f"Batch error: {str(result)}",
-                        "has_suggestions": False
-                    })
-            else:
-                scored_posts.extend(result)
+        Instead of 1 LLM call per post, we batch posts together:
+        - 99 posts with batch_size=10 = ~10 LLM calls (not 99!)
+        - ~66% token savings from shared system prompt
+
+        Args:
+            posts: List of post dicts
+            business_description: Business description for scoring
+            on_progress: Optional callback(current, total) for progress updates
+
+        Returns:
+            List of scored post dicts with relevancy_score, relevancy_reason, has_suggestions
+        """
+        if not posts:
+            return []
+
+        self.llm_calls_made = 0  # Reset counter
+        total_posts = len(posts)
+        scored_posts = []
+
+        async for scored_batch in self.iter_quick_score(posts, business_description):
+            scored_posts.extend(scored_batch)
+            if on_progress:
+                on_progress(len(scored_posts), total_posts)
 
         logger.info(
             f"Batch scoring complete: {len(scored_posts)} posts scored "
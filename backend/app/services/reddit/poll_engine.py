@@ -5,10 +5,11 @@ Single source of truth for the polling pipeline used by both
 frontend (SSE streaming) and backend (scheduler) paths.
 
 Per-subreddit pipeline:
-  For each subreddit:
-    1. Fetch posts
+  Subreddits are fetched concurrently (bounded) and handed over through a
+  small queue; each one is processed as soon as it arrives:
+    1. Fetch posts (keyword-prefiltered in large batches)
     2. Save to DB (score=NULL)
-    3. Batch score
+    3. Batch score (subreddits overlap)
     4. Cleanup low-score leads
     5. Emit surviving leads immediately
   After all subreddits:
@@ -16,12 +17,21 @@ Per-subreddit pipeline:
     7. Finalize + send email
 """
 import asyncio
+import concurrent.futures
 import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, case, delete, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.tables import (
     RedditCampaign,
@@ -35,12 +45,12 @@ from app.models.tables import (
     APIType,
     SubscriptionTier,
 )
-from app.providers.reddit.factory import get_reddit_provider
+from app.providers.reddit.factory import aclose_provider_clients, get_reddit_provider
 from app.services.reddit.batch_scoring import BatchScoringService, AUTO_SUGGESTION_THRESHOLD
 from app.core.email import send_poll_summary_email
-from app.services.usage_tracking import track_api_call
+from app.services.usage_tracking import track_api_calls_bulk
 from app.core.config import settings
-from app.core.plan_limits import get_plan_limits, is_admin_user
+from app.core.plan_limits import PlanLimits, get_plan_limits, is_admin_user
 
 
 logger = logging.getLogger(__name__)
@@ -48,6 +58,60 @@ logger = logging.getLogger(__name__)
 # Configuration
 DEFAULT_POSTS_PER_SUBREDDIT = 20
 MIN_RELEVANCY_SCORE = 50
+MAX_CONCURRENT_FETCHES = 4
+FETCH_QUEUE_SIZE = 4
+# Subreddits whose leads are scored at the same time (each runs its own
+# LLM batches, bounded by BatchScoringService.max_concurrent)
+MAX_CONCURRENT_SCORING = 3
+# Keyword prefilter: a subreddit's best-overlapping posts always reach the LLM
+PREFILTER_TOP_K = 30
+PREFILTER_STOP_WORDS = frozenset({
+    "i", "we", "our", "us", "the", "a", "an", "for", "to", "of", "in",
+    "on", "at", "by", "with", "from", "is", "are", "am", "and", "or",
+    "that", "this", "your", "you", "have", "will", "their", "they",
+})
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Posts whose token sets are memoized across campaign polls in this process
+POST_TOKEN_CACHE_SIZE = 4096
+
+# Process-wide cache of recent subreddit fetches, shared by every campaign
+# polled in this worker: {(subreddit, sort, time_filter, max_posts): (fetched_at, posts)}
+FETCH_CACHE_TTL_SECONDS = 120
+FETCH_CACHE_MAX_STALE_SECONDS = 900
+FETCH_CACHE_MAX_ENTRIES = 512
+_fetch_cache: Dict[tuple, tuple[float, List[Dict[str, Any]]]] = {}
+# Guards _fetch_cache writes and eviction; poll threads share the dict
+_fetch_cache_lock = threading.Lock()
+# Scrapes in progress, keyed like _fetch_cache; thread-safe futures because
+# concurrent polls run in separate threads with separate event loops
+_inflight_fetches: Dict[tuple, concurrent.futures.Future] = {}
+_inflight_fetches_lock = threading.Lock()
+
+# Redis set of post ids a campaign has already saved and scored. Low-score
+# leads are deleted after scoring, so without it the same posts would be
+# re-inserted and re-scored by every poll while they stay in the 24h fetch
+# window; the TTL outlives that window.
+PROCESSED_POST_IDS_TTL_SECONDS = 26 * 3600
+
+# Per-lead write statements, built once and executed as executemany batches
+# so the compiled form (and the server-side plan) is reused across rows.
+INSERT_LEAD = insert(RedditLead).returning(RedditLead.id, RedditLead.reddit_post_id)
+INSERT_LEAD_SKIP_DUPLICATES = {
+    "postgresql": pg_insert(RedditLead)
+    .on_conflict_do_nothing(index_elements=["campaign_id", "reddit_post_id"])
+    .returning(RedditLead.id, RedditLead.reddit_post_id),
+    "sqlite": sqlite_insert(RedditLead)
+    .on_conflict_do_nothing(index_elements=["campaign_id", "reddit_post_id"])
+    .returning(RedditLead.id, RedditLead.reddit_post_id),
+}
+UPDATE_LEAD_SCORE = (
+    update(RedditLead)
+    .where(RedditLead.id == bindparam("b_id"))
+    .values(
+        relevancy_score=bindparam("b_score"),
+        relevancy_reason=bindparam("b_reason"),
+    )
+)
 
 
 class PollEngineCallbacks:
@@ -83,27 +147,45 @@ class PollEngine:
         campaign_id: int,
         trigger: str = "manual",
         callbacks: Optional[PollEngineCallbacks] = None,
+        prefetched_posts: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        bypass_cache: bool = False,
     ) -> PollJob:
         """
         Execute the full polling pipeline for a campaign.
         Processes each subreddit independently: fetch → save → score → cleanup → emit.
         Leads appear on the frontend immediately after each subreddit is processed.
+
+        prefetched_posts: posts the caller already scraped, keyed by subreddit
+        name (centralized polling). When given, only those subreddits are
+        processed and the provider is not called.
+
+        bypass_cache: skip the shared fetch cache (manual "Run Now" polls).
         """
         if callbacks is None:
             callbacks = PollEngineCallbacks()
 
+        # Poll start time, reused for validation and per-subreddit poll records
+        now = datetime.utcnow()
+
         # --- Validate campaign ---
-        campaign = db.get(RedditCampaign, campaign_id)
-        if not campaign:
+        # Campaign and owner come back in one joined query, with the
+        # subreddits eager-loaded alongside instead of lazily later
+        row = db.execute(
+            select(RedditCampaign, User)
+            .outerjoin(User, User.id == RedditCampaign.user_id)
+            .options(selectinload(RedditCampaign.subreddits))
+            .where(RedditCampaign.id == campaign_id)
+        ).first()
+        if not row:
             await callbacks.on_error(f"Campaign {campaign_id} not found")
             raise ValueError(f"Campaign {campaign_id} not found")
+        campaign, user = row
 
         if campaign.status != RedditCampaignStatus.ACTIVE:
             await callbacks.on_error(f"Campaign is not active (status: {campaign.status})")
             raise ValueError(f"Campaign {campaign_id} is not active (status: {campaign.status})")
 
         # --- Validate user ---
-        user = db.get(User, campaign.user_id)
         if not user:
             await callbacks.on_error(f"User {campaign.user_id} not found")
             raise ValueError(f"User {campaign.user_id} not found")
@@ -123,7 +205,6 @@ class PollEngine:
                 raise ValueError(f"User {user.id} subscription has expired")
 
             # Check if subscription/trial has actually expired by date
-            now = datetime.utcnow()
             if (user.subscription_tier == SubscriptionTier.FREE_TRIAL
                     and user.trial_ends_at and user.trial_ends_at < now):
                 await callbacks.on_error(f"User {user.id} free trial has ended")
@@ -135,6 +216,10 @@ class PollEngine:
                 raise ValueError(f"User {user.id} subscription has ended")
 
         active_subreddits = [sub for sub in campaign.subreddits if sub.is_active]
+        if prefetched_posts is not None:
+            active_subreddits = [
+                sub for sub in active_subreddits if sub.subreddit_name in prefetched_posts
+            ]
         if not active_subreddits:
             await callbacks.on_error("No active subreddits in this campaign")
             raise ValueError("No active subreddits in this campaign")
@@ -149,6 +234,11 @@ class PollEngine:
         db.commit()
         db.refresh(poll_job)
 
+        # API usage is buffered per type and written once in the finally below
+        api_call_counts: Dict[APIType, int] = defaultdict(int)
+        fetch_tasks: List[asyncio.Task] = []
+        score_tasks: List[asyncio.Task] = []
+
         try:
             # --- Setup ---
             plan_limits = get_plan_limits(user.subscription_tier, user_id=user.id)
@@ -168,20 +258,24 @@ class PollEngine:
                 else APIType.REDDIT_APIFY
             )
 
-            # Dedup set: existing posts in this campaign
-            existing_post_ids = set(
-                row[0] for row in db.execute(
-                    select(RedditLead.reddit_post_id).where(
-                        RedditLead.campaign_id == campaign.id
-                    )
-                ).fetchall()
+            # Words of the business description for the keyword prefilter
+            business_tokens = _tokenize(campaign.business_description or "")
+            min_keyword_overlap = (
+                plan_limits.min_keyword_overlap if plan_limits else 1
             )
 
+            # Posts already taken by an earlier subreddit in this poll (cross-posts)
+            # or processed by a recent poll; any other existing leads are
+            # skipped by the ON CONFLICT insert
+            seen_post_ids: set = _load_processed_post_ids(campaign.id)
+
             total_posts_fetched = 0
             total_leads_created = 0
             total_leads_deleted = 0
             total_posts_scored = 0
+            high_score_posts: List[Dict[str, Any]] = []
             subreddit_post_counts: Dict[str, int] = {}
+            poll_record_counts: Dict[str, int] = {}
             num_subs = len(active_subreddits)
 
             await callbacks.on_progress(
@@ -191,36 +285,40 @@ class PollEngine:
 
             # ==============================================
             # Per-subreddit pipeline: fetch → save → score → cleanup → emit
+            # Fetches run ahead (bounded by the semaphore and queue size) and
+            # each subreddit's scoring runs as its own task, so LLM calls for
+            # different subreddits overlap. A scoring slot is taken before a
+            # subreddit's posts are saved, so only the subreddits being scored
+            # plus the queued fetches hold post payloads at any time.
             # ==============================================
-            for i, sub in enumerate(active_subreddits):
-                sub_name = sub.subreddit_name
-
-                # --- Fetch this subreddit ---
-                try:
-                    posts = await asyncio.to_thread(
-                        self.reddit_provider.scrape_subreddit,
-                        subreddit_name=sub_name,
-                        max_posts=posts_per_sub,
-                        sort="new",
-                        time_filter="day"
-                    )
+            fetch_queue: asyncio.Queue = asyncio.Queue(maxsize=FETCH_QUEUE_SIZE)
+            fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            scoring_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCORING)
+            llm_calls_before = 0
+            fetch_tasks.extend(
+                asyncio.create_task(self._fetch_into_queue(
+                    fetch_queue, fetch_semaphore, sub.subreddit_name, posts_per_sub,
+                    prefetched_posts.get(sub.subreddit_name) if prefetched_posts is not None else None,
+                    bypass_cache,
+                ))
+                for sub in active_subreddits
+            )
 
-                    new_posts = [p for p in posts if p.get("id") not in existing_post_ids]
-                    for p in new_posts:
-                        existing_post_ids.add(p.get("id"))
+            for i in range(num_subs):
+                sub_name, posts, fetched, fetch_error = await fetch_queue.get()
 
-                    subreddit_post_counts[sub_name] = len(new_posts)
-                    total_posts_fetched += len(new_posts)
+                # --- Fetched subreddit ---
+                try:
+                    if fetch_error is not None:
+                        raise fetch_error
 
-                    # Track Reddit API usage
-                    track_api_call(db, campaign.user_id, reddit_api_type)
-                    await self._update_poll_record(db, sub_name, len(posts))
+                    unseen_posts = self._unseen_posts(posts, seen_post_ids)
 
-                    await callbacks.on_progress(
-                        phase="fetching", current=i + 1, total=num_subs,
-                        subreddit=sub_name, posts_found=len(new_posts),
-                        message=f"Fetched {len(new_posts)} new posts from r/{sub_name}"
-                    )
+                    # Track Reddit API usage (flushed once when the poll ends);
+                    # cached/prefetched posts were already counted by whoever scraped them
+                    if fetched:
+                        api_call_counts[reddit_api_type] += 1
+                        poll_record_counts[sub_name] = poll_record_counts.get(sub_name, 0) + len(posts)
 
                 except Exception as e:
                     logger.error(f"Error fetching r/{sub_name}: {e}")
@@ -231,45 +329,69 @@ class PollEngine:
                     )
                     continue
 
-                if not new_posts:
-                    continue
+                # --- Keyword prefilter: only plausible posts reach the LLM ---
+                candidates = _keyword_prefilter(unseen_posts, business_tokens, min_keyword_overlap)
+
+                # Back-pressure: wait for a scoring slot; the scoring task
+                # releases it (or it is released right here if nothing is new)
+                await scoring_semaphore.acquire()
 
                 # --- Save unscored leads for this subreddit ---
-                sub_leads = self._save_unscored_leads(db, campaign.id, poll_job.id, new_posts)
+                # ON CONFLICT DO NOTHING skips posts the campaign already has a
+                # lead for; only the returned (new) rows go on to scoring
+                lead_ids = self._save_unscored_leads(db, campaign.id, poll_job.id, candidates)
+                new_posts = [p for p in candidates if p.get("id") in lead_ids]
 
-                if not sub_leads:
-                    continue
+                subreddit_post_counts[sub_name] = len(new_posts)
+                total_posts_fetched += len(new_posts)
 
-                # --- Score this subreddit's leads ---
                 await callbacks.on_progress(
-                    phase="scoring", current=i + 1, total=num_subs,
-                    subreddit=sub_name,
-                    message=f"Scoring {len(sub_leads)} posts from r/{sub_name}..."
+                    phase="fetching", current=i + 1, total=num_subs,
+                    subreddit=sub_name, posts_found=len(new_posts),
+                    message=f"Fetched {len(new_posts)} new posts from r/{sub_name}"
                 )
-                scored_count = await self._batch_score_leads(
-                    db, campaign, sub_leads, callbacks
-                )
-                total_posts_scored += scored_count
 
-                # --- Cleanup low-score leads from this batch ---
-                kept, deleted = self._cleanup_subreddit_leads(db, sub_leads)
+                if not lead_ids:
+                    scoring_semaphore.release()
+                    continue
+
+                _remember_processed_post_ids(campaign.id, lead_ids.keys())
+
+                # The scorer's LLM call counter is shared by the scoring tasks,
+                # so usage is taken as one delta over all of them
+                if not score_tasks:
+                    llm_calls_before = self.scoring_service.get_llm_calls_made()
+                score_tasks.append(asyncio.create_task(self._score_subreddit_leads(
+                    db, campaign, new_posts, lead_ids, callbacks, scoring_semaphore,
+                    current=i + 1, total=num_subs, subreddit=sub_name,
+                )))
+
+            for scored_count, sub_high_score_posts, kept, deleted in await asyncio.gather(*score_tasks):
+                total_posts_scored += scored_count
+                high_score_posts.extend(sub_high_score_posts)
                 total_leads_created += kept
                 total_leads_deleted += deleted
 
-                # --- Emit surviving leads immediately ---
-                for lead in sub_leads:
-                    if lead.relevancy_score is not None and lead.relevancy_score >= MIN_RELEVANCY_SCORE:
-                        await callbacks.on_lead_created(lead)
-
-                logger.info(
-                    f"r/{sub_name}: {kept} leads kept, {deleted} deleted "
-                    f"from {len(new_posts)} posts"
+            # Track LLM usage
+            llm_calls = (
+                self.scoring_service.get_llm_calls_made() - llm_calls_before
+                if score_tasks else 0
+            )
+            if llm_calls > 0:
+                llm_type = (
+                    APIType.LLM_GEMINI
+                    if settings.llm_provider.lower() == "gemini"
+                    else APIType.LLM_OPENAI
                 )
+                api_call_counts[llm_type] += llm_calls
+                logger.info(f"Tracked {llm_calls} LLM calls for batch scoring")
 
             # ==============================================
             # Post-loop: update stats, suggestions, finalize
             # ==============================================
 
+            self._upsert_poll_records(db, poll_record_counts, polled_at=now)
+
             if total_posts_fetched == 0:
                 poll_job.status = PollJobStatus.COMPLETED
                 poll_job.completed_at = datetime.utcnow()
@@ -284,46 +406,29 @@ class PollEngine:
                 await callbacks.on_complete(stats)
                 return poll_job
 
-            # Update PollJob stats
+            # Update PollJob stats; written by the finalize commit below
             poll_job.posts_fetched = total_posts_fetched
             poll_job.posts_scored = total_posts_scored
             poll_job.leads_created = total_leads_created
             poll_job.leads_deleted = total_leads_deleted
             poll_job.subreddits_polled = num_subs
-            db.commit()
 
             # --- Generate suggestions for 90+ leads ---
-            await self._generate_suggestions(db, campaign, poll_job, callbacks)
+            await self._generate_suggestions(
+                db, campaign, poll_job, high_score_posts, plan_limits, callbacks
+            )
 
             # --- Finalize job ---
+            # Stats, suggestions, job status and campaign.last_poll_at go
+            # out in one commit
+            completed_at = datetime.utcnow()
             poll_job.status = PollJobStatus.COMPLETED
-            poll_job.completed_at = datetime.utcnow()
-            campaign.last_poll_at = datetime.utcnow()
+            poll_job.completed_at = completed_at
+            campaign.last_poll_at = completed_at
             db.commit()
 
-            # --- Send email ---
-            await self._send_email(db, campaign, poll_job)
-
             # --- Complete ---
-            final_leads = db.execute(
-                select(RedditLead).where(
-                    RedditLead.poll_job_id == poll_job.id
-                )
-            ).scalars().all()
-
-            relevancy_distribution = {"90+": 0, "80-89": 0, "70-79": 0, "60-69": 0, "50-59": 0}
-            for lead in final_leads:
-                score = lead.relevancy_score or 0
-                if score >= 90:
-                    relevancy_distribution["90+"] += 1
-                elif score >= 80:
-                    relevancy_distribution["80-89"] += 1
-                elif score >= 70:
-                    relevancy_distribution["70-79"] += 1
-                elif score >= 60:
-                    relevancy_distribution["60-69"] += 1
-                else:
-                    relevancy_distribution["50-59"] += 1
+            relevancy_distribution = self._relevancy_distribution(db, poll_job.id)
 
             stats = {
                 "total_leads": poll_job.leads_created,
@@ -334,6 +439,11 @@ class PollEngine:
                 "message": f"Created {poll_job.leads_created} new leads from {poll_job.posts_fetched} posts"
             }
             await callbacks.on_complete(stats)
+
+            # --- Send email ---
+            # After on_complete, so SMTP latency doesn't hold back the
+            # client's completion event
+            await self._send_email(db, campaign, poll_job)
             return poll_job
 
         except Exception as e:
@@ -345,175 +455,412 @@ class PollEngine:
             await callbacks.on_error(str(e))
             raise
 
+        finally:
+            for task in fetch_tasks + score_tasks:
+                task.cancel()
+            track_api_calls_bulk(db, campaign.user_id, api_call_counts)
+
+    async def _fetch_into_queue(
+        self,
+        queue: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+        subreddit_name: str,
+        max_posts: int,
+        prefetched: Optional[List[Dict[str, Any]]] = None,
+        bypass_cache: bool = False,
+    ) -> None:
+        """
+        Producer: fetch one subreddit and hand (name, posts, fetched, error) to run_poll.
+
+        An entry is always queued, even if the fetch is cancelled, since
+        run_poll waits for one entry per subreddit.
+        """
+        if prefetched is not None:
+            await queue.put((subreddit_name, prefetched[:max_posts], False, None))
+            return
+        entry = (subreddit_name, [], True, None)
+        try:
+            async with semaphore:
+                posts, fetched = await self._fetch_subreddit(subreddit_name, max_posts, bypass_cache)
+            entry = (subreddit_name, posts, fetched, None)
+        except asyncio.CancelledError:
+            entry = (subreddit_name, [], True, RuntimeError(f"Fetch of r/{subreddit_name} was cancelled"))
+            raise
+        except Exception as e:
+            entry = (subreddit_name, [], True, e)
+        finally:
+            await queue.put(entry)
+
+    async def _fetch_subreddit(
+        self, subreddit_name: str, max_posts: int, bypass_cache: bool = False
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch a subreddit's new posts through the process-wide TTL cache.
+        Returns (posts, fetched); fetched is False when served from cache.
+        With bypass_cache the provider is always called (the result still
+        refreshes the cache).
+
+        Concurrent polls (scheduler/distribution threads each run their own
+        event loop) that miss the cache for the same key share one in-flight
+        scrape; the followers get its posts with fetched=False.
+        """
+        key = (subreddit_name.lower(), "new", "day", max_posts)
+        cached = _fetch_cache.get(key)
+        if cached and not bypass_cache and time.monotonic() - cached[0] < FETCH_CACHE_TTL_SECONDS:
+            return list(cached[1]), False
+
+        with _inflight_fetches_lock:
+            inflight = _inflight_fetches.get(key)
+            leader = inflight is None
+            if leader:
+                inflight = _inflight_fetches[key] = concurrent.futures.Future()
+                # A running future can't be cancelled, so a cancelled follower
+                # (wrap_future forwards its cancel) can't break it for the rest
+                inflight.set_running_or_notify_cancel()
+
+        if not leader:
+            posts = await asyncio.wrap_future(inflight)
+            return list(posts), False
+
+        try:
+            posts = await self._scrape_into_cache(key, subreddit_name, max_posts)
+            inflight.set_result(posts)
+            return list(posts), True
+        except asyncio.CancelledError:
+            inflight.set_exception(RuntimeError(f"Fetch of r/{subreddit_name} was cancelled"))
+            raise
+        except Exception as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with _inflight_fetches_lock:
+                _inflight_fetches.pop(key, None)
+
+    async def _scrape_into_cache(
+        self, key: tuple, subreddit_name: str, max_posts: int
+    ) -> List[Dict[str, Any]]:
+        """Scrape a subreddit and store the result in the fetch cache."""
+        cached = _fetch_cache.get(key)
+        now = time.monotonic()
+
+        posts = await self.reddit_provider.scrape_subreddit_async(
+            subreddit_name=subreddit_name,
+            max_posts=max_posts,
+            sort="new",
+            time_filter="day"
+        )
+
+        # Providers return [] on errors: a shorter payload doesn't evict a
+        # fuller one that is still reasonably fresh
+        if cached and len(posts) < len(cached[1]) and now - cached[0] < FETCH_CACHE_MAX_STALE_SECONDS:
+            return cached[1]
+
+        with _fetch_cache_lock:
+            _fetch_cache.pop(key, None)
+            _fetch_cache[key] = (now, posts)
+            while len(_fetch_cache) > FETCH_CACHE_MAX_ENTRIES:
+                _fetch_cache.pop(next(iter(_fetch_cache)), None)
+        return posts
+
+    def _unseen_posts(
+        self,
+        posts: List[Dict[str, Any]],
+        seen_post_ids: set,
+    ) -> List[Dict[str, Any]]:
+        """
+        Drop posts already taken earlier in this poll (cross-posts and
+        duplicates within the batch) and add the kept ids to seen_post_ids.
+        Posts the campaign already has a lead for are skipped by the insert.
+        """
+        unseen = []
+        for post in posts:
+            post_id = post.get("id")
+            if post_id in seen_post_ids:
+                continue
+            seen_post_ids.add(post_id)
+            unseen.append(post)
+        return unseen
+
     def _save_unscored_leads(
         self,
         db: Session,
         campaign_id: int,
         poll_job_id: int,
         posts: List[Dict[str, Any]],
-    ) -> List[RedditLead]:
-        """Save posts with score=NULL, linked to poll_job."""
-        new_leads = []
-        for post in posts:
-            try:
-                lead = RedditLead(
-                    campaign_id=campaign_id,
-                    poll_job_id=poll_job_id,
-                    reddit_post_id=post.get("id", ""),
-                    subreddit_name=post.get("subreddit_name", ""),
-                    title=post.get("title", ""),
-                    content=post.get("content", ""),
-                    author=post.get("author", "[deleted]"),
-                    post_url=post.get("url", ""),
-                    score=post.get("score", 0),
-                    num_comments=post.get("num_comments", 0),
-                    created_utc=post.get("created_utc", 0),
-                    relevancy_score=None,
-                    relevancy_reason="Pending scoring",
-                    suggested_comment="",
-                    suggested_dm="",
-                    status=RedditLeadStatus.NEW,
-                )
-                db.add(lead)
-                new_leads.append(lead)
-            except Exception as e:
-                logger.error(f"Error saving post {post.get('id')}: {e}")
-                continue
+    ) -> Dict[str, int]:
+        """
+        Save posts with score=NULL, linked to poll_job.
+        Returns {reddit_post_id: lead id} for the inserted rows.
 
+        Posts without an id or title are dropped up front, so one malformed
+        scrape result cannot fail the batch insert for the rest.
+        """
+        valid_posts = [post for post in posts if post.get("id") and post.get("title")]
+        if len(valid_posts) < len(posts):
+            logger.warning(
+                f"Skipping {len(posts) - len(valid_posts)} posts without id/title "
+                f"for poll_job {poll_job_id}"
+            )
+
+        rows = [
+            {
+                "campaign_id": campaign_id,
+                "poll_job_id": poll_job_id,
+                "reddit_post_id": post.get("id", ""),
+                "subreddit_name": post.get("subreddit_name", ""),
+                "title": post.get("title", ""),
+                "content": post.get("content", ""),
+                "author": post.get("author", "[deleted]"),
+                "post_url": post.get("url", ""),
+                "score": post.get("score", 0),
+                "num_comments": post.get("num_comments", 0),
+                "created_utc": post.get("created_utc", 0),
+                "relevancy_score": None,
+                "relevancy_reason": "Pending scoring",
+                "suggested_comment": "",
+                "suggested_dm": "",
+                "status": RedditLeadStatus.NEW,
+            }
+            for post in valid_posts
+        ]
+        if not rows:
+            return {}
+
+        lead_ids = self._bulk_insert_leads(db, rows)
+        logger.info(f"Saved {len(lead_ids)} unscored leads for poll_job {poll_job_id}")
+        return lead_ids
+
+    def _bulk_insert_leads(self, db: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert lead rows in one executemany and return {reddit_post_id: lead id}.
+
+        (campaign_id, reddit_post_id) duplicates -- leads from earlier polls or
+        a concurrent poll of the same campaign -- are skipped with ON CONFLICT
+        DO NOTHING, and RETURNING yields only the rows actually inserted.
+        Dialects without ON CONFLICT (neither Postgres nor SQLite) fall back to
+        a plain INSERT, where a duplicate fails the batch.
+        """
+        stmt = INSERT_LEAD_SKIP_DUPLICATES.get(db.get_bind().dialect.name, INSERT_LEAD)
+        result = db.connection().execute(stmt, rows)
+        lead_ids = {reddit_post_id: lead_id for lead_id, reddit_post_id in result}
         db.commit()
-        logger.info(f"Saved {len(new_leads)} unscored leads for poll_job {poll_job_id}")
-        return new_leads
+        return lead_ids
 
-    async def _batch_score_leads(
+    async def _score_subreddit_leads(
         self,
         db: Session,
         campaign: RedditCampaign,
-        leads: List[RedditLead],
+        posts: List[Dict[str, Any]],
+        lead_ids: Dict[str, int],
         callbacks: PollEngineCallbacks,
-    ) -> int:
-        """Batch score leads using BatchScoringService. Returns scored count."""
-        if not leads:
-            return 0
-
-        # Build post dicts for the batch scorer
-        post_dicts = []
-        for lead in leads:
-            post_dicts.append({
-                "id": lead.reddit_post_id,
-                "reddit_post_id": lead.reddit_post_id,
-                "title": lead.title,
-                "content": lead.content,
-                "author": lead.author,
-                "url": lead.post_url,
-                "score": lead.score,
-                "num_comments": lead.num_comments,
-                "created_utc": lead.created_utc,
-                "subreddit_name": lead.subreddit_name,
-            })
-
-        # Run batch scoring
-        scored_posts = await self.scoring_service.batch_quick_score(
-            post_dicts, campaign.business_description
-        )
+        semaphore: asyncio.Semaphore,
+        current: int = 0,
+        total: int = 0,
+        subreddit: str = "",
+    ) -> tuple[int, List[Dict[str, Any]], int, int]:
+        """
+        Score one subreddit's saved leads, delete the low scorers and emit the
+        survivors. Runs as a task alongside other subreddits of the same poll.
 
-        # Track LLM usage
-        llm_calls = self.scoring_service.get_llm_calls_made()
-        if llm_calls > 0:
-            llm_type = (
-                APIType.LLM_GEMINI
-                if settings.llm_provider.lower() == "gemini"
-                else APIType.LLM_OPENAI
+        The caller acquires semaphore before creating the task; it is released
+        once this subreddit's scoring is done.
+
+        Returns (scored count, high-score post dicts, leads kept, leads deleted).
+        """
+        try:
+            await callbacks.on_progress(
+                phase="scoring", current=current, total=total,
+                subreddit=subreddit,
+                message=f"Scoring {len(lead_ids)} posts from r/{subreddit}..."
+            )
+            scored_count, high_score_posts = await self._batch_score_leads(
+                db, campaign, posts, lead_ids, callbacks,
+                current=current, total=total, subreddit=subreddit,
             )
-            for _ in range(llm_calls):
-                track_api_call(db, campaign.user_id, llm_type)
-            logger.info(f"Tracked {llm_calls} LLM calls for batch scoring")
+        finally:
+            semaphore.release()
+
+        # --- Cleanup low-score leads and emit survivors immediately ---
+        surviving_leads, deleted = self._cleanup_subreddit_leads(db, list(lead_ids.values()))
+
+        for lead in surviving_leads:
+            await callbacks.on_lead_created(lead)
+
+        logger.info(
+            f"r/{subreddit}: {len(surviving_leads)} leads kept, {deleted} deleted "
+            f"from {len(posts)} posts"
+        )
+        return scored_count, high_score_posts, len(surviving_leads), deleted
 
-        # Build a map from post_id to scored result
-        scores_map: Dict[str, Dict] = {}
-        for sp in scored_posts:
-            pid = sp.get("reddit_post_id") or sp.get("id", "")
-            scores_map[pid] = sp
+    async def _batch_score_leads(
+        self,
+        db: Session,
+        campaign: RedditCampaign,
+        posts: List[Dict[str, Any]],
+        lead_ids: Dict[str, int],
+        callbacks: PollEngineCallbacks,
+        current: int = 0,
+        total: int = 0,
+        subreddit: str = "",
+    ) -> tuple[int, List[Dict[str, Any]]]:
+        """
+        Batch score saved leads using BatchScoringService.
+        Each LLM batch is written to the DB as soon as it completes, so
+        persistence overlaps with the batches still in flight.
 
-        # Update leads with scores
+        Returns (scored count, scored post dicts at or above
+        AUTO_SUGGESTION_THRESHOLD, each carrying its lead_id).
+        """
+        if not lead_ids:
+            return 0, []
+
+        # Build post dicts for the batch scorer straight from the fetched posts
+        post_dicts = [
+            {
+                "id": post["id"],
+                "reddit_post_id": post["id"],
+                "title": post.get("title", ""),
+                "content": post.get("content", ""),
+                "author": post.get("author", "[deleted]"),
+                "url": post.get("url", ""),
+                "score": post.get("score", 0),
+                "num_comments": post.get("num_comments", 0),
+                "created_utc": post.get("created_utc", 0),
+                "subreddit_name": post.get("subreddit_name", ""),
+            }
+            for post in posts
+            if post.get("id") in lead_ids
+        ]
+        total_leads = len(lead_ids)
+        pending_ids = dict(lead_ids)
+        posts_by_id = {p["id"]: p for p in post_dicts}
+        high_score_posts: List[Dict[str, Any]] = []
+
+        # Run batch scoring, persisting each chunk as it arrives
         scored_count = 0
-        for lead in leads:
-            scored = scores_map.get(lead.reddit_post_id)
-            if scored:
-                lead.relevancy_score = scored.get("relevancy_score")
-                lead.relevancy_reason = scored.get("relevancy_reason", "")
-                scored_count += 1
-            else:
-                # Not returned by scorer - leave as NULL
-                lead.relevancy_reason = "Score not returned by batch scorer"
+        async for scored_chunk in self.scoring_service.iter_quick_score(
+            post_dicts, campaign.business_description
+        ):
+            updates = []
+            for sp in scored_chunk:
+                pid = sp.get("reddit_post_id") or sp.get("id", "")
+                lead_id = pending_ids.pop(pid, None)
+                if lead_id is None:
+                    continue
+                score = sp.get("relevancy_score")
+                if score is not None and (
+                    isinstance(score, bool) or not isinstance(score, (int, float))
+                ):
+                    # Leave the lead unscored; cleanup removes it with the
+                    # other leads the scorer did not return
+                    logger.warning(f"Ignoring non-numeric score {score!r} for post {pid}")
+                    score = None
+                reason = sp.get("relevancy_reason", "")
+                updates.append({"b_id": lead_id, "b_score": score, "b_reason": reason})
+                if score is not None and score >= AUTO_SUGGESTION_THRESHOLD:
+                    high_score_posts.append({
+                        **posts_by_id[pid],
+                        "lead_id": lead_id,
+                        "relevancy_score": score,
+                        "relevancy_reason": reason,
+                    })
+            if not updates:
+                continue
 
-        db.commit()
-        logger.info(f"Batch scored {scored_count}/{len(leads)} leads")
-        return scored_count
+            db.connection().execute(UPDATE_LEAD_SCORE, updates)
+            db.commit()
+            scored_count += len(updates)
+
+            await callbacks.on_progress(
+                phase="scoring", current=current, total=total,
+                subreddit=subreddit, posts_scored=scored_count, posts_total=total_leads,
+                message=f"Scored {scored_count}/{total_leads} posts from r/{subreddit}"
+            )
+
+        # Leads not returned by the scorer keep score NULL and are removed by
+        # _cleanup_subreddit_leads, so they need no write here
+        if pending_ids:
+            logger.warning(f"{len(pending_ids)} leads not returned by batch scorer")
+
+        logger.info(f"Batch scored {scored_count}/{total_leads} leads")
+        return scored_count, high_score_posts
 
     def _cleanup_subreddit_leads(
-        self, db: Session, leads: List[RedditLead]
-    ) -> tuple[int, int]:
-        """Delete leads with score < 50 or still NULL. Returns (kept, deleted)."""
-        kept = 0
-        deleted = 0
-        for lead in leads:
-            if lead.relevancy_score is None or lead.relevancy_score < MIN_RELEVANCY_SCORE:
-                db.delete(lead)
-                deleted += 1
-            else:
-                kept += 1
+        self, db: Session, lead_ids: List[int]
+    ) -> tuple[List[RedditLead], int]:
+        """
+        Delete leads with score < 50 or still NULL with one DELETE, then load
+        the survivors with one SELECT.
+        Returns (surviving leads ordered by score desc, deleted count).
+        """
+        deleted = db.execute(
+            delete(RedditLead).where(
+                RedditLead.id.in_(lead_ids),
+                or_(
+                    RedditLead.relevancy_score.is_(None),
+                    RedditLead.relevancy_score < MIN_RELEVANCY_SCORE,
+                ),
+            ).execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
-        return kept, deleted
+        surviving = db.scalars(
+            select(RedditLead)
+            .where(RedditLead.id.in_(lead_ids))
+            .order_by(RedditLead.relevancy_score.desc())
+        ).all()
+        return list(surviving), deleted
 
     async def _generate_suggestions(
         self,
         db: Session,
         campaign: RedditCampaign,
         poll_job: PollJob,
+        high_score_posts: List[Dict[str, Any]],
+        plan_limits: Optional[PlanLimits],
         callbacks: PollEngineCallbacks,
     ) -> None:
-        """Generate suggestions for top N 90+ score leads (capped by plan)."""
-        high_score_leads = db.execute(
-            select(RedditLead).where(
-                RedditLead.poll_job_id == poll_job.id,
-                RedditLead.relevancy_score >= AUTO_SUGGESTION_THRESHOLD
-            ).order_by(RedditLead.relevancy_score.desc())
-        ).scalars().all()
-
-        if not high_score_leads:
+        """
+        Generate suggestions for top N 90+ score leads (capped by plan).
+        Works from the scored post dicts collected during scoring, so only
+        the final write-back touches the DB. The caller commits.
+        """
+        if not high_score_posts:
             logger.info("No posts scored 90+, skipping auto-suggestion generation")
             return
 
+        high_score_posts = sorted(
+            high_score_posts, key=lambda p: p["relevancy_score"], reverse=True
+        )
+
         # Cap by plan limits to control LLM costs
-        user = db.get(User, campaign.user_id)
-        plan_limits = get_plan_limits(user.subscription_tier, user_id=user.id) if user else None
         max_suggestions = plan_limits.max_auto_suggestions if plan_limits else 5
-        if len(high_score_leads) > max_suggestions:
+        if len(high_score_posts) > max_suggestions:
             logger.info(
-                f"Capping auto-suggestions from {len(high_score_leads)} to {max_suggestions} "
+                f"Capping auto-suggestions from {len(high_score_posts)} to {max_suggestions} "
                 f"(plan: {plan_limits.plan_name if plan_limits else 'default'}). "
                 f"Rest available on-demand."
             )
-            high_score_leads = high_score_leads[:max_suggestions]
+            high_score_posts = high_score_posts[:max_suggestions]
 
         await callbacks.on_progress(
-            phase="suggestions", current=0, total=len(high_score_leads),
-            message=f"Auto-generating suggestions for {len(high_score_leads)} high-score (90+) posts..."
+            phase="suggestions", current=0, total=len(high_score_posts),
+            message=f"Auto-generating suggestions for {len(high_score_posts)} high-score (90+) posts..."
         )
 
-        # Build post dicts for suggestion generation
-        post_dicts = []
-        for lead in high_score_leads:
-            post_dicts.append({
-                "id": lead.reddit_post_id,
-                "reddit_post_id": lead.reddit_post_id,
-                "title": lead.title,
-                "content": lead.content,
-                "author": lead.author,
-                "subreddit_name": lead.subreddit_name,
-                "relevancy_score": lead.relevancy_score,
-                "relevancy_reason": lead.relevancy_reason,
-            })
+        lead_ids = {p["reddit_post_id"]: p["lead_id"] for p in high_score_posts}
+        post_dicts = [
+            {
+                "id": p["reddit_post_id"],
+                "reddit_post_id": p["reddit_post_id"],
+                "title": p["title"],
+                "content": p["content"],
+                "author": p["author"],
+                "subreddit_name": p["subreddit_name"],
+                "relevancy_score": p["relevancy_score"],
+                "relevancy_reason": p["relevancy_reason"],
+            }
+            for p in high_score_posts
+        ]
 
         # Use custom prompts if set on campaign
         business_desc = campaign.business_description
@@ -530,30 +877,59 @@ class PollEngine:
         )
 
         # Update leads with suggestions
-        suggestions_count = 0
         results_map: Dict[str, Dict] = {}
         for r in results:
             pid = r.get("reddit_post_id") or r.get("id", "")
             results_map[pid] = r
 
-        for lead in high_score_leads:
-            result = results_map.get(lead.reddit_post_id)
+        now = datetime.utcnow()
+        updates = []
+        for pid, lead_id in lead_ids.items():
+            result = results_map.get(pid)
             if result and result.get("has_suggestions"):
-                lead.suggested_comment = result.get("suggested_comment", "")
-                lead.suggested_dm = result.get("suggested_dm", "")
-                lead.has_suggestions = True
-                lead.suggestions_generated_at = datetime.utcnow()
-                suggestions_count += 1
+                updates.append({
+                    "id": lead_id,
+                    "suggested_comment": result.get("suggested_comment", ""),
+                    "suggested_dm": result.get("suggested_dm", ""),
+                    "has_suggestions": True,
+                    "suggestions_generated_at": now,
+                })
+        suggestions_count = len(updates)
+
+        # One executemany UPDATE keyed by primary key instead of N dirty-object flushes
+        if updates:
+            db.execute(update(RedditLead), updates)
 
         poll_job.suggestions_generated = suggestions_count
-        db.commit()
 
         await callbacks.on_progress(
-            phase="suggestions", current=len(high_score_leads), total=len(high_score_leads),
+            phase="suggestions", current=len(high_score_posts), total=len(high_score_posts),
             message=f"Auto-generated suggestions for {suggestions_count} high-score posts"
         )
 
-        logger.info(f"Generated suggestions for {suggestions_count}/{len(high_score_leads)} leads")
+        logger.info(f"Generated suggestions for {suggestions_count}/{len(high_score_posts)} leads")
+
+    def _relevancy_distribution(self, db: Session, poll_job_id: int) -> Dict[str, int]:
+        """Bucket this job's surviving leads by score with a single GROUP BY."""
+        score = func.coalesce(RedditLead.relevancy_score, 0)
+        bucket = case(
+            (score >= 90, "90+"),
+            (score >= 80, "80-89"),
+            (score >= 70, "70-79"),
+            (score >= 60, "60-69"),
+            else_="50-59",
+        ).label("bucket")
+
+        rows = db.execute(
+            select(bucket, func.count())
+            .where(RedditLead.poll_job_id == poll_job_id)
+            .group_by(bucket)
+        ).all()
+
+        relevancy_distribution = {"90+": 0, "80-89": 0, "70-79": 0, "60-69": 0, "50-59": 0}
+        for label, count in rows:
+            relevancy_distribution[label] = count
+        return relevancy_distribution
 
     async def _send_email(
         self,
@@ -570,29 +946,34 @@ class PollEngine:
             if poll_job.leads_created == 0:
                 return
 
-            # Query leads specifically for this poll job
-            top_leads_query = db.execute(
-                select(RedditLead).where(
+            # One round trip: the job's top leads (emailed columns only) plus
+            # a window count of its high-quality leads, evaluated before LIMIT
+            rows = db.execute(
+                select(
+                    RedditLead.title,
+                    RedditLead.subreddit_name,
+                    RedditLead.relevancy_score,
+                    RedditLead.post_url,
+                    func.sum(
+                        case((RedditLead.relevancy_score >= 80, 1), else_=0)
+                    ).over().label("high_quality_count"),
+                ).where(
                     RedditLead.poll_job_id == poll_job.id,
                     RedditLead.relevancy_score.isnot(None),
                 ).order_by(RedditLead.relevancy_score.desc()).limit(10)
-            ).scalars().all()
+            ).all()
 
+            high_quality_count = rows[0].high_quality_count if rows else 0
             top_leads = [
                 {
-                    "title": lead.title,
-                    "subreddit_name": lead.subreddit_name,
-                    "relevancy_score": lead.relevancy_score,
-                    "post_url": lead.post_url,
+                    "title": row.title,
+                    "subreddit_name": row.subreddit_name,
+                    "relevancy_score": row.relevancy_score,
+                    "post_url": row.post_url,
                 }
-                for lead in top_leads_query
+                for row in rows
             ]
 
-            high_quality_count = sum(
-                1 for lead in top_leads_query
-                if lead.relevancy_score is not None and lead.relevancy_score >= 80
-            )
-
             await asyncio.to_thread(
                 send_poll_summary_email,
                 to_email=user.email,
@@ -608,41 +989,203 @@ class PollEngine:
         except Exception as e:
             logger.error(f"Error sending email for campaign {campaign.id}: {e}")
 
-    async def _update_poll_record(
-        self, db: Session, subreddit_name: str, posts_count: int
+    def _upsert_poll_records(
+        self, db: Session, posts_counts: Dict[str, int], polled_at: datetime
     ) -> None:
-        """Update or create GlobalSubredditPoll record."""
+        """Upsert GlobalSubredditPoll stats for every polled subreddit in one statement."""
+        if not posts_counts:
+            return
         try:
-            poll_record = db.execute(
-                select(GlobalSubredditPoll).where(
-                    GlobalSubredditPoll.subreddit_name == subreddit_name
-                )
-            ).scalar_one_or_none()
-
-            if poll_record:
-                poll_record.last_poll_at = datetime.utcnow()
-                poll_record.poll_count += 1
-                poll_record.total_posts_found += posts_count
-            else:
-                poll_record = GlobalSubredditPoll(
-                    subreddit_name=subreddit_name,
-                    last_poll_at=datetime.utcnow(),
-                    poll_count=1,
-                    total_posts_found=posts_count,
-                )
-                db.add(poll_record)
-
+            insert_stmt = _dialect_insert(db)(GlobalSubredditPoll).values([
+                {
+                    "subreddit_name": name,
+                    "last_poll_at": polled_at,
+                    "last_post_timestamp": 0,
+                    "poll_count": 1,
+                    "total_posts_found": count,
+                }
+                for name, count in posts_counts.items()
+            ])
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["subreddit_name"],
+                set_={
+                    "last_poll_at": insert_stmt.excluded.last_poll_at,
+                    "poll_count": GlobalSubredditPoll.poll_count + 1,
+                    "total_posts_found": (
+                        GlobalSubredditPoll.total_posts_found
+                        + insert_stmt.excluded.total_posts_found
+                    ),
+                },
+            )
+            db.execute(stmt)
             db.commit()
         except Exception as e:
-            logger.error(f"Error updating poll record for r/{subreddit_name}: {e}")
+            logger.error(f"Error updating poll records for {len(posts_counts)} subreddits: {e}")
             db.rollback()
 
 
+def _tokenize(text: str) -> set:
+    """Lowercase word set without stop words and very short words."""
+    return {
+        token for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 3 and token not in PREFILTER_STOP_WORDS
+    }
+
+
+@lru_cache(maxsize=POST_TOKEN_CACHE_SIZE)
+def _post_tokens(title: str, content: str) -> frozenset:
+    """
+    Token set of a post's title and body. The same scraped posts are
+    prefiltered once per campaign watching the subreddit, so memoizing on
+    the text tokenizes each post once per process instead of per campaign.
+    """
+    return frozenset(_tokenize(f"{title} {content}"))
+
+
+def _keyword_prefilter(
+    posts: List[Dict[str, Any]],
+    business_tokens: set,
+    min_overlap: int,
+    top_k: int = PREFILTER_TOP_K,
+) -> List[Dict[str, Any]]:
+    """
+    Drop posts that share fewer than min_overlap words with the business
+    description before they are sent to the LLM. The top_k best-overlapping
+    posts are always kept, so small batches are never filtered and the LLM
+    still judges borderline posts.
+    """
+    if len(posts) <= top_k or not business_tokens or min_overlap <= 0:
+        return posts
+
+    overlaps = [
+        len(business_tokens & _post_tokens(p.get('title') or '', p.get('content') or ''))
+        for p in posts
+    ]
+    top = set(sorted(range(len(posts)), key=overlaps.__getitem__, reverse=True)[:top_k])
+    kept = [
+        post for i, post in enumerate(posts)
+        if i in top or overlaps[i] >= min_overlap
+    ]
+    if len(kept) < len(posts):
+        logger.info(f"Keyword prefilter skipped {len(posts) - len(kept)}/{len(posts)} posts")
+    return kept
+
+
+def _processed_post_ids_key(campaign_id: int) -> str:
+    return f"campaign:{campaign_id}:post_ids"
+
+
+def _load_processed_post_ids(campaign_id: int) -> set:
+    """Post ids the campaign processed recently (empty if Redis is unavailable)."""
+    from app.workers.tasks import get_redis_client
+
+    try:
+        return set(get_redis_client().smembers(_processed_post_ids_key(campaign_id)))
+    except Exception as e:
+        logger.warning(f"Processed post ids read failed for campaign {campaign_id}: {e}")
+        return set()
+
+
+def _remember_processed_post_ids(campaign_id: int, post_ids) -> None:
+    """Add newly saved post ids to the campaign's set; failures are non-fatal."""
+    from app.workers.tasks import get_redis_client
+
+    key = _processed_post_ids_key(campaign_id)
+    try:
+        pipe = get_redis_client().pipeline()
+        pipe.sadd(key, *post_ids)
+        pipe.expire(key, PROCESSED_POST_IDS_TTL_SECONDS)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Processed post ids write failed for campaign {campaign_id}: {e}")
+
+
+def _dialect_insert(db: Session):
+    """INSERT construct with ON CONFLICT support for the session's dialect."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
+# Event loop reused by run_poll_sync calls on the same thread
+_thread_loops = threading.local()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_thread_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_loops.loop = loop
+    return loop
+
+
+async def _drain_loop() -> None:
+    """Cancel leftover tasks, close the providers' clients and finalize async generators."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await aclose_provider_clients()
+    await asyncio.get_running_loop().shutdown_asyncgens()
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """The teardown asyncio.run does, for a loop that is not running."""
+    try:
+        loop.run_until_complete(_drain_loop())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    except Exception as e:
+        logger.warning(f"Error shutting down poll event loop: {e}")
+    finally:
+        loop.close()
+
+
+@contextmanager
+def poll_thread_pool(max_workers: int):
+    """
+    ThreadPoolExecutor for running run_poll_sync concurrently.
+
+    Each worker thread gets its own event loop, reused across its polls and
+    closed (with the clients bound to it) once the pool has shut down.
+    """
+    loops: List[asyncio.AbstractEventLoop] = []
+    loops_lock = threading.Lock()
+
+    def init_thread_loop() -> None:
+        loop = asyncio.new_event_loop()
+        _thread_loops.loop = loop
+        with loops_lock:
+            loops.append(loop)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, initializer=init_thread_loop
+        ) as executor:
+            yield executor
+    finally:
+        # The with block joined the workers, so none of these loops is running
+        for loop in loops:
+            _close_loop(loop)
+
+
 def run_poll_sync(
     db: Session,
     campaign_id: int,
     trigger: str = "manual",
+    prefetched_posts: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    bypass_cache: bool = False,
 ) -> PollJob:
-    """Synchronous wrapper for non-async contexts."""
+    """
+    Synchronous wrapper for non-async contexts.
+
+    Runs on an event loop kept per calling thread instead of asyncio.run,
+    which would build and tear down a loop (and the provider's AsyncClient
+    bound to it) for every poll. Threads still poll independently; callers
+    that poll from a pool use poll_thread_pool so those loops get closed.
+    """
     engine = PollEngine()
-    return asyncio.run(engine.run_poll(db, campaign_id, trigger))
+    return _get_thread_loop().run_until_complete(engine.run_poll(
+        db, campaign_id, trigger,
+        prefetched_posts=prefetched_posts, bypass_cache=bypass_cache,
+    ))
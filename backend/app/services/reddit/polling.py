@@ -5,29 +5,50 @@ Provides:
 1. poll_campaign_immediately() - delegates to unified PollEngine
 2. Centralized polling helpers (get_subreddits_to_poll, poll_subreddit, poll_all_active_subreddits)
 """
+import asyncio
+import json
 import logging
+import time
+from bisect import bisect_left
+from concurrent.futures import as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from typing import List, Dict, Any, Optional, Tuple, Union
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.models.tables import (
     RedditCampaign,
     RedditCampaignSubreddit,
     RedditLead,
-    RedditLeadStatus,
     GlobalSubredditPoll,
     RedditCampaignStatus,
-    APIType
 )
-from app.providers.reddit.factory import get_reddit_provider
-from app.services.usage_tracking import track_api_call
-from app.core.config import settings
-from app.core.plan_limits import get_plan_limits
+from app.providers.reddit.factory import aclose_provider_clients, get_reddit_provider
 
 
 logger = logging.getLogger(__name__)
 
+# Max subreddit scrapes in flight during centralized polling
+MAX_CONCURRENT_SUBREDDIT_POLLS = 10
+
+# Max campaigns distributed to in parallel by distribute_leads
+MAX_DISTRIBUTION_WORKERS = 8
+
+# Scraper time_filter by hours since the last poll: up to 1h -> "hour",
+# up to 24h -> "day", ..., beyond the last bound -> "year"
+TIME_FILTER_MAX_HOURS = (1, 24, 168, 720)
+TIME_FILTERS = ("hour", "day", "week", "month", "year")
+
+# Scrapes are shared through Redis across worker processes for this long
+SCRAPE_CACHE_TTL_SECONDS = 300
+
+# Adaptive cadence: poll each subreddit roughly every TARGET_NEW_POSTS_PER_POLL
+# new posts, judged by an EWMA of its new-post rate
+TARGET_NEW_POSTS_PER_POLL = 30
+POST_RATE_EWMA_ALPHA = 0.3
+MIN_POLL_INTERVAL_HOURS = 1
+MAX_POLL_INTERVAL_HOURS = 24
+
 
 class RedditPollingService:
     """
@@ -40,7 +61,12 @@ class RedditPollingService:
         self.reddit_provider = get_reddit_provider()
 
     def poll_campaign_immediately(
-        self, db: Session, campaign_id: int, trigger: str = "manual"
+        self,
+        db: Session,
+        campaign_id: int,
+        trigger: str = "manual",
+        prefetched_posts: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        bypass_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Poll a specific campaign's subreddits immediately.
@@ -50,6 +76,9 @@ class RedditPollingService:
             db: Database session
             campaign_id: Campaign to poll
             trigger: "manual" | "scheduled" | "first_poll"
+            prefetched_posts: Already-scraped posts by subreddit; only these are
+                scored for the campaign and nothing is re-fetched
+            bypass_cache: Always hit the provider (manual "Run Now")
 
         Returns:
             Summary statistics
@@ -57,7 +86,10 @@ class RedditPollingService:
         from app.services.reddit.poll_engine import run_poll_sync
 
         logger.info(f"Starting immediate poll for campaign {campaign_id}")
-        poll_job = run_poll_sync(db, campaign_id, trigger=trigger)
+        poll_job = run_poll_sync(
+            db, campaign_id, trigger=trigger,
+            prefetched_posts=prefetched_posts, bypass_cache=bypass_cache,
+        )
 
         summary = {
             "campaign_id": campaign_id,
@@ -75,50 +107,50 @@ class RedditPollingService:
     # ====================================================================
 
     def get_subreddits_to_poll(self, db: Session, max_age_hours: int = 6) -> List[str]:
-        """
-        Get list of subreddits that need polling.
+        """Get list of subreddits that need polling."""
+        return list(self.get_subreddits_to_poll_with_records(db, max_age_hours))
 
-        Strategy:
-        1. Find all active campaigns
-        2. Collect all their subreddits
-        3. Deduplicate
-        4. Filter out recently polled ones
+    def get_subreddits_to_poll_with_records(
+        self, db: Session, max_age_hours: int = 6
+    ) -> Dict[str, Optional[GlobalSubredditPoll]]:
         """
-        active_campaigns = db.execute(
-            select(RedditCampaign).where(
-                RedditCampaign.status == RedditCampaignStatus.ACTIVE
-            )
-        ).scalars().all()
-
-        if not active_campaigns:
-            logger.info("No active campaigns found")
-            return []
-
-        all_subreddits = set()
-        for campaign in active_campaigns:
-            for sub in campaign.subreddits:
-                if sub.is_active:
-                    all_subreddits.add(sub.subreddit_name)
-
-        logger.info(f"Found {len(all_subreddits)} unique subreddits across {len(active_campaigns)} campaigns")
-
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        subreddits_to_poll = []
+        Get the subreddits that need polling with their GlobalSubredditPoll
+        record (None if never polled), loaded by the same query so the polls
+        don't look them up again.
+
+        Strategy (one query):
+        1. Collect the active subreddits of all active campaigns (deduplicated in SQL)
+        2. Keep the ones that are due (outer join on GlobalSubredditPoll): past
+           their adaptive next_poll_at, or, without one, not polled within
+           max_age_hours
+        """
+        now = datetime.utcnow()
+        cutoff_time = now - timedelta(hours=max_age_hours)
 
-        for subreddit_name in all_subreddits:
-            poll_record = db.execute(
-                select(GlobalSubredditPoll).where(
-                    GlobalSubredditPoll.subreddit_name == subreddit_name
+        rows = db.execute(
+            select(RedditCampaignSubreddit.subreddit_name, GlobalSubredditPoll).join(
+                RedditCampaign,
+                RedditCampaignSubreddit.campaign_id == RedditCampaign.id
+            ).outerjoin(
+                GlobalSubredditPoll,
+                GlobalSubredditPoll.subreddit_name == RedditCampaignSubreddit.subreddit_name
+            ).where(
+                RedditCampaign.status == RedditCampaignStatus.ACTIVE,
+                RedditCampaignSubreddit.is_active == True,
+                or_(
+                    GlobalSubredditPoll.next_poll_at <= now,
+                    and_(
+                        GlobalSubredditPoll.next_poll_at.is_(None),
+                        or_(
+                            GlobalSubredditPoll.last_poll_at.is_(None),
+                            GlobalSubredditPoll.last_poll_at < cutoff_time,
+                        ),
+                    ),
                 )
-            ).scalar_one_or_none()
-
-            if poll_record is None:
-                subreddits_to_poll.append(subreddit_name)
-            elif poll_record.last_poll_at < cutoff_time:
-                subreddits_to_poll.append(subreddit_name)
-            else:
-                logger.debug(f"Skipping r/{subreddit_name} - recently polled")
+            ).distinct()
+        ).all()
 
+        subreddits_to_poll = {name: record for name, record in rows}
         logger.info(f"{len(subreddits_to_poll)} subreddits need polling")
         return subreddits_to_poll
 
@@ -126,73 +158,213 @@ class RedditPollingService:
         self,
         db: Session,
         subreddit_name: str,
-        limit: int = 100
+        limit: int = 100,
+        bypass_cache: bool = False,
+        poll_records: Optional[Dict[str, Optional[GlobalSubredditPoll]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Poll a single subreddit for new posts using Apify Reddit Scraper.
         Updates GlobalSubredditPoll tracking.
+        A scrape cached in Redis by another worker is reused unless bypass_cache;
+        empty scrapes are never cached.
+
+        poll_records: preloaded {subreddit_name: record} (see
+        get_subreddits_to_poll_with_records); when given, the record is not
+        queried again.
+        """
+        logger.info(f"Polling r/{subreddit_name}")
+
+        poll_record = self._resolve_poll_record(db, subreddit_name, poll_records)
+        time_filter, since_timestamp = self._time_filter_for(subreddit_name, poll_record)
+
+        cache_key = _scrape_cache_key(subreddit_name, time_filter, limit)
+        cached = None if bypass_cache else _get_cached_scrape(cache_key)
+        if cached is not None:
+            # The worker that scraped already recorded this poll; recording
+            # it again would double-count the posts and feed a zero-new-post
+            # sample into the rate EWMA
+            logger.info(f"Using cached scrape for r/{subreddit_name} ({len(cached)} posts)")
+            return cached
+
+        posts = self.reddit_provider.scrape_subreddit(
+            subreddit_name=subreddit_name,
+            max_posts=limit,
+            sort="new",
+            time_filter=time_filter
+        )
+        _cache_scrape(cache_key, posts)
+
+        self._record_poll(db, subreddit_name, poll_record, posts, since_timestamp, time_filter)
+        db.commit()
+        return posts
+
+    async def poll_subreddit_async(
+        self,
+        db: Session,
+        subreddit_name: str,
+        limit: int = 100,
+        poll_records: Optional[Dict[str, Optional[GlobalSubredditPoll]]] = None,
+        bypass_cache: bool = False,
+        polled_at: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of poll_subreddit: the scrape is awaited on the provider's
+        async client so many subreddits can be in flight at once.
+
+        poll_records: preloaded {subreddit_name: record} (see
+        get_subreddits_to_poll_with_records / _load_poll_records); when given,
+        a missing key means the subreddit has never been polled.
+
+        polled_at: timestamp shared by a batch of polls (default: now).
+
+        The GlobalSubredditPoll change is left uncommitted so a batch of
+        concurrent polls can commit once (committing mid-batch would expire
+        the preloaded records and reload them one by one).
         """
         logger.info(f"Polling r/{subreddit_name}")
 
-        poll_record = db.execute(
+        poll_record = self._resolve_poll_record(db, subreddit_name, poll_records)
+        time_filter, since_timestamp = self._time_filter_for(
+            subreddit_name, poll_record, now=polled_at
+        )
+
+        cache_key = _scrape_cache_key(subreddit_name, time_filter, limit)
+        cached = None if bypass_cache else _get_cached_scrape(cache_key)
+        if cached is not None:
+            # Not recorded again: see poll_subreddit
+            logger.info(f"Using cached scrape for r/{subreddit_name} ({len(cached)} posts)")
+            return cached
+
+        posts = await self.reddit_provider.scrape_subreddit_async(
+            subreddit_name=subreddit_name,
+            max_posts=limit,
+            sort="new",
+            time_filter=time_filter
+        )
+        _cache_scrape(cache_key, posts)
+
+        self._record_poll(
+            db, subreddit_name, poll_record, posts, since_timestamp, time_filter,
+            now=polled_at,
+        )
+        return posts
+
+    def _resolve_poll_record(
+        self,
+        db: Session,
+        subreddit_name: str,
+        poll_records: Optional[Dict[str, Optional[GlobalSubredditPoll]]],
+    ) -> Optional[GlobalSubredditPoll]:
+        """Take the record from the preloaded dict if the caller supplied one, else query it."""
+        if poll_records is not None:
+            return poll_records.get(subreddit_name)
+        return self._get_poll_record(db, subreddit_name)
+
+    def _get_poll_record(self, db: Session, subreddit_name: str) -> Optional[GlobalSubredditPoll]:
+        return db.execute(
             select(GlobalSubredditPoll).where(
                 GlobalSubredditPoll.subreddit_name == subreddit_name
             )
         ).scalar_one_or_none()
 
+    def _load_poll_records(
+        self, db: Session, subreddit_names
+    ) -> Dict[str, GlobalSubredditPoll]:
+        """Load GlobalSubredditPoll records for many subreddits with one WHERE IN query."""
+        if not subreddit_names:
+            return {}
+        records = db.execute(
+            select(GlobalSubredditPoll).where(
+                GlobalSubredditPoll.subreddit_name.in_(list(subreddit_names))
+            )
+        ).scalars().all()
+        return {record.subreddit_name: record for record in records}
+
+    def _time_filter_for(
+        self,
+        subreddit_name: str,
+        poll_record: Optional[GlobalSubredditPoll],
+        now: Optional[datetime] = None,
+    ) -> Tuple[str, Optional[float]]:
+        """Pick the scraper time_filter from how long ago the subreddit was polled."""
         time_filter = "day"
         since_timestamp = None
 
         if poll_record and poll_record.last_poll_at:
-            hours_since_last_poll = (datetime.utcnow() - poll_record.last_poll_at).total_seconds() / 3600
-
-            if hours_since_last_poll <= 1:
-                time_filter = "hour"
-            elif hours_since_last_poll <= 24:
-                time_filter = "day"
-            elif hours_since_last_poll <= 168:
-                time_filter = "week"
-            elif hours_since_last_poll <= 720:
-                time_filter = "month"
-            else:
-                time_filter = "year"
+            now = now or datetime.utcnow()
+            hours_since_last_poll = (now - poll_record.last_poll_at) / timedelta(hours=1)
+
+            time_filter = TIME_FILTERS[bisect_left(TIME_FILTER_MAX_HOURS, hours_since_last_poll)]
 
             since_timestamp = poll_record.last_post_timestamp
             logger.info(f"Last polled {hours_since_last_poll:.1f}h ago, using time_filter='{time_filter}'")
         else:
-            since_timestamp = (datetime.utcnow() - timedelta(hours=24)).timestamp()
+            since_timestamp = time.time() - 86400
             logger.info(f"First poll for r/{subreddit_name}, using time_filter='day'")
 
-        all_posts = self.reddit_provider.scrape_subreddit(
-            subreddit_name=subreddit_name,
-            max_posts=limit,
-            sort="new",
-            time_filter=time_filter
-        )
-
-        posts = all_posts
+        return time_filter, since_timestamp
 
-        logger.info(f"Found {len(posts)} posts in r/{subreddit_name} from Apify (time_filter='{time_filter}')")
+    def _record_poll(
+        self,
+        db: Session,
+        subreddit_name: str,
+        poll_record: Optional[GlobalSubredditPoll],
+        posts: List[Dict[str, Any]],
+        since_timestamp: Optional[float],
+        time_filter: str,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """
+        Update (or create) the GlobalSubredditPoll record after a scrape,
+        including the post-rate EWMA and next_poll_at.
+        """
+        n_posts = len(posts)
+        now = now or datetime.utcnow()
+        logger.info(f"Found {n_posts} posts in r/{subreddit_name} from Apify (time_filter='{time_filter}')")
+
+        # One pass for the newest timestamp and the new-post count. The
+        # time_filter window is wider than the gap since the last poll, so
+        # only posts newer than the last seen one count towards the rate
+        latest_ts = None
+        n_new = 0
+        seen_ts = since_timestamp or 0
+        for post in posts:
+            created_utc = post["created_utc"]
+            if not created_utc:
+                continue
+            if latest_ts is None or created_utc > latest_ts:
+                latest_ts = created_utc
+            if created_utc > seen_ts:
+                n_new += 1
+        if latest_ts is None:
+            latest_ts = since_timestamp
 
         if poll_record:
-            poll_record.last_poll_at = datetime.utcnow()
+            hours_since_last = (
+                (now - poll_record.last_poll_at) / timedelta(hours=1)
+                if poll_record.last_poll_at else 24
+            )
+            poll_record.last_poll_at = now
             poll_record.poll_count += 1
-            poll_record.total_posts_found += len(posts)
-            if posts:
-                poll_record.last_post_timestamp = max(p["created_utc"] for p in posts if p["created_utc"])
+            poll_record.total_posts_found += n_posts
+            poll_record.last_post_timestamp = latest_ts
+            poll_record.avg_posts_per_hour = (
+                (1 - POST_RATE_EWMA_ALPHA) * (poll_record.avg_posts_per_hour or 0)
+                + POST_RATE_EWMA_ALPHA * n_new / max(hours_since_last, 0.25)
+            )
         else:
+            # First poll looks back one day
             poll_record = GlobalSubredditPoll(
                 subreddit_name=subreddit_name,
-                last_poll_at=datetime.utcnow(),
-                last_post_timestamp=max(p["created_utc"] for p in posts if p["created_utc"]) if posts else since_timestamp,
+                last_poll_at=now,
+                last_post_timestamp=latest_ts,
                 poll_count=1,
-                total_posts_found=len(posts)
+                total_posts_found=n_posts,
+                avg_posts_per_hour=n_new / 24,
             )
             db.add(poll_record)
 
-        db.commit()
-
-        return posts
+        poll_record.next_poll_at = now + _poll_interval(poll_record.avg_posts_per_hour)
 
     def distribute_leads(
         self,
@@ -202,68 +374,181 @@ class RedditPollingService:
     ) -> int:
         """
         Distribute posts to relevant campaigns as leads (centralized polling path).
-        Uses PollEngine per-campaign for consistent scoring.
+        Hands the already-scraped posts to PollEngine per campaign, so each
+        campaign batch-scores them without re-fetching the subreddit.
         """
         if not posts:
             return 0
 
-        campaigns = db.execute(
-            select(RedditCampaign).join(
-                RedditCampaignSubreddit,
-                RedditCampaignSubreddit.campaign_id == RedditCampaign.id
-            ).where(
-                RedditCampaign.status == RedditCampaignStatus.ACTIVE,
-                RedditCampaignSubreddit.subreddit_name == subreddit_name,
-                RedditCampaignSubreddit.is_active == True
-            )
-        ).scalars().all()
+        campaign_ids = self.get_campaign_ids_for_subreddit(db, subreddit_name)
 
-        if not campaigns:
+        if not campaign_ids:
             logger.info(f"No active campaigns for r/{subreddit_name}")
             return 0
 
-        logger.info(f"Distributing {len(posts)} posts to {len(campaigns)} campaigns")
+        new_posts_by_campaign = self._new_posts_by_campaign(db, campaign_ids, posts)
+        if not new_posts_by_campaign:
+            logger.info(f"No new posts in r/{subreddit_name} for any campaign")
+            return 0
 
-        total_leads = 0
-        for campaign in campaigns:
+        logger.info(f"Distributing {len(posts)} posts to {len(new_posts_by_campaign)} campaigns")
+
+        # Campaigns run in parallel threads, each with its own session on the
+        # caller's engine (a Session must not be shared across threads)
+        session_factory = sessionmaker(bind=db.get_bind(), autoflush=False)
+
+        def distribute_one(campaign_id: int, new_posts: List[Dict[str, Any]]) -> int:
+            campaign_db = session_factory()
             try:
                 summary = self.poll_campaign_immediately(
-                    db, campaign.id, trigger="scheduled"
+                    campaign_db, campaign_id, trigger="scheduled",
+                    prefetched_posts={subreddit_name: new_posts},
                 )
-                total_leads += summary.get("total_leads_created", 0)
-            except Exception as e:
-                logger.error(f"Error distributing to campaign {campaign.id}: {e}", exc_info=True)
-                db.rollback()
+                return summary.get("total_leads_created", 0)
+            finally:
+                campaign_db.close()
+
+        from app.services.reddit.poll_engine import poll_thread_pool
+
+        total_leads = 0
+        max_workers = min(MAX_DISTRIBUTION_WORKERS, len(new_posts_by_campaign))
+        with poll_thread_pool(max_workers) as executor:
+            futures = {
+                executor.submit(distribute_one, campaign_id, new_posts): campaign_id
+                for campaign_id, new_posts in new_posts_by_campaign.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    total_leads += future.result()
+                except Exception as e:
+                    logger.error(f"Error distributing to campaign {futures[future]}: {e}", exc_info=True)
 
         return total_leads
 
-    def poll_all_active_subreddits(self, db: Session) -> Dict[str, Any]:
+    def enqueue_distribution(
+        self,
+        db: Session,
+        subreddit_name: str,
+        posts: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Fan distribution out to Celery: one distribute_to_campaign task per
+        campaign watching the subreddit, each receiving the scraped posts.
+        Returns the number of tasks enqueued.
+        """
+        from celery import group
+        from app.workers.tasks import distribute_to_campaign
+
+        if not posts:
+            return 0
+
+        campaign_ids = self.get_campaign_ids_for_subreddit(db, subreddit_name)
+        if not campaign_ids:
+            logger.info(f"No active campaigns for r/{subreddit_name}")
+            return 0
+
+        new_posts_by_campaign = self._new_posts_by_campaign(db, campaign_ids, posts)
+        if not new_posts_by_campaign:
+            logger.info(f"No new posts in r/{subreddit_name} for any campaign")
+            return 0
+
+        group(
+            distribute_to_campaign.s(campaign_id, subreddit_name, new_posts)
+            for campaign_id, new_posts in new_posts_by_campaign.items()
+        ).apply_async()
+
+        logger.info(
+            f"Enqueued distribution of r/{subreddit_name} to {len(new_posts_by_campaign)} campaigns"
+        )
+        return len(new_posts_by_campaign)
+
+    def _new_posts_by_campaign(
+        self,
+        db: Session,
+        campaign_ids: List[int],
+        posts: List[Dict[str, Any]]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Split posts per campaign, dropping the ones the campaign already has a
+        lead for (one query for all campaigns). Campaigns with nothing new are
+        left out, so they get no PollJob and no scoring at all.
+        """
+        post_ids = [p["id"] for p in posts]
+        existing = set(db.execute(
+            select(RedditLead.campaign_id, RedditLead.reddit_post_id).where(
+                RedditLead.campaign_id.in_(campaign_ids),
+                RedditLead.reddit_post_id.in_(post_ids),
+            )
+        ).tuples().all())
+
+        new_posts_by_campaign = {}
+        for campaign_id in campaign_ids:
+            new_posts = [p for p in posts if (campaign_id, p["id"]) not in existing]
+            if new_posts:
+                new_posts_by_campaign[campaign_id] = new_posts
+        return new_posts_by_campaign
+
+    def get_campaign_ids_for_subreddit(self, db: Session, subreddit_name: str) -> List[int]:
+        """IDs of active campaigns with the subreddit active."""
+        return db.execute(
+            select(RedditCampaign.id).join(
+                RedditCampaignSubreddit,
+                RedditCampaignSubreddit.campaign_id == RedditCampaign.id
+            ).where(
+                RedditCampaign.status == RedditCampaignStatus.ACTIVE,
+                RedditCampaignSubreddit.subreddit_name == subreddit_name,
+                RedditCampaignSubreddit.is_active == True
+            )
+        ).scalars().all()
+
+    def poll_all_active_subreddits(self, db: Session, fan_out: bool = False) -> Dict[str, Any]:
         """
         Main polling function: Poll all active subreddits and distribute leads.
         Called by Celery task.
+
+        With fan_out, distribution runs as one Celery task per
+        (subreddit, campaign) instead of in this process, so a slow or failing
+        campaign doesn't hold up the rest; total_leads_created is then 0 and
+        distribution_tasks counts the enqueued tasks.
         """
         logger.info("Starting centralized Reddit polling")
 
-        subreddits_to_poll = self.get_subreddits_to_poll(db)
+        poll_records = self.get_subreddits_to_poll_with_records(db)
+        subreddits_to_poll = list(poll_records)
 
         if not subreddits_to_poll:
             logger.info("No subreddits need polling")
             return {
                 "subreddits_polled": 0,
                 "total_posts_found": 0,
-                "total_leads_created": 0
+                "total_leads_created": 0,
+                "distribution_tasks": 0,
             }
 
+        # Scrape all subreddits concurrently, then distribute: in-process
+        # distribution runs PollEngine on its own event loops (run_poll_sync),
+        # so it must stay outside this one
+        results = asyncio.run(self._poll_subreddits_concurrently(
+            db, subreddits_to_poll, poll_records=poll_records
+        ))
+
         total_posts = 0
         total_leads = 0
+        distribution_tasks = 0
+
+        for subreddit_name, result in zip(subreddits_to_poll, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error polling r/{subreddit_name}: {result}", exc_info=result)
+                db.rollback()
+                continue
 
-        for subreddit_name in subreddits_to_poll:
             try:
-                posts = self.poll_subreddit(db, subreddit_name)
-                total_posts += len(posts)
+                total_posts += len(result)
 
-                leads_created = self.distribute_leads(db, subreddit_name, posts)
-                total_leads += leads_created
+                if fan_out:
+                    distribution_tasks += self.enqueue_distribution(db, subreddit_name, result)
+                else:
+                    total_leads += self.distribute_leads(db, subreddit_name, result)
 
             except Exception as e:
                 logger.error(f"Error polling r/{subreddit_name}: {e}", exc_info=True)
@@ -273,8 +558,91 @@ class RedditPollingService:
         summary = {
             "subreddits_polled": len(subreddits_to_poll),
             "total_posts_found": total_posts,
-            "total_leads_created": total_leads
+            "total_leads_created": total_leads,
+            "distribution_tasks": distribution_tasks,
         }
 
         logger.info(f"Polling complete: {summary}")
         return summary
+
+    async def _poll_subreddits_concurrently(
+        self,
+        db: Session,
+        subreddit_names: List[str],
+        poll_records: Optional[Dict[str, Optional[GlobalSubredditPoll]]] = None,
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        """
+        Scrape subreddits concurrently (bounded by MAX_CONCURRENT_SUBREDDIT_POLLS).
+        Returns one entry per subreddit, in order: its posts or the raised exception.
+        Records are loaded with one query unless the caller already has them.
+
+        Runs on its own asyncio.run loop, so the provider clients bound to
+        that loop are closed before returning.
+        """
+        try:
+            return await self._gather_subreddit_polls(db, subreddit_names, poll_records)
+        finally:
+            await aclose_provider_clients()
+
+    async def _gather_subreddit_polls(
+        self,
+        db: Session,
+        subreddit_names: List[str],
+        poll_records: Optional[Dict[str, Optional[GlobalSubredditPoll]]],
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBREDDIT_POLLS)
+        if poll_records is None:
+            poll_records = self._load_poll_records(db, subreddit_names)
+
+        # One timestamp for the whole batch, like PollEngine's poll start time
+        polled_at = datetime.utcnow()
+
+        async def poll_one(subreddit_name: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.poll_subreddit_async(
+                    db, subreddit_name, poll_records=poll_records, polled_at=polled_at
+                )
+
+        results = await asyncio.gather(
+            *(poll_one(name) for name in subreddit_names),
+            return_exceptions=True,
+        )
+        db.commit()
+        return results
+
+
+def _poll_interval(avg_posts_per_hour: float) -> timedelta:
+    """Time until TARGET_NEW_POSTS_PER_POLL new posts are expected, clamped."""
+    hours = TARGET_NEW_POSTS_PER_POLL / max(avg_posts_per_hour, 0.1)
+    return timedelta(hours=min(MAX_POLL_INTERVAL_HOURS, max(MIN_POLL_INTERVAL_HOURS, hours)))
+
+
+def _scrape_cache_key(subreddit_name: str, time_filter: str, limit: int) -> str:
+    return f"rsp:{subreddit_name.lower()}:{time_filter}:{limit}"
+
+
+def _get_cached_scrape(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Return a scrape cached in Redis, or None (miss or Redis unavailable)."""
+    from app.workers.tasks import get_redis_client
+
+    try:
+        data = get_redis_client().get(key)
+    except Exception as e:
+        logger.warning(f"Scrape cache read failed for {key}: {e}")
+        return None
+    return json.loads(data) if data else None
+
+
+def _cache_scrape(key: str, posts: List[Dict[str, Any]]) -> None:
+    """Store a scrape in Redis for SCRAPE_CACHE_TTL_SECONDS; failures are non-fatal."""
+    from app.workers.tasks import get_redis_client
+
+    # Providers return [] on any error; caching that would hide the
+    # subreddit from every worker for the whole TTL
+    if not posts:
+        return
+
+    try:
+        get_redis_client().setex(key, SCRAPE_CACHE_TTL_SECONDS, json.dumps(posts))
+    except Exception as e:
+        logger.warning(f"Scrape cache write failed for {key}: {e}")
@@ -8,15 +8,18 @@ Handles scheduled polling based on user subscription tiers:
 This service should be called by a cron job or scheduler every hour.
 """
 import logging
+from concurrent.futures import as_completed
 from datetime import datetime, timezone
-from typing import Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.db import SessionLocal
-from app.core.plan_limits import is_admin_user
+from app.core.plan_limits import get_admin_user_ids
 from app.models.tables import (
     User,
     RedditCampaign,
@@ -29,6 +32,12 @@ from app.services.reddit.polling import RedditPollingService
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on campaigns polled at once during a scheduled run
+MAX_SCHEDULED_POLL_WORKERS = 8
+
+# Rows fetched per round trip while streaming due campaigns
+SCHEDULER_FETCH_BATCH_SIZE = 200
+
 # Tier classification
 STARTER_TIERS = {
     SubscriptionTier.STARTER_MONTHLY,
@@ -51,28 +60,36 @@ FREE_TRIAL_TIERS = {
 }
 
 
-def get_poll_hours_for_tier(tier: SubscriptionTier) -> Set[int]:
+def _parse_poll_hours(hours_str: str) -> FrozenSet[int]:
+    """Parse a comma-separated list of UTC hours from settings."""
+    try:
+        return frozenset(int(h.strip()) for h in hours_str.split(","))
+    except ValueError:
+        logger.error(f"Invalid poll times configuration: {hours_str}")
+        return frozenset()
+
+
+# Poll hours are parsed once at import; tiers not listed (expired or
+# unknown) get no scheduled polling
+_PREMIUM_HOURS = _parse_poll_hours(settings.POLL_TIMES_PREMIUM)  # Growth/Pro: 4x/day
+_STARTER_HOURS = _parse_poll_hours(settings.POLL_TIMES_STARTER)  # Starter/Trial: 2x/day
+
+_TIER_HOURS: Dict[SubscriptionTier, FrozenSet[int]] = {
+    **{tier: _PREMIUM_HOURS for tier in PREMIUM_TIERS},
+    **{tier: _STARTER_HOURS for tier in STARTER_TIERS | FREE_TRIAL_TIERS},
+}
+
+_NO_HOURS: FrozenSet[int] = frozenset()
+
+
+def get_poll_hours_for_tier(tier: SubscriptionTier) -> FrozenSet[int]:
     """
     Get the UTC hours when polling should run for a given tier.
 
     Returns:
         Set of UTC hour values (0-23)
     """
-    if tier in PREMIUM_TIERS:
-        # Growth/Pro: 4x/day
-        hours_str = settings.POLL_TIMES_PREMIUM
-    elif tier in STARTER_TIERS or tier in FREE_TRIAL_TIERS:
-        # Starter/Trial: 2x/day
-        hours_str = settings.POLL_TIMES_STARTER
-    else:
-        # Expired or unknown: no polling
-        return set()
-
-    try:
-        return {int(h.strip()) for h in hours_str.split(",")}
-    except ValueError:
-        logger.error(f"Invalid poll times configuration: {hours_str}")
-        return set()
+    return _TIER_HOURS.get(tier, _NO_HOURS)
 
 
 def should_poll_now(tier: SubscriptionTier, current_hour: int) -> bool:
@@ -86,8 +103,7 @@ def should_poll_now(tier: SubscriptionTier, current_hour: int) -> bool:
     Returns:
         True if polling should run
     """
-    poll_hours = get_poll_hours_for_tier(tier)
-    return current_hour in poll_hours
+    return current_hour in _TIER_HOURS.get(tier, _NO_HOURS)
 
 
 def run_scheduled_polls(current_hour: int = None) -> dict:
@@ -108,8 +124,10 @@ def run_scheduled_polls(current_hour: int = None) -> dict:
         logger.info("Scheduled polling is disabled")
         return {"status": "disabled", "message": "Scheduled polling is disabled"}
 
+    # One clock read per run: it picks the hour and anchors the expiry checks
+    now = datetime.now(timezone.utc)
     if current_hour is None:
-        current_hour = datetime.now(timezone.utc).hour
+        current_hour = now.hour
 
     logger.info(f"Running scheduled polls for UTC hour {current_hour}")
 
@@ -120,89 +138,89 @@ def run_scheduled_polls(current_hour: int = None) -> dict:
         "hour": current_hour,
         "users_checked": 0,
         "campaigns_polled": 0,
-        "campaigns_skipped": 0,
         "errors": 0,
     }
 
+    # Resolve the schedule and expiry rules up front so the query only
+    # returns users that are actually due this hour
+    eligible_tiers = [t for t in SubscriptionTier if should_poll_now(t, current_hour)]
+    now_naive = now.replace(tzinfo=None)
+
+    def poll_one(campaign_id: int) -> dict:
+        # Each thread gets its own session; a Session must not be shared
+        campaign_db = SessionLocal()
+        try:
+            # Email is handled inside PollEngine (scoped to poll_job_id)
+            return polling_service.poll_campaign_immediately(
+                campaign_db, campaign_id, trigger="scheduled"
+            )
+        finally:
+            campaign_db.close()
+
     try:
-        # Get all active, non-blocked users with active campaigns
-        users_with_campaigns = db.execute(
-            select(User)
+        # Stream due (user, campaign) pairs in one query. Account status,
+        # schedule and expiry are all enforced here, so the rows need no
+        # per-user re-checks.
+        rows = db.execute(
+            select(User.id, User.subscription_tier, RedditCampaign.id)
             .join(RedditCampaign, RedditCampaign.user_id == User.id)
             .where(
                 RedditCampaign.status == RedditCampaignStatus.ACTIVE,
                 User.is_active == True,
                 User.is_blocked == False,
-                User.subscription_tier != SubscriptionTier.EXPIRED,
+                User.subscription_tier.in_(eligible_tiers),
+                # Admin users bypass the trial/subscription end dates
+                or_(
+                    User.id.in_(get_admin_user_ids()),
+                    and_(
+                        or_(
+                            User.subscription_tier != SubscriptionTier.FREE_TRIAL,
+                            User.trial_ends_at.is_(None),
+                            User.trial_ends_at >= now_naive,
+                        ),
+                        or_(
+                            User.subscription_tier == SubscriptionTier.FREE_TRIAL,
+                            User.subscription_ends_at.is_(None),
+                            User.subscription_ends_at >= now_naive,
+                        ),
+                    ),
+                ),
             )
-            .distinct()
-        ).scalars().all()
-
-        logger.info(f"Found {len(users_with_campaigns)} users with active campaigns")
-
-        for user in users_with_campaigns:
-            stats["users_checked"] += 1
-
-            # Check user account status
-            if not user.is_active:
-                logger.debug(f"Skipping user {user.id}: account deactivated")
-                stats["campaigns_skipped"] += 1
-                continue
-
-            if user.is_blocked:
-                logger.debug(f"Skipping user {user.id}: account blocked")
-                stats["campaigns_skipped"] += 1
-                continue
-
-            # Admin users bypass subscription and scheduling checks
-            if not is_admin_user(user.id):
-                # Check if subscription/trial has expired by date
-                now = datetime.now(timezone.utc).replace(tzinfo=None)
-                if (user.subscription_tier == SubscriptionTier.FREE_TRIAL
-                        and user.trial_ends_at and user.trial_ends_at < now):
-                    logger.debug(f"Skipping user {user.id}: free trial ended")
-                    stats["campaigns_skipped"] += 1
-                    continue
-
-                if (user.subscription_tier != SubscriptionTier.FREE_TRIAL
-                        and user.subscription_ends_at and user.subscription_ends_at < now):
-                    logger.debug(f"Skipping user {user.id}: subscription ended")
-                    stats["campaigns_skipped"] += 1
-                    continue
-
-            # Check if this user should be polled at this hour
-            if not should_poll_now(user.subscription_tier, current_hour):
-                logger.debug(
-                    f"Skipping user {user.id} ({user.subscription_tier.value}): "
-                    f"not scheduled for hour {current_hour}"
-                )
-                continue
-
-            # Get all active campaigns for this user
-            campaigns = db.execute(
-                select(RedditCampaign)
-                .where(
-                    RedditCampaign.user_id == user.id,
-                    RedditCampaign.status == RedditCampaignStatus.ACTIVE
+            .order_by(User.id, RedditCampaign.id)
+            .execution_options(yield_per=SCHEDULER_FETCH_BATCH_SIZE)
+        )
+
+        # Campaign polls are dominated by Reddit/LLM network time, so run
+        # them across all due users in one bounded thread pool, submitting
+        # each batch as it arrives instead of materializing every row first
+        from app.services.reddit.poll_engine import poll_thread_pool
+
+        user_ids = set()
+        with poll_thread_pool(MAX_SCHEDULED_POLL_WORKERS) as executor:
+            futures = {}
+            for user_id, tier, campaign_id in rows:
+                user_ids.add(user_id)
+                logger.info(
+                    f"Polling campaign {campaign_id} for user {user_id} "
+                    f"(tier: {tier.value})"
                 )
-            ).scalars().all()
+                futures[executor.submit(poll_one, campaign_id)] = campaign_id
 
-            for campaign in campaigns:
+            stats["users_checked"] = len(user_ids)
+            logger.info(
+                f"Found {len(user_ids)} users with {len(futures)} active campaigns "
+                f"due for hour {current_hour}"
+            )
+
+            for future in as_completed(futures):
+                campaign_id = futures[future]
                 try:
-                    logger.info(
-                        f"Polling campaign {campaign.id} for user {user.id} "
-                        f"(tier: {user.subscription_tier.value})"
-                    )
-                    # Email is now handled inside PollEngine (scoped to poll_job_id)
-                    summary = polling_service.poll_campaign_immediately(
-                        db, campaign.id, trigger="scheduled"
-                    )
+                    summary = future.result()
                     stats["campaigns_polled"] += 1
-                    logger.info(f"Campaign {campaign.id} poll completed: {summary}")
-
+                    logger.info(f"Campaign {campaign_id} poll completed: {summary}")
                 except Exception as e:
                     logger.error(
-                        f"Error polling campaign {campaign.id}: {e}",
+                        f"Error polling campaign {campaign_id}: {e}",
                         exc_info=True
                     )
                     stats["errors"] += 1
@@ -218,44 +236,48 @@ def run_scheduled_polls(current_hour: int = None) -> dict:
     return stats
 
 
-def get_polling_schedule_info(tier: SubscriptionTier) -> dict:
+@lru_cache(maxsize=None)
+def get_polling_schedule_info(tier: SubscriptionTier) -> Mapping[str, Any]:
     """
     Get polling schedule information for a given tier.
 
+    Poll hours are fixed at import, so the result is built once per tier
+    and returned as a read-only mapping (lists become tuples).
+
     Args:
         tier: User's subscription tier
 
     Returns:
-        Dict with schedule info for display to user
+        Mapping with schedule info for display to user
     """
     poll_hours = get_poll_hours_for_tier(tier)
 
     if not poll_hours:
-        return {
+        return MappingProxyType({
             "enabled": False,
             "polls_per_day": 0,
-            "times_utc": [],
+            "times_utc": (),
             "description": "No scheduled polling (subscription required)"
-        }
+        })
 
     polls_per_day = len(poll_hours)
-    times_utc = sorted(poll_hours)
+    times_utc = tuple(sorted(poll_hours))
 
     # Format times for display
-    time_strings = [f"{h:02d}:00 UTC" for h in times_utc]
+    time_strings = tuple(f"{h:02d}:00 UTC" for h in times_utc)
 
     if polls_per_day == 2:
         description = "2x daily: Europe morning (8am CET) & US West Coast morning (8am PST)"
     else:
         description = "4x daily: comprehensive global coverage"
 
-    return {
+    return MappingProxyType({
         "enabled": True,
         "polls_per_day": polls_per_day,
         "times_utc": times_utc,
         "times_formatted": time_strings,
         "description": description
-    }
+    })
 
 
 # CLI entry point for running via cron
@@ -9,6 +9,9 @@ This ensures we don't send every post to OpenAI/Gemini
 import logging
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, Tuple, Optional
 
 from app.core.config import settings
@@ -18,20 +21,76 @@ from app.services.llm.client import get_llm_client
 logger = logging.getLogger(__name__)
 
 
+# Common words that never make useful filter keywords
+_STOP_WORDS = frozenset({
+    "i", "we", "our", "us", "the", "a", "an", "for", "to", "of", "in",
+    "on", "at", "by", "with", "from", "is", "are", "am", "and", "or"
+})
+
+_KEYWORD_PUNCTUATION = ".,!?;:"
+MAX_POSITIVE_KEYWORDS = 10
+
+# Post content past this many chars is not scanned for keywords
+KEYWORD_SCAN_CHARS = 4096
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Upper bound on in-flight LLM calls during batch_score_posts
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# keyword_filter score for posts that match no keyword
+NO_MATCH_KEYWORD_SCORE = 0.1
+# In batches larger than this, posts with no keyword match are only sent
+# to the LLM if they rank among the top-K by keyword match count
+LLM_FUNNEL_TOP_K = 30
+
+
+# Process-wide LLM backends, created on first use and shared by every
+# RedditScoringService instance so their HTTP sessions are reused
+_llm_client = None
+_chain_service = None
+
+
+def _get_llm_client():
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = get_llm_client()
+    return _llm_client
+
+
+def _get_chain_service():
+    global _chain_service
+    if _chain_service is None:
+        from app.services.langchain.chains.reddit_scoring_chain import RedditScoringChainService
+        _chain_service = RedditScoringChainService()
+    return _chain_service
+
+
+@lru_cache(maxsize=1024)
+def _extract_positive_keywords(business_description: str) -> Tuple[str, ...]:
+    """Top keywords for a business description (deterministic, so memoized)."""
+    # This could be enhanced with LLM, but keeping it simple to save costs
+    keywords = (
+        word.strip(_KEYWORD_PUNCTUATION)
+        for word in business_description.lower().split()
+        if len(word) > 3 and word not in _STOP_WORDS
+    )
+    return tuple(islice(keywords, MAX_POSITIVE_KEYWORDS))
+
+
 class RedditScoringService:
     """
     Scores Reddit posts for lead potential using a cost-efficient funnel approach
     """
     
     def __init__(self):
-        # 根据配置选择 LLM 实现
+        # 根据配置选择 LLM 实现（进程内共享，避免每个实例重复初始化客户端）
         if settings.use_langchain_chains:
-            from app.services.langchain.chains.reddit_scoring_chain import RedditScoringChainService
-            self.llm_scorer = RedditScoringChainService()
+            self.llm_scorer = _get_chain_service()
             self.use_langchain = True
             logger.info("Using LangChain for Reddit scoring")
         else:
-            self.llm_client = get_llm_client()
+            self.llm_client = _get_llm_client()
             self.use_langchain = False
             logger.info("Using legacy LLM client for Reddit scoring")
     
@@ -40,27 +99,14 @@ class RedditScoringService:
         Extract keywords from business description for filtering
         Returns positive (must match) and negative (exclude) keywords
         """
-        # This could be enhanced with LLM, but keeping it simple to save costs
-        words = business_description.lower().split()
-        
-        # Remove common words
-        stop_words = {
-            "i", "we", "our", "us", "the", "a", "an", "for", "to", "of", "in", 
-            "on", "at", "by", "with", "from", "is", "are", "am", "and", "or"
-        }
-        
-        keywords = [
-            word.strip(".,!?;:") 
-            for word in words 
-            if len(word) > 3 and word not in stop_words
-        ]
+        keywords = list(_extract_positive_keywords(business_description))
         
         # 移除 negative keywords - 让LLM来判断是否是spam/meme
         # 关键词过滤太严格，会误杀正常的营销/推广讨论帖
         negative_keywords = []
         
         return {
-            "positive": keywords[:10],  # Top 10 keywords
+            "positive": keywords,  # Top 10 keywords
             "negative": negative_keywords  # 空列表，不过滤
         }
     
@@ -75,25 +121,37 @@ class RedditScoringService:
         Returns:
             (should_analyze, keyword_score, reason)
         """
-        text = f"{post['title']} {post['content']}".lower()
+        return self._keyword_filter_result(post, self._count_keyword_matches(post, keywords), keywords)
+
+    def _count_keyword_matches(self, post: Dict[str, Any], keywords: Dict[str, list]) -> int:
+        """Number of positive keywords found in the post's title and body prefix."""
+        # Matches rank posts for the large-batch LLM funnel and feed the
+        # logs, so scanning a bounded prefix of long bodies is enough
+        content = post.get('content') or ''
+        text = f"{post['title']} {content[:KEYWORD_SCAN_CHARS]}".lower()
         
-        # 添加调试日志
+        # 添加调试日志（%s 参数惰性格式化，DEBUG 关闭时不拼接字符串）
         post_id = post.get('reddit_post_id') or post.get('id', 'unknown')
-        logger.debug(f"Filtering post {post_id}: {post.get('title', '')[:50]}")
-        logger.debug(f"Positive keywords: {keywords['positive']}")
-        logger.debug(f"Post text (first 100 chars): {text[:100]}")
+        logger.debug("Filtering post %s: %.50s", post_id, post.get('title', ''))
+        logger.debug("Positive keywords: %s", keywords['positive'])
+        logger.debug("Post text (first 100 chars): %.100s", text)
         
-        # 移除negative keywords检查 - 让所有帖子都进入LLM分析
-        # 不再在这里过滤，由LLM智能判断相关性
+        # 移除negative keywords检查 - 由LLM智能判断相关性
         
-        # Check positive keywords (仅用于提升评分，不用于排除)
+        # Check positive keywords. They never exclude a post on their own;
+        # only batch_score_posts drops keyword-less posts from large batches
+        # With ~10 keywords, C-level substring scans beat a multi-pattern matcher
         positive_matches = sum(1 for kw in keywords["positive"] if kw in text)
-        logger.debug(f"Post {post_id}: {positive_matches} keyword matches")
-        
-        # 所有帖子都允许进入LLM分析
+        logger.debug("Post %s: %d keyword matches", post_id, positive_matches)
+        return positive_matches
+
+    def _keyword_filter_result(
+        self, post: Dict[str, Any], positive_matches: int, keywords: Dict[str, list]
+    ) -> Tuple[bool, float, str]:
+        # Single posts always go to the LLM (see batch_score_posts for large batches)
         if positive_matches == 0:
-            logger.info(f"No keyword matches, using LLM to judge relevancy: {post.get('title', '')[:50]}")
-            return True, 0.1, "No keyword matches, using LLM only"
+            logger.info("No keyword matches, using LLM to judge relevancy: %.50s", post.get('title', ''))
+            return True, NO_MATCH_KEYWORD_SCORE, "No keyword matches, using LLM only"
         
         # Calculate simple keyword score (0-1) - 用于辅助LLM评分
         keyword_score = min(positive_matches / len(keywords["positive"]), 1.0)
@@ -117,7 +175,7 @@ class RedditScoringService:
         
         # 原有实现
         post_id = post.get('reddit_post_id') or post.get('id', 'unknown')
-        logger.info(f"LLM analyzing post: {post_id}")
+        logger.info("LLM analyzing post: %s", post_id)
         
         prompt = f"""You are analyzing a Reddit post for lead generation potential.
 
@@ -177,18 +235,12 @@ Return ONLY valid JSON (no markdown, no extra text):
             else:
                 text = str(response)
             
-            # Clean up potential markdown formatting
-            text = text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-            
-            # Parse JSON
-            result = json.loads(text)
+            # Decode the first JSON object, ignoring markdown fences or any
+            # other text around it
+            start = text.find("{")
+            if start < 0:
+                raise json.JSONDecodeError("No JSON object in response", text, 0)
+            result, _ = _JSON_DECODER.raw_decode(text, start)
             
             # Get LLM score (should be one of: 100, 90, 80, 70, 60, 50, 0)
             llm_score = result.get("relevancy_score", 50)
@@ -220,23 +272,27 @@ Return ONLY valid JSON (no markdown, no extra text):
         self, 
         post: Dict[str, Any], 
         business_description: str,
-        keywords: Optional[Dict[str, list]] = None
+        keywords: Optional[Dict[str, list]] = None,
+        filter_result: Optional[Tuple[bool, float, str]] = None
     ) -> Dict[str, Any]:
         """
         Full scoring pipeline: Keyword Filter -> LLM Analysis
         
+        filter_result: precomputed keyword_filter() output (batch path)
+        
         Returns scored post with analysis
         """
-        # Extract keywords if not provided
-        if keywords is None:
-            keywords = self.extract_keywords(business_description)
-        
         # Stage 1: Keyword filter (FREE)
-        should_analyze, keyword_score, filter_reason = self.keyword_filter(post, keywords)
+        if filter_result is None:
+            # Extract keywords if not provided
+            if keywords is None:
+                keywords = self.extract_keywords(business_description)
+            filter_result = self.keyword_filter(post, keywords)
+        should_analyze, keyword_score, filter_reason = filter_result
         
         if not should_analyze:
             post_id = post.get('reddit_post_id') or post.get('id', 'unknown')
-            logger.info(f"Post {post_id} filtered out: {filter_reason}")
+            logger.info("Post %s filtered out: %s", post_id, filter_reason)
             return {
                 **post,
                 "relevancy_score": 0,  # Filtered posts get 0
@@ -254,9 +310,7 @@ Return ONLY valid JSON (no markdown, no extra text):
         )
         
         post_id = post.get('reddit_post_id') or post.get('id', 'unknown')
-        logger.info(
-            f"Post {post_id} scored {relevancy_score:.2f}: {reason}"
-        )
+        logger.info("Post %s scored %.2f: %s", post_id, relevancy_score, reason)
         
         scored_result = {
             **post,
@@ -268,8 +322,11 @@ Return ONLY valid JSON (no markdown, no extra text):
         }
         
         # DEBUG: Verify data preservation
-        logger.debug(f"DEBUG Scoring - Post {post_id}: author={scored_result.get('author')}, "
-                    f"score={scored_result.get('score')}, num_comments={scored_result.get('num_comments')}")
+        logger.debug(
+            "DEBUG Scoring - Post %s: author=%s, score=%s, num_comments=%s",
+            post_id, scored_result.get('author'),
+            scored_result.get('score'), scored_result.get('num_comments'),
+        )
         
         return scored_result
     
@@ -287,15 +344,35 @@ Return ONLY valid JSON (no markdown, no extra text):
         # Extract keywords once
         keywords = self.extract_keywords(business_description)
         
-        scored_posts = []
-        llm_analyzed_count = 0
+        if not posts:
+            return []
         
-        for post in posts:
-            scored_post = self.score_post(post, business_description, keywords)
-            scored_posts.append(scored_post)
-            
-            if scored_post.get("passed_filter", False):
-                llm_analyzed_count += 1
+        # Stage 1 for the whole batch up front, so large batches can keep
+        # keyword-less posts away from the LLM
+        match_counts = [self._count_keyword_matches(post, keywords) for post in posts]
+        filter_results = [
+            self._keyword_filter_result(post, n, keywords) for post, n in zip(posts, match_counts)
+        ]
+        if len(posts) > LLM_FUNNEL_TOP_K:
+            ranked = sorted(range(len(posts)), key=lambda i: match_counts[i], reverse=True)
+            top = set(ranked[:LLM_FUNNEL_TOP_K])
+            for i, (_, keyword_score, _) in enumerate(filter_results):
+                if i not in top and match_counts[i] == 0:
+                    filter_results[i] = (False, keyword_score, "No keyword matches in a large batch")
+        
+        # Each post is one blocking LLM round trip; overlap them in a bounded
+        # thread pool (map keeps the input order)
+        max_workers = min(MAX_CONCURRENT_LLM_CALLS, len(posts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scored_posts = list(executor.map(
+                lambda post, result: self.score_post(
+                    post, business_description, keywords, filter_result=result
+                ),
+                posts,
+                filter_results,
+            ))
+        
+        llm_analyzed_count = sum(1 for p in scored_posts if p.get("passed_filter", False))
         
         logger.info(
             f"Batch scoring complete: {llm_analyzed_count}/{len(posts)} posts sent to LLM"
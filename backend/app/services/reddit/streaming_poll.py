@@ -6,7 +6,7 @@ Thin adapter over the unified PollEngine.
 """
 import asyncio
 import logging
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Dict, Any, Optional
 
 from sqlalchemy.orm import Session
 
@@ -17,22 +17,95 @@ from app.services.reddit.poll_engine import PollEngine, PollEngineCallbacks, run
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on buffered SSE events; when a slow client lets the queue
+# fill up, the engine waits in put() instead of buffering without limit
+MAX_BUFFERED_EVENTS = 256
+
+# Events handed to the client per wakeup of the streaming loop
+EVENT_DRAIN_BATCH = 32
+
+# Progress updates for the same phase closer together than this are merged
+# into one frame carrying the latest current/total
+PROGRESS_COALESCE_SECONDS = 0.1
+
+
 class StreamingSSECallbacks(PollEngineCallbacks):
-    """Converts PollEngine callbacks into SSE event dicts via an asyncio.Queue."""
+    """Converts PollEngine callbacks into SSE event dicts via a bounded asyncio.Queue."""
 
     def __init__(self):
-        self.events: asyncio.Queue = asyncio.Queue()
+        self.events: asyncio.Queue = asyncio.Queue(maxsize=MAX_BUFFERED_EVENTS)
+        self.detached = False
+        # Latest held-back progress event per phase, and when each phase last
+        # reached the client
+        self._pending_progress: Dict[str, Dict[str, Any]] = {}
+        self._last_progress_at: Dict[str, float] = {}
+        self._flush_timer: Optional[asyncio.Task] = None
+
+    async def _emit(self, event: Dict[str, Any]) -> None:
+        # Once the client is gone nobody drains the queue, so drop events
+        # rather than blocking the engine on a full queue
+        if not self.detached:
+            await self.events.put(event)
+
+    def detach(self) -> None:
+        """Stop buffering events and release an engine blocked on a full queue."""
+        self.detached = True
+        while not self.events.empty():
+            self.events.get_nowait()
+
+    async def flush(self) -> None:
+        """Emit any held-back progress events now."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        await self._flush_pending_progress()
+
+    async def _flush_pending_progress(self) -> None:
+        now = asyncio.get_running_loop().time()
+        while self._pending_progress:
+            phase = next(iter(self._pending_progress))
+            event = self._pending_progress.pop(phase)
+            self._last_progress_at[phase] = now
+            await self._emit(event)
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(PROGRESS_COALESCE_SECONDS)
+        # Clear the handle first so flush() never cancels us mid-emit
+        self._flush_timer = None
+        await self._flush_pending_progress()
 
     async def on_progress(self, phase: str, current: int, total: int,
                           message: str, **extra) -> None:
-        await self.events.put({
+        event = {
             "type": "progress",
             "data": {"phase": phase, "current": current, "total": total,
                      "message": message, **extra}
-        })
+        }
+
+        # Errors and the final tick of a phase always go out; other ticks
+        # inside the window only replace the pending one for their phase
+        now = asyncio.get_running_loop().time()
+        last_sent = self._last_progress_at.get(phase)
+        if (
+            "error" not in extra
+            and current < total
+            and last_sent is not None
+            and now - last_sent < PROGRESS_COALESCE_SECONDS
+        ):
+            self._pending_progress[phase] = event
+            if self._flush_timer is None:
+                self._flush_timer = asyncio.create_task(self._flush_after_window())
+            return
+
+        # The new event supersedes a held-back one of the same phase
+        self._pending_progress.pop(phase, None)
+        await self.flush()
+        self._last_progress_at[phase] = now
+        await self._emit(event)
 
     async def on_lead_created(self, lead: RedditLead) -> None:
-        await self.events.put({
+        await self.flush()
+        await self._emit({
             "type": "lead",
             "data": {
                 "id": lead.id,
@@ -56,10 +129,12 @@ class StreamingSSECallbacks(PollEngineCallbacks):
         })
 
     async def on_complete(self, stats: Dict[str, Any]) -> None:
-        await self.events.put({"type": "complete", "data": stats})
+        await self.flush()
+        await self._emit({"type": "complete", "data": stats})
 
     async def on_error(self, message: str) -> None:
-        await self.events.put({"type": "error", "data": {"message": message}})
+        await self.flush()
+        await self._emit({"type": "error", "data": {"message": message}})
 
 
 # Sentinel to signal the engine task is done
@@ -94,30 +169,42 @@ class StreamingPollService:
         async def run_engine():
             try:
                 await self.engine.run_poll(
-                    db, campaign_id, trigger="manual", callbacks=callbacks
+                    db, campaign_id, trigger="manual", callbacks=callbacks,
+                    bypass_cache=True,
                 )
             except Exception as e:
                 # Error already emitted via callbacks.on_error in PollEngine
                 logger.error(f"Engine error: {e}")
             finally:
-                await callbacks.events.put(_DONE)
+                await callbacks.flush()
+                if not callbacks.detached:
+                    await callbacks.events.put(_DONE)
 
         task = asyncio.create_task(run_engine())
 
-        while True:
-            try:
-                event = await asyncio.wait_for(callbacks.events.get(), timeout=1.0)
-                if event is _DONE:
-                    break
-                yield event
-            except asyncio.TimeoutError:
-                if task.done():
-                    # Drain remaining events
-                    while not callbacks.events.empty():
-                        event = callbacks.events.get_nowait()
-                        if event is not _DONE:
-                            yield event
-                    break
+        # run_engine always enqueues _DONE last, so a plain get() needs no
+        # timeout (wait_for would arm and cancel a timer for every event).
+        # Whatever else is already buffered is handed over in the same
+        # wakeup, up to EVENT_DRAIN_BATCH events.
+        try:
+            done = False
+            while not done:
+                batch = [await callbacks.events.get()]
+                while len(batch) < EVENT_DRAIN_BATCH and not callbacks.events.empty():
+                    batch.append(callbacks.events.get_nowait())
+
+                for event in batch:
+                    if event is _DONE:
+                        done = True
+                        break
+                    yield event
+
+            await task
+        finally:
+            # Client went away mid-poll: let the engine run to completion
+            # in the background without waiting on the bounded queue
+            if not task.done():
+                callbacks.detach()
 
 
 # Synchronous wrapper for non-SSE usage (background tasks, non-SSE endpoints)
@@ -126,7 +213,7 @@ def poll_campaign_with_batch_scoring(db: Session, campaign_id: int) -> Dict[str,
     Non-streaming version of the batch scoring poll.
     Used for background tasks or non-SSE endpoints.
     """
-    poll_job = run_poll_sync(db, campaign_id, trigger="manual")
+    poll_job = run_poll_sync(db, campaign_id, trigger="manual", bypass_cache=True)
     return {
         "total_leads": poll_job.leads_created,
         "total_posts_fetched": poll_job.posts_fetched,
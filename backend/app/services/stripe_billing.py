@@ -2,59 +2,210 @@
 Stripe Billing Service
 
 Handles checkout sessions, webhooks, and subscription management.
+
+Stripe API calls use the SDK's async methods (*_async), so callers on the
+event loop (API routes, the webhook) don't block it for a round trip.
+Database work never runs on the loop: the async functions hand it to the
+threadpool, and the synchronous webhook handlers (DB and Redis only) run
+on a small dedicated pool via run_webhook_handler.
 """
 
+import asyncio
+import functools
+import hashlib
 import stripe
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional, Literal
 
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
 from app.core.config import settings
 from app.models.tables import User, SubscriptionTier
-from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
 # Initialize Stripe
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
-# Price ID mapping
-PRICE_ID_MAP = {
+# Price ID mapping, fixed at import and read-only
+PRICE_ID_MAP = MappingProxyType({
     "STARTER_MONTHLY": settings.STRIPE_PRICE_STARTER_MONTHLY,
     "STARTER_ANNUALLY": settings.STRIPE_PRICE_STARTER_ANNUALLY,
     "GROWTH_MONTHLY": settings.STRIPE_PRICE_GROWTH_MONTHLY,
     "GROWTH_ANNUALLY": settings.STRIPE_PRICE_GROWTH_ANNUALLY,
     "PRO_MONTHLY": settings.STRIPE_PRICE_PRO_MONTHLY,
     "PRO_ANNUALLY": settings.STRIPE_PRICE_PRO_ANNUALLY,
-}
+})
 
 # Reverse mapping: price_id -> tier
-TIER_FROM_PRICE = {v: k for k, v in PRICE_ID_MAP.items() if v}
+TIER_FROM_PRICE = MappingProxyType({v: k for k, v in PRICE_ID_MAP.items() if v})
+
+# Webhook handlers get their own threads so a burst of events can't
+# saturate the default executor shared with other blocking work
+WEBHOOK_HANDLER_WORKERS = 4
+_webhook_executor = ThreadPoolExecutor(
+    max_workers=WEBHOOK_HANDLER_WORKERS, thread_name_prefix="stripe-webhook"
+)
+
+# Customer creates are idempotent within this window: retries and racing
+# first checkouts share one key, while a later attempt (e.g. after the
+# customer was deleted in Stripe) gets a fresh one instead of the cached
+# response Stripe keeps for ~24h
+CUSTOMER_CREATE_KEY_WINDOW_SECONDS = 600
+
+# Tier code -> SubscriptionTier, so an unknown code is a miss, not a ValueError
+_TIER_BY_CODE = MappingProxyType({tier.value: tier for tier in SubscriptionTier})
+
+# customer.subscription.updated arrives in bursts and out of order; the
+# newest applied event time per subscription is kept this long in Redis
+SUBSCRIPTION_EVENT_TTL_SECONDS = 600
+
+# Atomically skip an event older than the stored watermark (or any update
+# after the subscription was deleted), otherwise advance the watermark.
+# Equal timestamps are applied: created has one-second resolution and
+# Stripe retries resend the same event.
+_SUBSCRIPTION_EVENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then return 0 end
+local applied = tonumber(redis.call('GET', KEYS[1]))
+if applied and applied > tonumber(ARGV[1]) then return 0 end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+
+async def run_webhook_handler(handler, *args, **kwargs):
+    """Run a synchronous webhook handler off the event loop on the webhook pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _webhook_executor, functools.partial(handler, *args, **kwargs)
+    )
 
 
-def get_or_create_customer(user: User, db: Session) -> str:
-    """Get existing Stripe customer or create a new one."""
+def _subscription_event_key(subscription_id: str) -> str:
+    return f"stripe:evt:{subscription_id}"
+
+
+def _subscription_deleted_key(subscription_id: str) -> str:
+    return f"stripe:evt:{subscription_id}:deleted"
+
+
+def _is_stale_subscription_event(subscription_id: str, event_created: Optional[int]) -> bool:
+    """True if a newer event (or the deletion) was already applied; Redis errors fail open."""
+    if not subscription_id or event_created is None:
+        return False
+
+    from app.workers.tasks import get_redis_client
+
+    try:
+        applied = get_redis_client().eval(
+            _SUBSCRIPTION_EVENT_SCRIPT, 2,
+            _subscription_event_key(subscription_id),
+            _subscription_deleted_key(subscription_id),
+            int(event_created), SUBSCRIPTION_EVENT_TTL_SECONDS,
+        )
+        return not applied
+    except Exception as e:
+        logger.warning(f"Subscription event watermark check failed for {subscription_id}: {e}")
+        return False
+
+
+def _mark_subscription_deleted(subscription_id: str) -> None:
+    """Terminal flag: later-delivered updates must not revive the subscription."""
+    from app.workers.tasks import get_redis_client
+
+    try:
+        get_redis_client().set(
+            _subscription_deleted_key(subscription_id), 1, ex=SUBSCRIPTION_EVENT_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Subscription deleted flag write failed for {subscription_id}: {e}")
+
+
+async def get_or_create_customer(user: User, db: Session) -> str:
+    """
+    Get existing Stripe customer or create a new one.
+
+    No row lock is held across the Stripe call: the create is idempotent
+    per user within a short window, and the row is locked and re-checked
+    only to save the id. A request that loses that race deletes its own
+    customer and returns the saved one. Database work runs in the threadpool.
+    """
     if user.stripe_customer_id:
         return user.stripe_customer_id
+    user_id = user.id
+    email = user.email
+    name = user.full_name or user.email
+
+    # Re-read the row: another request may have just created one
+    existing_id = await run_in_threadpool(_read_customer_id, db, user_id)
+    if existing_id:
+        return existing_id
 
     # Create new customer
-    customer = stripe.Customer.create(
-        email=user.email,
-        name=user.full_name or user.email,
+    customer = await stripe.Customer.create_async(
+        email=email,
+        name=name,
         metadata={
-            "user_id": str(user.id),
-        }
+            "user_id": str(user_id),
+        },
+        idempotency_key=_customer_create_key(user_id, email, name),
     )
 
-    # Save customer ID to user
-    user.stripe_customer_id = customer.id
-    db.commit()
+    # Save customer ID to user, unless a racing request already did
+    saved_id = await run_in_threadpool(_save_customer_id, db, user_id, customer.id)
+    if saved_id != customer.id:
+        try:
+            await stripe.Customer.delete_async(customer.id)
+        except Exception as e:
+            logger.warning(f"Failed to delete duplicate Stripe customer {customer.id} for user {user_id}: {e}")
+        return saved_id
 
-    logger.info(f"Created Stripe customer {customer.id} for user {user.id}")
+    logger.info(f"Created Stripe customer {customer.id} for user {user_id}")
     return customer.id
 
 
-def create_checkout_session(
+def _customer_create_key(user_id: int, email: str, name: str) -> str:
+    """Idempotency key for a customer create, scoped to the current window and the params sent."""
+    window = int(time.time() // CUSTOMER_CREATE_KEY_WINDOW_SECONDS)
+    params_digest = hashlib.sha256(f"{email}\n{name}".encode()).hexdigest()[:12]
+    return f"cust-create-{user_id}-{window}-{params_digest}"
+
+
+def _read_customer_id(db: Session, user_id: int) -> Optional[str]:
+    customer_id = (
+        db.query(User.stripe_customer_id)
+        .filter(User.id == user_id)
+        .scalar()
+    )
+    db.commit()  # end the read transaction
+    return customer_id
+
+
+def _save_customer_id(db: Session, user_id: int, customer_id: str) -> str:
+    """Save customer_id under a row lock if none is set yet; returns the id the user ends up with."""
+    locked = (
+        db.query(User)
+        .filter(User.id == user_id)
+        .with_for_update()
+        .populate_existing()
+        .first()
+    )
+    if locked is None:
+        db.commit()
+        return customer_id
+    if not locked.stripe_customer_id:
+        locked.stripe_customer_id = customer_id
+    saved_id = locked.stripe_customer_id
+    db.commit()
+    return saved_id
+
+
+async def create_checkout_session(
     user: User,
     tier_code: str,
     db: Session,
@@ -78,12 +229,15 @@ def create_checkout_session(
     if not price_id:
         raise ValueError(f"Invalid tier code: {tier_code}")
 
-    customer_id = get_or_create_customer(user, db)
-
+    # Read the user before get_or_create_customer commits and expires it,
+    # so nothing lazy-loads on the event loop afterwards
+    user_id = user.id
     # Determine if this is a trial-eligible plan (Starter only)
     is_starter = tier_code.startswith("STARTER")
     is_trial_eligible = is_starter and user.subscription_tier == SubscriptionTier.FREE_TRIAL
 
+    customer_id = await get_or_create_customer(user, db)
+
     session_params = {
         "mode": "subscription",
         "customer": customer_id,
@@ -91,12 +245,12 @@ def create_checkout_session(
         "success_url": success_url,
         "cancel_url": cancel_url,
         "metadata": {
-            "user_id": str(user.id),
+            "user_id": str(user_id),
             "tier_code": tier_code,
         },
         "subscription_data": {
             "metadata": {
-                "user_id": str(user.id),
+                "user_id": str(user_id),
                 "tier_code": tier_code,
             }
         },
@@ -107,9 +261,9 @@ def create_checkout_session(
     if is_trial_eligible:
         session_params["subscription_data"]["trial_period_days"] = 7
 
-    session = stripe.checkout.Session.create(**session_params)
+    session = await stripe.checkout.Session.create_async(**session_params)
 
-    logger.info(f"Created checkout session {session.id} for user {user.id}, tier {tier_code}")
+    logger.info(f"Created checkout session {session.id} for user {user_id}, tier {tier_code}")
 
     return {
         "checkout_url": session.url,
@@ -117,14 +271,14 @@ def create_checkout_session(
     }
 
 
-def create_customer_portal_session(user: User, db: Session, return_url: str) -> dict:
+async def create_customer_portal_session(user: User, db: Session, return_url: str) -> dict:
     """
     Create a Stripe Customer Portal session for managing subscriptions.
     """
     if not user.stripe_customer_id:
         raise ValueError("User has no Stripe customer ID")
 
-    session = stripe.billing_portal.Session.create(
+    session = await stripe.billing_portal.Session.create_async(
         customer=user.stripe_customer_id,
         return_url=return_url,
     )
@@ -134,43 +288,101 @@ def create_customer_portal_session(user: User, db: Session, return_url: str) ->
     }
 
 
-def handle_checkout_completed(session: stripe.checkout.Session, db: Session) -> None:
-    """Handle successful checkout completion."""
+async def handle_checkout_completed(session: stripe.checkout.Session, db: Session) -> None:
+    """Handle successful checkout completion; the database work runs on the webhook pool."""
+    pending_subscription_id = await run_webhook_handler(_apply_checkout_completed, session, db)
+    if pending_subscription_id is None:
+        return
+
+    # No end date yet: customer.subscription.created may not be delivered
+    # (or not subscribed to), so fetch the period end from Stripe
+    try:
+        subscription = await stripe.Subscription.retrieve_async(pending_subscription_id)
+    except Exception as e:
+        logger.error(
+            f"Failed to retrieve subscription {pending_subscription_id} for checkout session "
+            f"{session.id}; subscription_ends_at stays unset until a subscription event arrives: {e}"
+        )
+        return
+
+    await run_webhook_handler(
+        _apply_checkout_end_date,
+        db,
+        pending_subscription_id,
+        datetime.fromtimestamp(subscription.current_period_end),
+    )
+
+
+def _apply_checkout_completed(session: stripe.checkout.Session, db: Session) -> Optional[str]:
+    """Apply the subscription; returns its id if the end date is still unknown."""
     user_id = session.metadata.get("user_id")
     tier_code = session.metadata.get("tier_code")
-    subscription_id = session.subscription
+    # Webhook payloads carry the subscription id; an expanded session carries the object
+    subscription = session.subscription
+    expanded = subscription is not None and not isinstance(subscription, str)
+    subscription_id = subscription.id if expanded else subscription
 
     if not user_id or not tier_code:
         logger.error(f"Missing metadata in checkout session {session.id}")
-        return
+        return None
 
     user = db.query(User).filter(User.id == int(user_id)).first()
     if not user:
         logger.error(f"User {user_id} not found for checkout session {session.id}")
-        return
+        return None
 
     # Update user subscription
-    try:
-        new_tier = SubscriptionTier(tier_code)
-    except ValueError:
+    new_tier = _TIER_BY_CODE.get(tier_code)
+    if new_tier is None:
         logger.error(f"Invalid tier code {tier_code}")
-        return
+        return None
 
     user.subscription_tier = new_tier
     user.stripe_subscription_id = subscription_id
     user.trial_ends_at = None  # Clear trial since they're now subscribed
 
-    # Get subscription details for end date
-    if subscription_id:
-        subscription = stripe.Subscription.retrieve(subscription_id)
+    # An expanded session carries the end date. Otherwise keep a future one
+    # that subscription.created may already have set, and clear one left in
+    # the past by a cancelled subscription (it would block polling); the
+    # caller then retrieves the subscription for the real date.
+    if expanded:
         user.subscription_ends_at = datetime.fromtimestamp(subscription.current_period_end)
+    elif user.subscription_ends_at and user.subscription_ends_at <= datetime.utcnow():
+        user.subscription_ends_at = None
+    needs_end_date = user.subscription_ends_at is None
 
     db.commit()
     logger.info(f"User {user_id} subscribed to {tier_code}")
+    return subscription_id if needs_end_date and subscription_id else None
+
+
+def _apply_checkout_end_date(db: Session, subscription_id: str, ends_at: datetime) -> None:
+    """Set the end date fetched after checkout, unless a subscription event already set one."""
+    user = db.query(User).filter(User.stripe_subscription_id == subscription_id).first()
+    if not user:
+        logger.error(f"No user found for subscription {subscription_id}")
+        return
+    if user.subscription_ends_at and user.subscription_ends_at > datetime.utcnow():
+        return
+    user.subscription_ends_at = ends_at
+    db.commit()
 
 
-def handle_subscription_updated(subscription: stripe.Subscription, db: Session) -> None:
-    """Handle subscription updates (upgrades, downgrades, renewals)."""
+def handle_subscription_updated(
+    subscription: stripe.Subscription,
+    db: Session,
+    event_created: Optional[int] = None,
+) -> None:
+    """
+    Handle subscription updates (upgrades, downgrades, renewals).
+
+    event_created: the webhook Event's created time; events older than the
+    last one applied to this subscription are skipped.
+    """
+    if _is_stale_subscription_event(subscription.id, event_created):
+        logger.info(f"Skipping stale update for subscription {subscription.id} (created {event_created})")
+        return
+
     user_id = subscription.metadata.get("user_id")
     tier_code = subscription.metadata.get("tier_code")
 
@@ -193,10 +405,11 @@ def handle_subscription_updated(subscription: stripe.Subscription, db: Session)
         tier_code = TIER_FROM_PRICE.get(price_id)
 
     if tier_code:
-        try:
-            user.subscription_tier = SubscriptionTier(tier_code)
-        except ValueError:
+        new_tier = _TIER_BY_CODE.get(tier_code)
+        if new_tier is None:
             logger.error(f"Invalid tier code {tier_code}")
+        else:
+            user.subscription_tier = new_tier
 
     user.stripe_subscription_id = subscription.id
     user.subscription_ends_at = datetime.fromtimestamp(subscription.current_period_end)
@@ -213,7 +426,9 @@ def handle_subscription_updated(subscription: stripe.Subscription, db: Session)
 
 
 def handle_subscription_deleted(subscription: stripe.Subscription, db: Session) -> None:
-    """Handle subscription cancellation."""
+    """Handle subscription cancellation. Never deduplicated."""
+    _mark_subscription_deleted(subscription.id)
+
     customer_id = subscription.customer
     user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
 
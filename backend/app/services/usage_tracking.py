@@ -3,17 +3,82 @@ Simple usage tracking service.
 Tracks API calls per user for ROI calculation and scam detection.
 """
 import logging
-from datetime import datetime, date
-from typing import Optional
+from datetime import datetime, date, time
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy import func, select
 
 from app.models.tables import UsageTracking, APIType
 
 logger = logging.getLogger(__name__)
 
+# Per-request calls are counted in Redis hashes and written to usage_tracking
+# by the flush-usage-counters beat task; the TTL only guards against keys
+# left behind if flushing stops
+USAGE_COUNTER_PREFIX = "usage:"
+USAGE_COUNTER_TTL_SECONDS = 2 * 24 * 3600
+USAGE_FLUSH_SCAN_COUNT = 500
+
+
+@lru_cache(maxsize=4)
+def _day_start(day: date) -> datetime:
+    """Midnight of day, the value stored in UsageTracking.date; keyed by day so it rolls over at UTC midnight."""
+    return datetime.combine(day, time.min)
+
+
+def _dialect_insert(db: Session):
+    """INSERT construct with ON CONFLICT support for the session's dialect."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
+def _upsert_usage(db: Session, rows: List[dict]) -> None:
+    """
+    Add usage rows onto the (user_id, api_type, date) counters in one
+    INSERT ... ON CONFLICT DO UPDATE; concurrent writers can't race into a
+    unique violation the way SELECT-then-INSERT could.
+    """
+    now = datetime.utcnow()
+    insert_stmt = _dialect_insert(db)(UsageTracking).values([
+        {"created_at": now, "updated_at": now, **row} for row in rows
+    ])
+    db.execute(insert_stmt.on_conflict_do_update(
+        index_elements=["user_id", "api_type", "date"],
+        set_={
+            "call_count": UsageTracking.call_count + insert_stmt.excluded.call_count,
+            "input_tokens": UsageTracking.input_tokens + insert_stmt.excluded.input_tokens,
+            "output_tokens": UsageTracking.output_tokens + insert_stmt.excluded.output_tokens,
+            "updated_at": insert_stmt.excluded.updated_at,
+        },
+    ))
+
+
+def _usage_counter_key(day: date, user_id: int, api_type: APIType) -> str:
+    return f"{USAGE_COUNTER_PREFIX}{day.isoformat()}:{user_id}:{api_type.value}"
+
+
+def _buffer_usage(
+    user_id: int, api_type: APIType, calls: int, input_tokens: int, output_tokens: int,
+    day: Optional[date] = None,
+) -> None:
+    """HINCRBY the day's counters in one pipelined round trip (raises if Redis is down)."""
+    from app.workers.tasks import get_redis_client
+
+    key = _usage_counter_key(day or datetime.utcnow().date(), user_id, api_type)
+    pipe = get_redis_client().pipeline(transaction=False)
+    pipe.hincrby(key, "calls", calls)
+    if input_tokens:
+        pipe.hincrby(key, "input_tokens", input_tokens)
+    if output_tokens:
+        pipe.hincrby(key, "output_tokens", output_tokens)
+    pipe.expire(key, USAGE_COUNTER_TTL_SECONDS)
+    pipe.execute()
+
 
 def track_api_call(
     db: Session,
@@ -24,39 +89,130 @@ def track_api_call(
 ) -> None:
     """
     Track an API call for a user.
-    Uses upsert to increment counter if record exists for today.
+
+    The call is counted in Redis and reaches usage_tracking with the next
+    flush_buffered_usage run, keeping the database off the request path.
+    Without Redis it is upserted directly.
     """
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    try:
+        _buffer_usage(user_id, api_type, 1, input_tokens, output_tokens)
+        return
+    except Exception as e:
+        logger.warning(f"Usage buffering failed for user {user_id}, writing directly: {e}")
+
+    today = _day_start(datetime.utcnow().date())
 
     try:
-        # Check if record exists for today
-        existing = db.query(UsageTracking).filter(
-            UsageTracking.user_id == user_id,
-            UsageTracking.api_type == api_type,
-            UsageTracking.date == today
-        ).first()
-
-        if existing:
-            existing.call_count += 1
-            existing.input_tokens += input_tokens
-            existing.output_tokens += output_tokens
-        else:
-            new_record = UsageTracking(
-                user_id=user_id,
-                api_type=api_type,
-                date=today,
-                call_count=1,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens
-            )
-            db.add(new_record)
+        _upsert_usage(db, [{
+            "user_id": user_id,
+            "api_type": api_type,
+            "date": today,
+            "call_count": 1,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+        }])
+        db.commit()
+    except Exception as e:
+        logger.error(f"Failed to track usage for user {user_id}: {e}")
+        db.rollback()
+
 
+def track_api_calls_bulk(
+    db: Session,
+    user_id: int,
+    call_counts: Dict[APIType, int]
+) -> None:
+    """
+    Track buffered API calls for a user in a single transaction.
+    Writes at most one row per API type, however many calls were buffered.
+    """
+    call_counts = {api_type: n for api_type, n in call_counts.items() if n > 0}
+    if not call_counts:
+        return
+
+    today = _day_start(datetime.utcnow().date())
+
+    try:
+        _upsert_usage(db, [
+            {
+                "user_id": user_id,
+                "api_type": api_type,
+                "date": today,
+                "call_count": count,
+                "input_tokens": 0,
+                "output_tokens": 0,
+            }
+            for api_type, count in call_counts.items()
+        ])
         db.commit()
     except Exception as e:
         logger.error(f"Failed to track usage for user {user_id}: {e}")
         db.rollback()
 
 
+def flush_buffered_usage(db: Session) -> int:
+    """
+    Move the Redis usage counters into usage_tracking with one upsert.
+
+    Each key is read and deleted in one MULTI/EXEC, so increments landing
+    during the flush stay in Redis for the next run. If the database write
+    fails, the drained counts are added back.
+
+    Returns the number of counters flushed.
+    """
+    from app.workers.tasks import get_redis_client
+
+    client = get_redis_client()
+    drained = []
+    for key in client.scan_iter(match=f"{USAGE_COUNTER_PREFIX}*", count=USAGE_FLUSH_SCAN_COUNT):
+        pipe = client.pipeline()
+        pipe.hgetall(key)
+        pipe.delete(key)
+        counters, _ = pipe.execute()
+        if not counters:
+            continue
+
+        try:
+            day, user_id, api_type = key[len(USAGE_COUNTER_PREFIX):].split(":")
+            drained.append({
+                "user_id": int(user_id),
+                "api_type": APIType(api_type),
+                "date": _day_start(date.fromisoformat(day)),
+                "call_count": int(counters.get("calls", 0)),
+                "input_tokens": int(counters.get("input_tokens", 0)),
+                "output_tokens": int(counters.get("output_tokens", 0)),
+            })
+        except ValueError:
+            logger.error(f"Dropping malformed usage counter {key}: {counters}")
+
+    if not drained:
+        return 0
+
+    try:
+        _upsert_usage(db, drained)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Failed to flush {len(drained)} usage counters, re-buffering: {e}")
+        db.rollback()
+        # Re-buffer row by row so one Redis failure doesn't drop the rest;
+        # the database error is what propagates
+        lost = 0
+        for row in drained:
+            try:
+                _buffer_usage(
+                    row["user_id"], row["api_type"], row["call_count"],
+                    row["input_tokens"], row["output_tokens"], day=row["date"].date(),
+                )
+            except Exception as rebuffer_error:
+                lost += 1
+                logger.error(f"Lost usage counter {row}: re-buffering failed: {rebuffer_error}")
+        if lost:
+            logger.error(f"{lost} of {len(drained)} drained usage counters could not be re-buffered")
+        raise
+
+    return len(drained)
+
+
 def get_user_usage_summary(
     db: Session,
     user_id: int,
@@ -67,21 +223,20 @@ def get_user_usage_summary(
     Get usage summary for a user within date range.
     Returns dict with counts per API type.
     """
-    query = db.query(
+    stmt = select(
         UsageTracking.api_type,
         func.sum(UsageTracking.call_count).label('total_calls'),
         func.sum(UsageTracking.input_tokens).label('total_input_tokens'),
         func.sum(UsageTracking.output_tokens).label('total_output_tokens')
-    ).filter(UsageTracking.user_id == user_id)
+    ).where(UsageTracking.user_id == user_id)
 
+    # Dates stay bound parameters, so the compiled statement is reused
     if start_date:
-        query = query.filter(UsageTracking.date >= datetime.combine(start_date, datetime.min.time()))
+        stmt = stmt.where(UsageTracking.date >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        query = query.filter(UsageTracking.date <= datetime.combine(end_date, datetime.max.time()))
-
-    query = query.group_by(UsageTracking.api_type)
+        stmt = stmt.where(UsageTracking.date <= datetime.combine(end_date, datetime.max.time()))
 
-    results = query.all()
+    results = db.execute(stmt.group_by(UsageTracking.api_type)).all()
 
     summary = {}
     for row in results:
@@ -103,7 +258,7 @@ def get_all_users_usage(
     Get usage summary for all users (admin view).
     Returns list of users with their usage stats.
     """
-    query = db.query(
+    stmt = select(
         UsageTracking.user_id,
         func.sum(UsageTracking.call_count).label('total_calls'),
         func.sum(UsageTracking.input_tokens).label('total_input_tokens'),
@@ -111,13 +266,13 @@ def get_all_users_usage(
     )
 
     if start_date:
-        query = query.filter(UsageTracking.date >= datetime.combine(start_date, datetime.min.time()))
+        stmt = stmt.where(UsageTracking.date >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        query = query.filter(UsageTracking.date <= datetime.combine(end_date, datetime.max.time()))
+        stmt = stmt.where(UsageTracking.date <= datetime.combine(end_date, datetime.max.time()))
 
-    query = query.group_by(UsageTracking.user_id).order_by(func.sum(UsageTracking.call_count).desc())
+    stmt = stmt.group_by(UsageTracking.user_id).order_by(func.sum(UsageTracking.call_count).desc())
 
-    results = query.all()
+    results = db.execute(stmt).all()
 
     return [
         {
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from pinecone import Pinecone
 import logging
 
@@ -7,14 +10,85 @@ from app.services.vector.client import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Pinecone's metadata limit per string field
+MAX_METADATA_STRING_LENGTH = 10000
+
+# upsert_records accepts at most 96 records per request; batches are sent
+# in parallel
+UPSERT_RECORDS_BATCH_SIZE = 96
+MAX_UPSERT_WORKERS = 8
+
+# Vector upserts are capped at 2MB per request, which ~100 embeddings with
+# metadata stay well under
+UPSERT_VECTORS_BATCH_SIZE = 100
+
+
+def _send_in_batches(send, items: list, batch_size: int) -> None:
+    """Call send(batch) per batch, in parallel when there is more than one."""
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    if len(batches) == 1:
+        send(batches[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_UPSERT_WORKERS, len(batches))) as executor:
+        # list() re-raises the first failed batch
+        list(executor.map(send, batches))
+
+
+def _clean_str(value: str) -> str:
+    # Slicing is a no-op for short strings, so no length check is needed
+    return value[:MAX_METADATA_STRING_LENGTH]
+
+
+def _passthrough(value):
+    return value
+
+
+def _clean_list(value: list) -> list:
+    # Only lists of strings are allowed
+    return [str(v)[:MAX_METADATA_STRING_LENGTH] for v in value if v is not None]
+
+
+def _clean_other(value):
+    # Subclasses (str enums, numpy scalars...) miss the exact-type table
+    if isinstance(value, str):
+        return _clean_str(value)
+    if isinstance(value, (int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return _clean_list(value)
+    # Convert other types to string and truncate if needed
+    return str(value)[:MAX_METADATA_STRING_LENGTH]
+
+
+_METADATA_CLEANERS = {
+    str: _clean_str,
+    int: _passthrough,
+    float: _passthrough,
+    bool: _passthrough,
+    list: _clean_list,
+}
+
+
+@lru_cache(maxsize=1)
+def _get_index():
+    """
+    Pinecone client and index shared by every PineconeVectorStore in the
+    process, so the connection setup is paid once rather than per store.
+    lru_cache makes the first call thread-safe enough: a race at worst builds
+    a spare client that is then dropped.
+    """
+    client = Pinecone(api_key=settings.pinecone_api_key)
+    if settings.pinecone_host:
+        index = client.Index(host=settings.pinecone_host)
+    else:
+        index = client.Index(settings.pinecone_index)
+    return client, index
+
 
 class PineconeVectorStore(VectorStore):
     def __init__(self):
-        self.client = Pinecone(api_key=settings.pinecone_api_key)
-        if settings.pinecone_host:
-            self.index = self.client.Index(host=settings.pinecone_host)
-        else:
-            self.index = self.client.Index(settings.pinecone_index)
+        self.client, self.index = _get_index()
 
     def supports_text_records(self) -> bool:
         return hasattr(self.index, "upsert_records") and hasattr(self.index, "search")
@@ -22,7 +96,10 @@ class PineconeVectorStore(VectorStore):
     def upsert(self, vectors: list[dict]) -> None:
         if not vectors:
             return
-        self.index.upsert(vectors=vectors)
+        _send_in_batches(
+            lambda batch: self.index.upsert(vectors=batch),
+            vectors, UPSERT_VECTORS_BATCH_SIZE,
+        )
 
     def upsert_texts(self, records: list[dict]) -> None:
         if not records:
@@ -39,33 +116,25 @@ class PineconeVectorStore(VectorStore):
                 "id": str(record["id"]),
                 "text": str(record["text"]),
             }
-            
+
             # Add metadata fields directly at the top level, not nested under "metadata"
-            if "metadata" in record and record["metadata"]:
-                MAX_METADATA_STRING_LENGTH = 10000  # Pinecone's metadata limit per field
-                for key, value in record["metadata"].items():
+            metadata = record.get("metadata")
+            if metadata:
+                for key, value in metadata.items():
                     if value is None:
                         continue
-                    elif isinstance(value, str):
-                        # Truncate strings that are too long
-                        cleaned_record[key] = value[:MAX_METADATA_STRING_LENGTH] if len(value) > MAX_METADATA_STRING_LENGTH else value
-                    elif isinstance(value, (int, float, bool)):
-                        cleaned_record[key] = value
-                    elif isinstance(value, list):
-                        # Only allow list of strings
-                        cleaned_record[key] = [str(v)[:MAX_METADATA_STRING_LENGTH] if len(str(v)) > MAX_METADATA_STRING_LENGTH else str(v) for v in value if v is not None]
-                    else:
-                        # Convert other types to string and truncate if needed
-                        str_value = str(value)
-                        cleaned_record[key] = str_value[:MAX_METADATA_STRING_LENGTH] if len(str_value) > MAX_METADATA_STRING_LENGTH else str_value
-            
+                    cleaned_record[key] = _METADATA_CLEANERS.get(type(value), _clean_other)(value)
+
             cleaned_records.append(cleaned_record)
-        
+
         # Debug: log the first record to see what we're sending
         if cleaned_records:
             logger.info("Sample upsert_records record: %s", cleaned_records[0])
-        
-        self.index.upsert_records(namespace=namespace, records=cleaned_records)
+
+        _send_in_batches(
+            lambda batch: self.index.upsert_records(namespace=namespace, records=batch),
+            cleaned_records, UPSERT_RECORDS_BATCH_SIZE,
+        )
 
     def query(self, vector: list[float], top_k: int) -> list[dict]:
         response = self.index.query(vector=vector, top_k=top_k, include_metadata=True)
@@ -79,60 +148,71 @@ class PineconeVectorStore(VectorStore):
         return _normalize_matches(response)
 
 
+# Keys of a search() hit that are not metadata
+_HIT_SYSTEM_FIELDS = frozenset({"_id", "_score", "id", "score", "fields", "metadata", "_metadata", "text"})
+
+# Response class -> converter to a plain dict, resolved once per class
+_RESPONSE_CONVERTERS: dict = {dict: _passthrough}
+
+
+def _response_converter(response_type):
+    converter = _RESPONSE_CONVERTERS.get(response_type)
+    if converter is None:
+        if hasattr(response_type, "to_dict"):
+            converter = response_type.to_dict
+        elif hasattr(response_type, "model_dump"):
+            converter = response_type.model_dump
+        else:
+            converter = _passthrough
+        _RESPONSE_CONVERTERS[response_type] = converter
+    return converter
+
+
+# Hit keys that hold metadata; later sources win (metadata for backward compatibility)
+_HIT_METADATA_SOURCES = ("fields", "_metadata", "metadata")
+
+
+def _normalize_hit(hit: dict) -> dict:
+    metadata = {}
+    for source in _HIT_METADATA_SOURCES:
+        value = hit.get(source)
+        if isinstance(value, dict):
+            metadata.update(value)
+    # Some fields might be at top level; they only fill keys still missing
+    for key, value in hit.items():
+        if key not in _HIT_SYSTEM_FIELDS and key not in metadata:
+            metadata[key] = value
+    return {
+        "id": hit.get("_id", hit.get("id", "")),
+        "score": hit.get("_score", hit.get("score", 0.0)),
+        "metadata": metadata,
+    }
+
+
 def _normalize_matches(response) -> list[dict]:
     """
     Normalize Pinecone response to a consistent list of matches.
     Handles both query() and search() API responses.
     """
-    if hasattr(response, "to_dict"):
-        response = response.to_dict()
-    elif hasattr(response, "model_dump"):
-        response = response.model_dump()
-    
+    response = _response_converter(type(response))(response)
+
     if not isinstance(response, dict):
         return []
-    
+
     # Handle search() API response: {"result": {"hits": [...]}}
-    if "result" in response and isinstance(response["result"], dict):
-        hits = response["result"].get("hits", [])
+    result = response.get("result")
+    if isinstance(result, dict):
+        hits = result.get("hits")
         if hits:
             # Convert search() format to query() format for consistency
-            normalized = []
-            for hit in hits:
-                # Get metadata from fields, but also check top-level and _metadata
-                metadata = {}
-                
-                # First try 'fields' (most common for search API)
-                if "fields" in hit and isinstance(hit["fields"], dict):
-                    metadata.update(hit["fields"])
-                
-                # Also check '_metadata' key
-                if "_metadata" in hit and isinstance(hit["_metadata"], dict):
-                    metadata.update(hit["_metadata"])
-                
-                # Also check 'metadata' key (for backward compatibility)
-                if "metadata" in hit and isinstance(hit["metadata"], dict):
-                    metadata.update(hit["metadata"])
-                
-                # Some fields might be at top level (excluding known system fields)
-                system_fields = {"_id", "_score", "id", "score", "fields", "metadata", "_metadata", "text"}
-                for key, value in hit.items():
-                    if key not in system_fields and key not in metadata:
-                        metadata[key] = value
-                
-                normalized.append({
-                    "id": hit.get("_id", hit.get("id", "")),
-                    "score": hit.get("_score", hit.get("score", 0.0)),
-                    "metadata": metadata,
-                })
-            return normalized
-    
+            return [_normalize_hit(hit) for hit in hits]
+
     # Handle query() API response: {"matches": [...]}
     if "matches" in response:
         return response["matches"]
-    
+
     # Handle alternative formats
     if "results" in response:
         return response["results"]
-    
+
     return []
@@ -14,6 +14,5 @@ celery_app = Celery(
 )
 celery_app.conf.task_routes = {"app.workers.tasks.*": {"queue": "celery"}}
 
-# Use tier-based schedule from celery_beat_config
-# Runs poll_reddit_scheduled every hour, which checks user tiers
+# celery_beat_config is the only beat schedule; don't add entries here
 celery_app.conf.beat_schedule = CELERY_BEAT_SCHEDULE
@@ -1,29 +1,46 @@
 """
 Celery Beat Configuration for Periodic Tasks
 
-To enable automated Reddit polling, add this to your celery_app.py:
-
-from celery.schedules import crontab
-from app.workers.celery_beat_config import CELERY_BEAT_SCHEDULE
-
-app = Celery(...)
-app.conf.beat_schedule = CELERY_BEAT_SCHEDULE
+This is the single beat schedule; celery_app.py installs it as
+celery_app.conf.beat_schedule.
 
 Polling Schedule (based on subscription tier):
 - Starter plans: 2x/day at UTC 07:00 (Europe 8am CET) and 16:00 (US West 8am PST)
 - Growth/Pro plans: 4x/day at UTC 07:00, 11:00, 16:00, 22:00
 
-The task runs every hour and checks which users should be polled at that hour.
+Beat only fires the task at hours some tier is scheduled for (the union of
+POLL_TIMES_STARTER and POLL_TIMES_PREMIUM); the task then selects the tiers
+due at that hour.
 """
 
 from celery.schedules import crontab
 
+from app.core.config import settings
+
+
+# UTC hours at which any tier polls, e.g. "7,11,16,22"
+SCHEDULED_POLL_HOURS = ",".join(sorted(
+    {
+        h.strip()
+        for hours in (settings.POLL_TIMES_STARTER, settings.POLL_TIMES_PREMIUM)
+        for h in hours.split(",")
+        if h.strip()
+    },
+    key=int,
+))
+
 CELERY_BEAT_SCHEDULE = {
-    # Run the tier-based scheduled polling every hour
+    # Run the tier-based scheduled polling at the configured poll hours only
     # The task will check which users should be polled based on their tier
     "poll-reddit-scheduled": {
         "task": "app.workers.tasks.poll_reddit_scheduled",
-        "schedule": crontab(minute=0),  # Every hour at :00
+        "schedule": crontab(minute=0, hour=SCHEDULED_POLL_HOURS),
+    },
+
+    # Move the per-request API usage counters from Redis into usage_tracking
+    "flush-usage-counters": {
+        "task": "app.workers.tasks.flush_usage_counters",
+        "schedule": crontab(minute="*"),  # Every minute
     },
 
     # Legacy: Poll all active (kept for backward compatibility, disabled by default)
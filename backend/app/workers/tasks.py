@@ -261,7 +261,7 @@ def poll_reddit_scheduled() -> dict:
     """
     Tier-based scheduled Reddit polling task.
 
-    Runs every hour and checks which users should be polled based on their tier:
+    Runs at each configured poll hour and polls the tiers due at that hour:
     - Starter plans: 2x/day at UTC 07:00 and 16:00
     - Growth/Pro plans: 4x/day at UTC 07:00, 11:00, 16:00, 22:00
 
@@ -281,18 +281,36 @@ def poll_reddit_scheduled() -> dict:
         raise
 
 
+@celery_app.task(name="app.workers.tasks.flush_usage_counters")
+def flush_usage_counters() -> int:
+    """Write the API usage counters buffered in Redis to usage_tracking."""
+    from app.services.usage_tracking import flush_buffered_usage
+
+    db = SessionLocal()
+    try:
+        flushed = flush_buffered_usage(db)
+        if flushed:
+            logger.info(f"Flushed {flushed} usage counters")
+        return flushed
+    finally:
+        db.close()
+
+
 @celery_app.task(name="app.workers.tasks.poll_reddit_leads")
 def poll_reddit_leads() -> dict:
     """
     Legacy: Centralized Reddit polling task (polls all active campaigns)
     Kept for backward compatibility.
+
+    Scrapes each subreddit once here, then fans distribution out as one
+    distribute_to_campaign task per (subreddit, campaign).
     """
     db = SessionLocal()
     try:
         logger.info("Starting Reddit polling task (legacy)")
 
         polling_service = RedditPollingService()
-        summary = polling_service.poll_all_active_subreddits(db)
+        summary = polling_service.poll_all_active_subreddits(db, fan_out=True)
 
         logger.info(f"Reddit polling complete: {summary}")
         return summary
@@ -304,6 +322,33 @@ def poll_reddit_leads() -> dict:
         db.close()
 
 
+@celery_app.task(name="app.workers.tasks.distribute_to_campaign")
+def distribute_to_campaign(campaign_id: int, subreddit_name: str, posts: list[dict]) -> dict:
+    """
+    Score already-scraped posts from one subreddit for one campaign.
+    Enqueued by poll_reddit_leads. Not retried: posts a failed attempt saved
+    are skipped by any rerun (processed-id set and ON CONFLICT insert), so a
+    retry could not rescore them.
+    """
+    db = SessionLocal()
+    try:
+        polling_service = RedditPollingService()
+        return polling_service.poll_campaign_immediately(
+            db, campaign_id, trigger="scheduled",
+            prefetched_posts={subreddit_name: posts},
+        )
+
+    except ValueError as e:
+        # Campaign/user no longer eligible: retrying won't help
+        logger.warning(f"Skipping distribution of r/{subreddit_name} to campaign {campaign_id}: {e}")
+        return {"campaign_id": campaign_id, "skipped": str(e)}
+    except Exception as e:
+        logger.exception(f"Distribution of r/{subreddit_name} to campaign {campaign_id} failed")
+        raise
+    finally:
+        db.close()
+
+
 @celery_app.task(name="app.workers.tasks.poll_campaign_first")
 def poll_campaign_first(campaign_id: int) -> dict:
     """
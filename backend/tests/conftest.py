@@ -5,7 +5,7 @@ Pytest fixtures for moreach backend tests.
 import pytest
 from datetime import datetime, timedelta
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -172,10 +172,10 @@ def auth_headers_paid(test_user_paid: User) -> dict:
 @pytest.fixture
 def mock_stripe():
     """Mock Stripe API for testing."""
-    with patch("stripe.Customer.create") as mock_customer, \
-         patch("stripe.checkout.Session.create") as mock_checkout, \
-         patch("stripe.billing_portal.Session.create") as mock_portal, \
-         patch("stripe.Subscription.retrieve") as mock_subscription:
+    with patch("stripe.Customer.create_async", new_callable=AsyncMock) as mock_customer, \
+         patch("stripe.checkout.Session.create_async", new_callable=AsyncMock) as mock_checkout, \
+         patch("stripe.billing_portal.Session.create_async", new_callable=AsyncMock) as mock_portal, \
+         patch("stripe.Subscription.retrieve_async", new_callable=AsyncMock) as mock_subscription:
 
         # Mock customer creation
         mock_customer.return_value = MagicMock(id="cus_test_new")
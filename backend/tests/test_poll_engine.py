@@ -4,19 +4,77 @@ Tests for unified PollEngine and PollJob model.
 
 import pytest
 import asyncio
+import json
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import ANY, patch, MagicMock, AsyncMock
 from sqlalchemy.orm import Session
 
 from app.models.tables import (
     User, RedditCampaign, RedditCampaignSubreddit, RedditLead,
     RedditCampaignStatus, RedditLeadStatus,
     PollJob, PollJobStatus,
-    SubscriptionTier,
+    SubscriptionTier, GlobalSubredditPoll, APIType,
 )
+from app.services.reddit import poll_engine
 from app.services.reddit.poll_engine import PollEngine, PollEngineCallbacks, run_poll_sync
 
 
+class FakeRedis:
+    """In-memory stand-in for the Redis calls made while polling."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def expire(self, key, ttl):
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+        return lambda *args: self.commands.append((method, args))
+
+    def execute(self):
+        return [method(*args) for method, args in self.commands]
+
+
+@pytest.fixture(autouse=True)
+def fake_redis_client():
+    """Keep polls off any real Redis, so processed post ids can't leak between tests or runs."""
+    client = FakeRedis()
+    with patch("app.workers.tasks.get_redis_client", return_value=client):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def clear_fetch_cache():
+    """Keep the process-wide subreddit fetch cache from leaking between tests."""
+    poll_engine._fetch_cache.clear()
+    yield
+    poll_engine._fetch_cache.clear()
+
+
 class TestPollJobModel:
     """Tests for the PollJob model."""
 
@@ -191,7 +249,7 @@ class TestPollEngine:
     ):
         """Test PollEngine when subreddits return no new posts."""
         mock_provider = MagicMock()
-        mock_provider.scrape_subreddit.return_value = []
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[])
         mock_provider_fn.return_value = mock_provider
 
         engine = PollEngine()
@@ -203,9 +261,44 @@ class TestPollEngine:
         assert poll_job.posts_fetched == 0
         assert poll_job.leads_created == 0
 
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.BatchScoringService")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    def test_poll_engine_fetch_error_does_not_stop_other_subreddits(
+        self, mock_email, mock_scoring_cls, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test a failed fetch is reported and the remaining subreddits still run."""
+        async def mock_scrape(subreddit_name, **kwargs):
+            if subreddit_name == "programming":
+                raise RuntimeError("actor failed")
+            return []
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(side_effect=mock_scrape)
+        mock_provider_fn.return_value = mock_provider
+
+        progress_events = []
+
+        class TrackingCallbacks(PollEngineCallbacks):
+            async def on_progress(self, **kwargs):
+                progress_events.append(kwargs)
+
+        engine = PollEngine()
+        engine.reddit_provider = mock_provider
+
+        poll_job = asyncio.run(engine.run_poll(
+            db, test_campaign_with_subreddits.id, callbacks=TrackingCallbacks()
+        ))
+
+        assert poll_job.status == PollJobStatus.COMPLETED
+        assert mock_provider.scrape_subreddit_async.await_count == 2
+        errors = [e for e in progress_events if e.get("error")]
+        assert [e["subreddit"] for e in errors] == ["programming"]
+
     @patch("app.services.reddit.poll_engine.get_reddit_provider")
     @patch("app.services.reddit.poll_engine.send_poll_summary_email")
-    @patch("app.services.reddit.poll_engine.track_api_call")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
     def test_poll_engine_full_pipeline(
         self, mock_track, mock_email, mock_provider_fn,
         db: Session, test_campaign_with_subreddits: RedditCampaign, test_user: User
@@ -213,7 +306,7 @@ class TestPollEngine:
         """Test PollEngine full pipeline: fetch → save → score → cleanup → suggestions → email."""
         # Mock Reddit provider
         mock_provider = MagicMock()
-        mock_provider.scrape_subreddit.return_value = [
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[
             {
                 "id": "post_high",
                 "title": "Need code review tool",
@@ -236,21 +329,19 @@ class TestPollEngine:
                 "created_utc": datetime.utcnow().timestamp(),
                 "subreddit_name": "programming",
             },
-        ]
+        ])
         mock_provider_fn.return_value = mock_provider
 
         # Mock batch scoring service
         mock_scoring = MagicMock()
-        # batch_quick_score returns scored posts
-        async def mock_batch_score(posts, desc, **kwargs):
-            results = []
+        # iter_quick_score yields scored posts one batch at a time
+        async def mock_iter_score(posts, desc, **kwargs):
             for p in posts:
                 if p["id"] == "post_high":
-                    results.append({**p, "relevancy_score": 90, "relevancy_reason": "Highly relevant", "has_suggestions": False})
+                    yield [{**p, "relevancy_score": 90, "relevancy_reason": "Highly relevant", "has_suggestions": False}]
                 else:
-                    results.append({**p, "relevancy_score": 30, "relevancy_reason": "Not relevant", "has_suggestions": False})
-            return results
-        mock_scoring.batch_quick_score = mock_batch_score
+                    yield [{**p, "relevancy_score": 30, "relevancy_reason": "Not relevant", "has_suggestions": False}]
+        mock_scoring.iter_quick_score = mock_iter_score
         mock_scoring.get_llm_calls_made.return_value = 1
 
         # suggestions for high score
@@ -291,21 +382,137 @@ class TestPollEngine:
         assert high_lead is not None
         assert high_lead.relevancy_score == 90
         assert high_lead.poll_job_id == poll_job.id
+        assert high_lead.status == RedditLeadStatus.NEW
+        assert high_lead.discovered_at is not None
+        assert high_lead.has_suggestions is True
+        assert high_lead.suggested_comment == "Great question!"
+        assert high_lead.suggestions_generated_at is not None
+        assert poll_job.suggestions_generated == 1
 
         # post_low should NOT exist (deleted due to score < 50)
         low_lead = next((l for l in surviving_leads if l.reddit_post_id == "post_low"), None)
         assert low_lead is None
 
+        # API usage flushed once for the whole poll
+        mock_track.assert_called_once()
+        _, user_id, call_counts = mock_track.call_args.args
+        assert user_id == test_user.id
+        assert sum(call_counts.values()) >= 2
+
+        # Summary email carries only the emailed columns
+        mock_email.assert_called_once()
+        email_kwargs = mock_email.call_args.kwargs
+        assert email_kwargs["high_quality_count"] == 1
+        assert email_kwargs["top_leads"] == [{
+            "title": "Need code review tool",
+            "subreddit_name": "programming",
+            "relevancy_score": 90,
+            "post_url": "https://reddit.com/r/programming/post_high",
+        }]
+
     @patch("app.services.reddit.poll_engine.get_reddit_provider")
     @patch("app.services.reddit.poll_engine.send_poll_summary_email")
-    @patch("app.services.reddit.poll_engine.track_api_call")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
+    def test_subreddits_scored_concurrently(
+        self, mock_track, mock_email, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test scoring for different subreddits overlaps and LLM usage is tracked once."""
+        async def mock_scrape(subreddit_name, **kwargs):
+            return [{
+                "id": f"post_{subreddit_name}",
+                "title": "Need code review tool",
+                "author": "dev_user",
+                "url": f"https://reddit.com/r/{subreddit_name}/1",
+                "created_utc": datetime.utcnow().timestamp(),
+                "subreddit_name": subreddit_name,
+            }]
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(side_effect=mock_scrape)
+        mock_provider_fn.return_value = mock_provider
+
+        in_flight = 0
+        max_in_flight = 0
+        mock_scoring = MagicMock()
+        mock_scoring.llm_calls = 0
+        mock_scoring.get_llm_calls_made.side_effect = lambda: mock_scoring.llm_calls
+
+        async def mock_iter_score(posts, desc, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            mock_scoring.llm_calls += 1
+            yield [{**p, "relevancy_score": 70, "relevancy_reason": "ok"} for p in posts]
+        mock_scoring.iter_quick_score = mock_iter_score
+
+        engine = PollEngine()
+        engine.reddit_provider = mock_provider
+        engine.scoring_service = mock_scoring
+
+        poll_job = asyncio.run(engine.run_poll(db, test_campaign_with_subreddits.id))
+
+        assert poll_job.leads_created == 2
+        assert max_in_flight == 2
+        call_counts = mock_track.call_args.args[2]
+        assert call_counts[APIType.LLM_GEMINI] + call_counts[APIType.LLM_OPENAI] == 2
+
+    @patch("app.services.reddit.poll_engine.MAX_CONCURRENT_SCORING", 1)
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
+    def test_subreddit_posts_held_until_scoring_slot_frees(
+        self, mock_track, mock_email, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test a fetched subreddit waits for a scoring slot before its leads are saved."""
+        async def mock_scrape(subreddit_name, **kwargs):
+            return [{
+                "id": f"post_{subreddit_name}",
+                "title": "Need code review tool",
+                "author": "dev_user",
+                "url": f"https://reddit.com/r/{subreddit_name}/1",
+                "created_utc": datetime.utcnow().timestamp(),
+                "subreddit_name": subreddit_name,
+            }]
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(side_effect=mock_scrape)
+        mock_provider_fn.return_value = mock_provider
+
+        saved_when_scoring = []
+        mock_scoring = MagicMock()
+        mock_scoring.get_llm_calls_made.return_value = 0
+
+        async def mock_iter_score(posts, desc, **kwargs):
+            saved_when_scoring.append(db.query(RedditLead).filter(
+                RedditLead.campaign_id == test_campaign_with_subreddits.id
+            ).count())
+            await asyncio.sleep(0.05)
+            yield [{**p, "relevancy_score": 70, "relevancy_reason": "ok"} for p in posts]
+        mock_scoring.iter_quick_score = mock_iter_score
+
+        engine = PollEngine()
+        engine.reddit_provider = mock_provider
+        engine.scoring_service = mock_scoring
+
+        poll_job = asyncio.run(engine.run_poll(db, test_campaign_with_subreddits.id))
+
+        assert poll_job.leads_created == 2
+        assert saved_when_scoring == [1, 2]
+
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
     def test_poll_engine_callbacks(
         self, mock_track, mock_email, mock_provider_fn,
         db: Session, test_campaign_with_subreddits: RedditCampaign, test_user: User
     ):
         """Test that PollEngine calls callbacks correctly."""
         mock_provider = MagicMock()
-        mock_provider.scrape_subreddit.return_value = [
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[
             {
                 "id": "cb_post",
                 "title": "Callback test post",
@@ -317,13 +524,13 @@ class TestPollEngine:
                 "created_utc": datetime.utcnow().timestamp(),
                 "subreddit_name": "programming",
             }
-        ]
+        ])
         mock_provider_fn.return_value = mock_provider
 
         mock_scoring = MagicMock()
         async def mock_score(posts, desc, **kwargs):
-            return [{**p, "relevancy_score": 80, "relevancy_reason": "Good", "has_suggestions": False} for p in posts]
-        mock_scoring.batch_quick_score = mock_score
+            yield [{**p, "relevancy_score": 80, "relevancy_reason": "Good", "has_suggestions": False} for p in posts]
+        mock_scoring.iter_quick_score = mock_score
         mock_scoring.get_llm_calls_made.return_value = 1
         async def mock_sugg(posts, desc, **kwargs):
             return posts
@@ -342,6 +549,8 @@ class TestPollEngine:
                 lead_calls.append(lead.id)
 
             async def on_complete(self, stats):
+                # The summary email goes out only after completion is reported
+                assert not mock_email.called
                 complete_calls.append(stats)
 
         engine = PollEngine()
@@ -364,6 +573,422 @@ class TestPollEngine:
         # Should have exactly one complete event
         assert len(complete_calls) == 1
         assert "total_leads" in complete_calls[0]
+        assert complete_calls[0]["relevancy_distribution"] == {
+            "90+": 0, "80-89": 1, "70-79": 0, "60-69": 0, "50-59": 0
+        }
+        mock_email.assert_called_once()
+
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
+    def test_poll_engine_prefetched_posts(
+        self, mock_track, mock_email, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test prefetched posts are scored for their subreddit only, without fetching."""
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[])
+        mock_provider_fn.return_value = mock_provider
+
+        mock_scoring = MagicMock()
+        async def mock_iter_score(posts, desc, **kwargs):
+            yield [{**p, "relevancy_score": 80, "relevancy_reason": "Relevant"} for p in posts]
+        mock_scoring.iter_quick_score = mock_iter_score
+        mock_scoring.get_llm_calls_made.return_value = 1
+
+        engine = PollEngine()
+        engine.reddit_provider = mock_provider
+        engine.scoring_service = mock_scoring
+
+        prefetched = {"webdev": [{
+            "id": "pre_1",
+            "title": "Which framework?",
+            "content": "Choosing a web framework",
+            "author": "someone",
+            "url": "https://reddit.com/r/webdev/pre_1",
+            "created_utc": datetime.utcnow().timestamp(),
+            "subreddit_name": "webdev",
+        }]}
+
+        poll_job = asyncio.run(engine.run_poll(
+            db, test_campaign_with_subreddits.id, trigger="scheduled", prefetched_posts=prefetched
+        ))
+
+        mock_provider.scrape_subreddit_async.assert_not_called()
+        assert poll_job.status == PollJobStatus.COMPLETED
+        assert poll_job.subreddits_polled == 1
+        assert poll_job.leads_created == 1
+        assert db.query(GlobalSubredditPoll).count() == 0
+
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.BatchScoringService")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
+    def test_fetch_cache_shared_across_polls(
+        self, mock_track, mock_email, mock_scoring_cls, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test a second poll within the TTL reuses fetches and records no Reddit API calls."""
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[])
+        mock_provider_fn.return_value = mock_provider
+
+        asyncio.run(PollEngine().run_poll(db, test_campaign_with_subreddits.id))
+        asyncio.run(PollEngine().run_poll(db, test_campaign_with_subreddits.id))
+
+        assert mock_provider.scrape_subreddit_async.await_count == 2
+        first_counts = mock_track.call_args_list[0].args[2]
+        second_counts = mock_track.call_args_list[1].args[2]
+        assert sum(first_counts.values()) == 2
+        assert sum(second_counts.values()) == 0
+
+    def test_fetch_cache_keeps_fuller_payload(self):
+        """Test an expired entry is not replaced by a shorter (e.g. failed) fetch."""
+        engine = PollEngine()
+        engine.reddit_provider = MagicMock()
+        engine.reddit_provider.scrape_subreddit_async = AsyncMock(return_value=[])
+
+        cached_posts = [{"id": "a"}, {"id": "b"}]
+        expired_at = poll_engine.time.monotonic() - poll_engine.FETCH_CACHE_TTL_SECONDS - 1
+        poll_engine._fetch_cache[("programming", "new", "day", 20)] = (expired_at, cached_posts)
+
+        posts, fetched = asyncio.run(engine._fetch_subreddit("programming", 20))
+
+        assert fetched is True
+        assert posts == cached_posts
+
+    def test_concurrent_fetches_share_one_scrape(self):
+        """Test polls in separate threads/event loops share an in-flight scrape of the same subreddit."""
+        import concurrent.futures
+
+        both_waiting = threading.Barrier(2)
+        posts = [{"id": "a"}]
+
+        async def slow_scrape(**kwargs):
+            await asyncio.sleep(0.2)
+            return posts
+
+        engine = PollEngine()
+        engine.reddit_provider = MagicMock()
+        engine.reddit_provider.scrape_subreddit_async = AsyncMock(side_effect=slow_scrape)
+
+        def poll_in_thread():
+            both_waiting.wait()
+            return asyncio.run(engine._fetch_subreddit("programming", 20))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: poll_in_thread(), range(2)))
+
+        assert engine.reddit_provider.scrape_subreddit_async.await_count == 1
+        assert sorted(fetched for _, fetched in results) == [False, True]
+        assert all(result_posts == posts for result_posts, _ in results)
+        assert poll_engine._inflight_fetches == {}
+
+    def test_cancelled_follower_does_not_break_shared_fetch(self):
+        """Test cancelling one follower of an in-flight scrape leaves the leader and other followers intact."""
+        posts = [{"id": "a"}]
+
+        async def scenario():
+            scraping = asyncio.Event()
+
+            async def slow_scrape(**kwargs):
+                scraping.set()
+                await asyncio.sleep(0.1)
+                return posts
+
+            engine = PollEngine()
+            engine.reddit_provider = MagicMock()
+            engine.reddit_provider.scrape_subreddit_async = AsyncMock(side_effect=slow_scrape)
+
+            leader = asyncio.create_task(engine._fetch_subreddit("programming", 20))
+            await scraping.wait()
+            cancelled = asyncio.create_task(engine._fetch_subreddit("programming", 20))
+            follower = asyncio.create_task(engine._fetch_subreddit("programming", 20))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+            results = await asyncio.gather(leader, follower)
+            return results, cancelled.cancelled()
+
+        (leader_result, follower_result), was_cancelled = asyncio.run(scenario())
+
+        assert was_cancelled
+        assert leader_result == (posts, True)
+        assert follower_result == (posts, False)
+        assert poll_engine._inflight_fetches == {}
+
+    def test_cancelled_fetch_still_queues_an_entry(self):
+        """Test a cancelled producer still hands run_poll an entry, so it never waits forever."""
+        async def scenario():
+            engine = PollEngine()
+            engine.reddit_provider = MagicMock()
+
+            async def hanging_scrape(**kwargs):
+                await asyncio.sleep(10)
+
+            engine.reddit_provider.scrape_subreddit_async = AsyncMock(side_effect=hanging_scrape)
+            queue = asyncio.Queue()
+            task = asyncio.create_task(engine._fetch_into_queue(
+                queue, asyncio.Semaphore(1), "programming", 20
+            ))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return queue.get_nowait()
+
+        sub_name, queued_posts, fetched, error = asyncio.run(scenario())
+
+        assert (sub_name, queued_posts, fetched) == ("programming", [], True)
+        assert "cancelled" in str(error)
+
+    def test_concurrent_cache_eviction(self):
+        """Test threads filling the fetch cache past its cap evict without errors."""
+        import concurrent.futures
+
+        engine = PollEngine()
+        engine.reddit_provider = MagicMock()
+        engine.reddit_provider.scrape_subreddit_async = AsyncMock(return_value=[{"id": "a"}])
+
+        def fetch_many(thread_no):
+            for i in range(50):
+                asyncio.run(engine._fetch_subreddit(f"sub{thread_no}_{i}", 20))
+
+        with patch.object(poll_engine, "FETCH_CACHE_MAX_ENTRIES", 4), \
+             concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(fetch_many, range(8)))
+
+        assert len(poll_engine._fetch_cache) == 4
+
+    def test_run_poll_sync_reuses_thread_loop(self):
+        """Test synchronous polls on one thread share an event loop instead of creating one per call."""
+        loops = []
+
+        async def fake_run_poll(self, db, campaign_id, trigger, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return campaign_id
+
+        with patch.object(PollEngine, "__init__", lambda self: None), \
+             patch.object(PollEngine, "run_poll", fake_run_poll):
+            assert run_poll_sync(MagicMock(), 1) == 1
+            assert run_poll_sync(MagicMock(), 2) == 2
+            other_thread = threading.Thread(target=run_poll_sync, args=(MagicMock(), 3))
+            other_thread.start()
+            other_thread.join()
+
+        assert loops[0] is loops[1]
+        assert loops[2] is not loops[0]
+
+    def test_poll_thread_pool_closes_thread_loops(self):
+        """Test pool threads reuse their loop and the loops are drained and closed on exit."""
+        from app.services.reddit.poll_engine import poll_thread_pool
+
+        loops = []
+        finalized = []
+
+        async def stream():
+            try:
+                yield 1
+                yield 2
+            finally:
+                finalized.append(True)
+
+        async def fake_run_poll(self, db, campaign_id, trigger, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            # Left suspended, like an abandoned iter_quick_score
+            gen = stream()
+            await gen.__anext__()
+            loops.append(gen)
+            return campaign_id
+
+        with patch.object(PollEngine, "__init__", lambda self: None), \
+             patch.object(PollEngine, "run_poll", fake_run_poll), \
+             patch("app.services.reddit.poll_engine.aclose_provider_clients",
+                   new_callable=AsyncMock) as mock_aclose:
+            with poll_thread_pool(1) as executor:
+                assert list(executor.map(lambda i: run_poll_sync(MagicMock(), i), [1, 2])) == [1, 2]
+
+        assert loops[0] is loops[2]
+        assert loops[0].is_closed()
+        assert finalized == [True, True]
+        assert mock_aclose.await_count == 1
+
+    def test_unseen_posts(self):
+        """Test posts already seen in this poll are dropped."""
+        engine = PollEngine()
+        seen = {"crossposted"}
+        posts = [{"id": "crossposted"}, {"id": "fresh"}, {"id": "fresh"}]
+
+        unseen = engine._unseen_posts(posts, seen)
+
+        assert unseen == [{"id": "fresh"}]
+        assert seen == {"crossposted", "fresh"}
+
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
+    def test_existing_leads_skipped_without_lookup(
+        self, mock_track, mock_email, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test posts with an existing lead are skipped by the insert and never scored."""
+        db.add(RedditLead(
+            campaign_id=test_campaign_with_subreddits.id,
+            reddit_post_id="saved",
+            subreddit_name="programming",
+            title="Saved earlier",
+            author="author",
+            post_url="https://reddit.com/saved",
+            created_utc=datetime.utcnow().timestamp(),
+        ))
+        db.commit()
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[
+            {"id": "saved", "title": "Saved earlier", "created_utc": 1.0},
+            {"id": "fresh", "title": "New post", "created_utc": 2.0},
+        ])
+        mock_provider_fn.return_value = mock_provider
+
+        scored_ids = []
+        mock_scoring = MagicMock()
+        mock_scoring.get_llm_calls_made.return_value = 0
+
+        async def mock_iter_score(posts, desc, **kwargs):
+            scored_ids.extend(p["id"] for p in posts)
+            yield [{**p, "relevancy_score": 70, "relevancy_reason": "ok"} for p in posts]
+        mock_scoring.iter_quick_score = mock_iter_score
+
+        engine = PollEngine()
+        engine.reddit_provider = mock_provider
+        engine.scoring_service = mock_scoring
+
+        poll_job = asyncio.run(engine.run_poll(db, test_campaign_with_subreddits.id))
+
+        assert scored_ids == ["fresh"]
+        assert poll_job.posts_fetched == 1
+        assert db.query(RedditLead).filter_by(reddit_post_id="saved").count() == 1
+
+    @patch("app.services.reddit.poll_engine.get_reddit_provider")
+    @patch("app.services.reddit.poll_engine.send_poll_summary_email")
+    @patch("app.services.reddit.poll_engine.track_api_calls_bulk")
+    def test_deleted_low_score_posts_not_rescored(
+        self, mock_track, mock_email, mock_provider_fn,
+        db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test posts whose low-score leads were deleted are remembered and not re-scored."""
+        sets = {}
+        pipe = MagicMock()
+        pipe.sadd.side_effect = lambda key, *ids: sets.setdefault(key, set()).update(ids)
+        redis_client = MagicMock()
+        redis_client.smembers.side_effect = lambda key: set(sets.get(key, ()))
+        redis_client.pipeline.return_value = pipe
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[
+            {"id": "meh", "title": "Unrelated post", "created_utc": 1.0},
+        ])
+        mock_provider_fn.return_value = mock_provider
+
+        scored_ids = []
+        mock_scoring = MagicMock()
+        mock_scoring.get_llm_calls_made.return_value = 0
+
+        async def mock_iter_score(posts, desc, **kwargs):
+            scored_ids.extend(p["id"] for p in posts)
+            yield [{**p, "relevancy_score": 10, "relevancy_reason": "off-topic"} for p in posts]
+        mock_scoring.iter_quick_score = mock_iter_score
+
+        engine = PollEngine()
+        engine.reddit_provider = mock_provider
+        engine.scoring_service = mock_scoring
+
+        with patch("app.workers.tasks.get_redis_client", return_value=redis_client):
+            asyncio.run(engine.run_poll(db, test_campaign_with_subreddits.id, bypass_cache=True))
+            assert db.query(RedditLead).filter_by(reddit_post_id="meh").count() == 0
+            asyncio.run(engine.run_poll(db, test_campaign_with_subreddits.id, bypass_cache=True))
+
+        assert scored_ids == ["meh"]
+        assert sets == {f"campaign:{test_campaign_with_subreddits.id}:post_ids": {"meh"}}
+
+    def test_keyword_prefilter(self):
+        """Test posts without shared words are dropped only beyond the top-K."""
+        tokens = poll_engine._tokenize("We build a code review tool for developers")
+        assert tokens == {"build", "code", "review", "tool", "developers"}
+
+        relevant = {"id": "r", "title": "Best code review tool?", "content": ""}
+        noise = [{"id": f"n{i}", "title": "Cute cat pictures", "content": ""} for i in range(3)]
+        posts = noise + [relevant]
+
+        # Small batches are never filtered
+        assert poll_engine._keyword_prefilter(posts, tokens, 1, top_k=5) == posts
+        # The best match plus the top-K fill survive; the rest are skipped
+        assert poll_engine._keyword_prefilter(posts, tokens, 1, top_k=2) == [noise[0], relevant]
+        assert poll_engine._keyword_prefilter(posts, tokens, 0, top_k=2) == posts
+
+    def test_post_tokens_memoized_across_campaigns(self):
+        """Test the same scraped post is tokenized once however many campaigns prefilter it."""
+        poll_engine._post_tokens.cache_clear()
+        posts = [{"id": f"p{i}", "title": f"Post {i} about code review", "content": None} for i in range(4)]
+
+        for description in ("code review tool", "review automation"):
+            poll_engine._keyword_prefilter(posts, poll_engine._tokenize(description), 1, top_k=1)
+
+        info = poll_engine._post_tokens.cache_info()
+        assert (info.misses, info.hits) == (4, 4)
+
+    def test_save_unscored_leads_skips_existing_posts(self, db: Session, test_campaign: RedditCampaign):
+        """Test a post already saved for the campaign is skipped rather than failing the batch."""
+        db.add(RedditLead(
+            campaign_id=test_campaign.id,
+            reddit_post_id="dup",
+            subreddit_name="programming",
+            title="Already saved",
+            author="author",
+            post_url="https://reddit.com/dup",
+            created_utc=datetime.utcnow().timestamp(),
+        ))
+        db.commit()
+
+        engine = PollEngine()
+        lead_ids = engine._save_unscored_leads(db, test_campaign.id, None, [
+            {"id": "dup", "title": "Duplicate", "subreddit_name": "programming"},
+            {"id": "fresh", "title": "New post", "subreddit_name": "programming"},
+        ])
+
+        assert list(lead_ids) == ["fresh"]
+        assert db.query(RedditLead).filter(RedditLead.campaign_id == test_campaign.id).count() == 2
+
+    def test_save_unscored_leads_drops_malformed_posts(self, db: Session, test_campaign: RedditCampaign):
+        """Test posts missing an id or title are skipped without failing the valid ones."""
+        engine = PollEngine()
+        lead_ids = engine._save_unscored_leads(db, test_campaign.id, None, [
+            {"title": "No id", "subreddit_name": "programming"},
+            {"id": "untitled", "subreddit_name": "programming"},
+            {"id": "ok", "title": "Valid post", "subreddit_name": "programming"},
+        ])
+
+        assert list(lead_ids) == ["ok"]
+        assert db.query(RedditLead).filter(RedditLead.campaign_id == test_campaign.id).count() == 1
+
+    def test_upsert_poll_records(self, db: Session):
+        """Test GlobalSubredditPoll stats are inserted, then incremented on conflict."""
+        engine = PollEngine()
+
+        first_poll = datetime(2026, 1, 1, 12, 0)
+        second_poll = first_poll + timedelta(hours=1)
+
+        engine._upsert_poll_records(db, {"programming": 3, "webdev": 0}, polled_at=first_poll)
+        engine._upsert_poll_records(db, {"programming": 2}, polled_at=second_poll)
+
+        records = {
+            r.subreddit_name: r
+            for r in db.query(GlobalSubredditPoll).all()
+        }
+        assert records["programming"].poll_count == 2
+        assert records["programming"].total_posts_found == 5
+        assert records["programming"].last_poll_at == second_poll
+        assert records["webdev"].poll_count == 1
+        assert records["webdev"].total_posts_found == 0
 
     def test_poll_engine_trigger_types(self, db: Session, test_campaign_with_subreddits: RedditCampaign):
         """Test different trigger types create PollJob with correct trigger."""
@@ -448,7 +1073,7 @@ class TestPollEngineUserValidation:
     ):
         """Test PollEngine allows poll for active user with valid subscription."""
         mock_provider = MagicMock()
-        mock_provider.scrape_subreddit.return_value = []
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[])
         mock_provider_fn.return_value = mock_provider
 
         engine = PollEngine()
@@ -471,7 +1096,7 @@ class TestPollEngineUserValidation:
         db.commit()
 
         mock_provider = MagicMock()
-        mock_provider.scrape_subreddit.return_value = []
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=[])
         mock_provider_fn.return_value = mock_provider
 
         engine = PollEngine()
@@ -484,6 +1109,16 @@ class TestPollEngineUserValidation:
 class TestSchedulerIntegration:
     """Tests for scheduler using the new PollEngine."""
 
+    @pytest.fixture
+    def scheduler_sessions(self, db: Session):
+        """SessionLocal stand-in: the test session for the streaming query,
+        throwaway sessions for the poll worker threads."""
+        def make_session():
+            if threading.current_thread() is threading.main_thread():
+                return db
+            return MagicMock()
+        return make_session
+
     def test_scheduler_passes_trigger(self, db: Session, test_campaign_with_subreddits: RedditCampaign):
         """Test that scheduler passes trigger='scheduled' through polling service."""
         from app.services.reddit.polling import RedditPollingService
@@ -502,11 +1137,413 @@ class TestSchedulerIntegration:
             )
 
             mock_run.assert_called_once_with(
-                db, test_campaign_with_subreddits.id, trigger="scheduled"
+                db, test_campaign_with_subreddits.id, trigger="scheduled",
+                prefetched_posts=None, bypass_cache=False,
             )
             assert result["poll_job_id"] == 1
             assert result["total_leads_created"] == 5
 
+    def test_run_scheduled_polls_polls_each_active_campaign(
+        self, db: Session, test_user: User, test_campaign: RedditCampaign, scheduler_sessions
+    ):
+        """Test scheduled run polls every active campaign of a due user and skips paused ones."""
+        from app.services.reddit import scheduler
+
+        second = RedditCampaign(
+            user_id=test_user.id,
+            business_description="Second product",
+            status=RedditCampaignStatus.ACTIVE,
+        )
+        paused = RedditCampaign(
+            user_id=test_user.id,
+            business_description="Paused product",
+            status=RedditCampaignStatus.PAUSED,
+        )
+        db.add_all([second, paused])
+        db.commit()
+        expected = {test_campaign.id, second.id}
+
+        with patch.object(scheduler, "SessionLocal", side_effect=scheduler_sessions), \
+                patch.object(scheduler.settings, "ENABLE_SCHEDULED_POLLING", True), \
+                patch.object(scheduler.RedditPollingService, "poll_campaign_immediately",
+                             return_value={}) as mock_poll:
+            stats = scheduler.run_scheduled_polls(current_hour=7)
+
+        assert {c.args[1] for c in mock_poll.call_args_list} == expected
+        assert stats["users_checked"] == 1
+        assert stats["campaigns_polled"] == 2
+        assert stats["errors"] == 0
+
+    def test_run_scheduled_polls_isolates_campaign_errors(
+        self, db: Session, test_user: User, test_campaign: RedditCampaign, scheduler_sessions
+    ):
+        """Test one failing campaign poll doesn't stop the others in the pool."""
+        from app.services.reddit import scheduler
+
+        second = RedditCampaign(
+            user_id=test_user.id,
+            business_description="Second product",
+            status=RedditCampaignStatus.ACTIVE,
+        )
+        db.add(second)
+        db.commit()
+        failing_id = test_campaign.id
+
+        def fake_poll(session, campaign_id, trigger):
+            if campaign_id == failing_id:
+                raise RuntimeError("provider down")
+            return {"total_leads_created": 1}
+
+        with patch.object(scheduler, "SessionLocal", side_effect=scheduler_sessions), \
+                patch.object(scheduler.settings, "ENABLE_SCHEDULED_POLLING", True), \
+                patch.object(scheduler.RedditPollingService, "poll_campaign_immediately",
+                             side_effect=fake_poll) as mock_poll:
+            stats = scheduler.run_scheduled_polls(current_hour=7)
+
+        assert mock_poll.call_count == 2
+        assert stats["campaigns_polled"] == 1
+        assert stats["errors"] == 1
+
+    def test_run_scheduled_polls_filters_due_users_in_query(
+        self, db: Session, test_user: User, test_campaign: RedditCampaign, scheduler_sessions
+    ):
+        """Test users off-schedule or past their trial end are never loaded."""
+        from app.services.reddit import scheduler
+
+        # run_scheduled_polls closes the session, detaching the fixtures
+        user_id, campaign_id = test_user.id, test_campaign.id
+
+        with patch.object(scheduler, "SessionLocal", side_effect=scheduler_sessions), \
+                patch.object(scheduler.settings, "ENABLE_SCHEDULED_POLLING", True), \
+                patch.object(scheduler.RedditPollingService, "poll_campaign_immediately",
+                             return_value={}) as mock_poll:
+            # Trial users poll on the starter schedule, which skips 11:00
+            off_hour = scheduler.run_scheduled_polls(current_hour=11)
+
+            db.query(User).filter(User.id == user_id).update(
+                {User.trial_ends_at: datetime.utcnow() - timedelta(days=1)}
+            )
+            db.commit()
+            expired = scheduler.run_scheduled_polls(current_hour=7)
+
+            with patch.object(scheduler.settings, "ADMIN_USER_IDS", str(user_id)):
+                admin = scheduler.run_scheduled_polls(current_hour=7)
+
+        assert off_hour["users_checked"] == 0
+        assert expired["users_checked"] == 0
+        assert admin["campaigns_polled"] == 1
+        mock_poll.assert_called_once_with(ANY, campaign_id, trigger="scheduled")
+
+    def test_beat_schedule_has_single_scheduled_poll_entry(self):
+        """Test the worker uses the one beat schedule, with one tier-based polling entry."""
+        from app.services.reddit import scheduler
+        from app.workers.celery_app import celery_app
+        from app.workers.celery_beat_config import CELERY_BEAT_SCHEDULE
+
+        assert celery_app.conf.beat_schedule is CELERY_BEAT_SCHEDULE
+        poll_entries = [
+            entry for entry in CELERY_BEAT_SCHEDULE.values()
+            if entry["task"] == "app.workers.tasks.poll_reddit_scheduled"
+        ]
+        assert len(poll_entries) == 1
+        # Fires at exactly the hours some tier is scheduled for
+        assert poll_entries[0]["schedule"].hour == set(
+            scheduler._STARTER_HOURS | scheduler._PREMIUM_HOURS
+        )
+
+
+class TestCentralizedPolling:
+    """Tests for the legacy centralized polling path."""
+
+    @pytest.fixture
+    def fake_redis(self):
+        """In-memory stand-in for the shared scrape cache."""
+        store = {}
+        client = MagicMock()
+        client.get.side_effect = store.get
+        client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+        with patch("app.workers.tasks.get_redis_client", return_value=client):
+            yield store
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_poll_all_active_subreddits(
+        self, mock_provider_fn, db: Session, test_campaign_with_subreddits: RedditCampaign, fake_redis
+    ):
+        """Test subreddits are scraped concurrently and one failure doesn't stop the rest."""
+        from app.services.reddit.polling import RedditPollingService
+
+        async def mock_scrape(subreddit_name, **kwargs):
+            if subreddit_name == "webdev":
+                raise RuntimeError("actor failed")
+            return [{"id": "p1", "created_utc": 1700000000.0}]
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(side_effect=mock_scrape)
+        mock_provider_fn.return_value = mock_provider
+
+        # r/programming was polled before (and is due again); r/webdev never was
+        db.add(GlobalSubredditPoll(
+            subreddit_name="programming",
+            last_poll_at=datetime.utcnow() - timedelta(hours=12),
+            last_post_timestamp=0,
+            poll_count=3,
+            total_posts_found=10,
+        ))
+        db.commit()
+
+        service = RedditPollingService()
+        with patch.object(service, "distribute_leads", return_value=1) as mock_distribute, \
+                patch.object(service, "_get_poll_record") as mock_get_record, \
+                patch.object(service, "_load_poll_records") as mock_load_records:
+            summary = service.poll_all_active_subreddits(db)
+
+        # Poll records come from the get_subreddits_to_poll query itself
+        mock_get_record.assert_not_called()
+        mock_load_records.assert_not_called()
+
+        assert summary == {
+            "subreddits_polled": 2,
+            "total_posts_found": 1,
+            "total_leads_created": 1,
+            "distribution_tasks": 0,
+        }
+        mock_distribute.assert_called_once()
+        assert mock_distribute.call_args.args[1] == "programming"
+
+        record = db.query(GlobalSubredditPoll).filter_by(subreddit_name="programming").one()
+        assert record.poll_count == 4
+        assert record.total_posts_found == 11
+        assert record.last_post_timestamp == 1700000000.0
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_time_filter_for(self, mock_provider_fn):
+        """Test the time_filter follows the hours since the last poll, bounds inclusive."""
+        from app.services.reddit.polling import RedditPollingService
+
+        service = RedditPollingService()
+        expected = {0.5: "hour", 1: "hour", 2: "day", 24: "day", 100: "week", 720: "month", 1000: "year"}
+        for hours, time_filter in expected.items():
+            record = GlobalSubredditPoll(
+                subreddit_name="startups",
+                last_poll_at=datetime.utcnow() - timedelta(hours=hours) + timedelta(seconds=5),
+                last_post_timestamp=123.0,
+            )
+            assert service._time_filter_for("startups", record) == (time_filter, 123.0)
+
+        assert service._time_filter_for("startups", None)[0] == "day"
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_get_subreddits_to_poll(
+        self, mock_provider_fn, db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test only active, not recently polled subreddits are returned."""
+        from app.services.reddit.polling import RedditPollingService
+
+        db.add(RedditCampaignSubreddit(
+            campaign_id=test_campaign_with_subreddits.id,
+            subreddit_name="startups",
+            is_active=False,
+        ))
+        db.add(GlobalSubredditPoll(
+            subreddit_name="programming",
+            last_poll_at=datetime.utcnow() - timedelta(hours=1),
+        ))
+        db.commit()
+
+        assert RedditPollingService().get_subreddits_to_poll(db) == ["webdev"]
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_poll_subreddit_updates_cadence(self, mock_provider_fn, db: Session, fake_redis):
+        """Test the post-rate EWMA sets next_poll_at and the subreddit isn't due before it."""
+        from app.services.reddit.polling import RedditPollingService
+
+        # 60 posts newer than the last seen one arrived over 12 hours, plus one old post
+        posts = [{"id": f"p{i}", "created_utc": 200.0 + i} for i in range(60)]
+        posts.append({"id": "old", "created_utc": 50.0})
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit.return_value = posts
+        mock_provider_fn.return_value = mock_provider
+
+        db.add(GlobalSubredditPoll(
+            subreddit_name="startups",
+            last_poll_at=datetime.utcnow() - timedelta(hours=12),
+            last_post_timestamp=100.0,
+            avg_posts_per_hour=0,
+        ))
+        db.commit()
+
+        RedditPollingService().poll_subreddit(db, "startups")
+
+        record = db.query(GlobalSubredditPoll).filter_by(subreddit_name="startups").one()
+        # EWMA: 0.7 * 0 + 0.3 * (60 / 12) = 1.5 posts/hour -> next poll in 30 / 1.5 = 20 hours
+        assert record.avg_posts_per_hour == pytest.approx(1.5, rel=1e-3)
+        interval = record.next_poll_at - record.last_poll_at
+        assert interval.total_seconds() / 3600 == pytest.approx(20, rel=1e-3)
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_concurrent_subreddit_polls_share_timestamp(self, mock_provider_fn, db: Session, fake_redis):
+        """Test one batch of concurrent subreddit polls records a single poll time."""
+        from app.services.reddit.polling import RedditPollingService
+
+        async def slow_scrape(subreddit_name, **kwargs):
+            await asyncio.sleep(0.01)
+            return [{"id": f"{subreddit_name}_1", "created_utc": 100.0}]
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(side_effect=slow_scrape)
+        mock_provider_fn.return_value = mock_provider
+
+        with patch("app.services.reddit.polling.aclose_provider_clients",
+                   new_callable=AsyncMock) as mock_aclose:
+            asyncio.run(RedditPollingService()._poll_subreddits_concurrently(
+                db, ["programming", "webdev", "startups"]
+            ))
+
+        records = db.query(GlobalSubredditPoll).all()
+        assert len(records) == 3
+        assert len({record.last_poll_at for record in records}) == 1
+        # The batch's loop is about to close: its provider clients go with it
+        mock_aclose.assert_awaited_once()
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_get_subreddits_to_poll_uses_next_poll_at(
+        self, mock_provider_fn, db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test next_poll_at overrides the fixed max-age check."""
+        from app.services.reddit.polling import RedditPollingService
+
+        db.add_all([
+            # Polled long ago but quiet: not due yet
+            GlobalSubredditPoll(
+                subreddit_name="programming",
+                last_poll_at=datetime.utcnow() - timedelta(hours=12),
+                next_poll_at=datetime.utcnow() + timedelta(hours=6),
+            ),
+            # Polled recently but busy: already due
+            GlobalSubredditPoll(
+                subreddit_name="webdev",
+                last_poll_at=datetime.utcnow() - timedelta(hours=1),
+                next_poll_at=datetime.utcnow() - timedelta(minutes=5),
+            ),
+        ])
+        db.commit()
+
+        assert RedditPollingService().get_subreddits_to_poll(db) == ["webdev"]
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_distribute_leads_skips_existing_posts(
+        self, mock_provider_fn, db: Session, test_campaign_with_subreddits: RedditCampaign
+    ):
+        """Test only new posts are handed to the campaign, and nothing runs when none are new."""
+        from app.services.reddit.polling import RedditPollingService
+
+        db.add(RedditLead(
+            campaign_id=test_campaign_with_subreddits.id,
+            reddit_post_id="seen",
+            subreddit_name="programming",
+            title="Seen",
+            author="author",
+            post_url="https://reddit.com/seen",
+            created_utc=1.0,
+        ))
+        db.commit()
+
+        seen = {"id": "seen", "created_utc": 1.0}
+        fresh = {"id": "fresh", "created_utc": 2.0}
+        service = RedditPollingService()
+        with patch.object(
+            service, "poll_campaign_immediately", return_value={"total_leads_created": 1}
+        ) as mock_poll:
+            assert service.distribute_leads(db, "programming", [seen]) == 0
+            mock_poll.assert_not_called()
+
+            assert service.distribute_leads(db, "programming", [seen, fresh]) == 1
+            mock_poll.assert_called_once_with(
+                ANY, test_campaign_with_subreddits.id, trigger="scheduled",
+                prefetched_posts={"programming": [fresh]},
+            )
+            # Each campaign runs on its own session, never the caller's
+            assert mock_poll.call_args.args[0] is not db
+
+    @patch("celery.group")
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_poll_all_active_subreddits_fan_out(
+        self, mock_provider_fn, mock_group,
+        db: Session, test_campaign_with_subreddits: RedditCampaign, fake_redis
+    ):
+        """Test fan-out enqueues one distribution task per (subreddit, campaign)."""
+        from app.services.reddit.polling import RedditPollingService
+
+        posts = [{"id": "p1", "created_utc": 1700000000.0}]
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit_async = AsyncMock(return_value=posts)
+        mock_provider_fn.return_value = mock_provider
+
+        service = RedditPollingService()
+        with patch.object(service, "distribute_leads") as mock_distribute:
+            summary = service.poll_all_active_subreddits(db, fan_out=True)
+
+        mock_distribute.assert_not_called()
+        assert summary["distribution_tasks"] == 2
+        assert summary["total_leads_created"] == 0
+        assert mock_group.return_value.apply_async.call_count == 2
+
+        signatures = [sig for call in mock_group.call_args_list for sig in call.args[0]]
+        assert sorted(sig.args[1] for sig in signatures) == ["programming", "webdev"]
+        assert all(sig.args == (test_campaign_with_subreddits.id, sig.args[1], posts) for sig in signatures)
+
+    def test_distribute_to_campaign_failure_is_not_retried(self):
+        """Test a failed distribution is raised, not retried (a rerun would skip its saved posts)."""
+        from app.workers.tasks import distribute_to_campaign
+
+        with patch("app.workers.tasks.SessionLocal"), \
+                patch("app.workers.tasks.RedditPollingService") as mock_service_cls, \
+                patch.object(distribute_to_campaign, "retry") as mock_retry:
+            mock_service_cls.return_value.poll_campaign_immediately.side_effect = RuntimeError("LLM down")
+            with pytest.raises(RuntimeError, match="LLM down"):
+                distribute_to_campaign(1, "programming", [{"id": "p1"}])
+
+        mock_retry.assert_not_called()
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_poll_subreddit_uses_redis_cache(self, mock_provider_fn, db: Session, fake_redis):
+        """Test a cached scrape is reused unless the caller bypasses the cache."""
+        from app.services.reddit.polling import RedditPollingService
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit.return_value = [{"id": "p1", "created_utc": 1700000000.0}]
+        mock_provider_fn.return_value = mock_provider
+
+        # Another worker already scraped r/startups for this time window
+        fake_redis["rsp:startups:day:100"] = json.dumps([{"id": "cached", "created_utc": 1.0}])
+
+        service = RedditPollingService()
+        posts = service.poll_subreddit(db, "startups")
+
+        assert posts == [{"id": "cached", "created_utc": 1.0}]
+        mock_provider.scrape_subreddit.assert_not_called()
+
+        posts = service.poll_subreddit(db, "startups", bypass_cache=True)
+        assert posts == [{"id": "p1", "created_utc": 1700000000.0}]
+        assert json.loads(fake_redis["rsp:startups:day:100"]) == posts
+        assert mock_provider.scrape_subreddit.call_count == 1
+
+    @patch("app.services.reddit.polling.get_reddit_provider")
+    def test_poll_subreddit_does_not_cache_empty_scrape(self, mock_provider_fn, db: Session, fake_redis):
+        """Test a failed (empty) scrape isn't cached, so the next poll scrapes again."""
+        from app.services.reddit.polling import RedditPollingService
+
+        mock_provider = MagicMock()
+        mock_provider.scrape_subreddit.side_effect = [[], [{"id": "p1", "created_utc": 1700000000.0}]]
+        mock_provider_fn.return_value = mock_provider
+
+        service = RedditPollingService()
+        assert service.poll_subreddit(db, "startups") == []
+        assert "rsp:startups:day:100" not in fake_redis
+
+        assert service.poll_subreddit(db, "startups") == [{"id": "p1", "created_utc": 1700000000.0}]
+        assert mock_provider.scrape_subreddit.call_count == 2
+
 
 class TestStreamingPollIntegration:
     """Tests for streaming poll using PollEngine."""
@@ -518,6 +1555,98 @@ class TestStreamingPollIntegration:
         # reddit_provider and scoring_service. We just verify the class exists.
         assert StreamingPollService is not None
 
+    def test_streaming_yields_events_until_engine_done(self):
+        """Test events are streamed in order and the stream ends when the engine finishes."""
+        from app.services.reddit.streaming_poll import StreamingPollService
+
+        async def fake_run_poll(db, campaign_id, trigger, callbacks, bypass_cache):
+            await callbacks.on_progress("fetching", 1, 2, "r/a")
+            await asyncio.sleep(0)
+            await callbacks.on_progress("fetching", 2, 2, "r/b")
+            await callbacks.on_complete({"total_leads": 0})
+
+        with patch.object(StreamingPollService, "__init__", lambda self: None):
+            service = StreamingPollService()
+        service.engine = MagicMock()
+        service.engine.run_poll = fake_run_poll
+
+        async def collect():
+            return [e async for e in service.poll_campaign_streaming(MagicMock(), 1)]
+
+        events = asyncio.run(collect())
+        assert [e["type"] for e in events] == ["progress", "progress", "complete"]
+        assert events[1]["data"]["current"] == 2
+
+    def test_streaming_client_disconnect_does_not_block_engine(self):
+        """Test the engine finishes when the client stops reading with the event queue full."""
+        from app.services.reddit.streaming_poll import MAX_BUFFERED_EVENTS, StreamingPollService
+
+        engine_finished = asyncio.Event()
+
+        async def fake_run_poll(db, campaign_id, trigger, callbacks, bypass_cache):
+            for i in range(MAX_BUFFERED_EVENTS * 2):
+                await callbacks.on_lead_created(MagicMock(id=i))
+            await callbacks.on_complete({"total_leads": 0})
+            engine_finished.set()
+
+        with patch.object(StreamingPollService, "__init__", lambda self: None):
+            service = StreamingPollService()
+        service.engine = MagicMock()
+        service.engine.run_poll = fake_run_poll
+
+        async def read_one_then_disconnect():
+            stream = service.poll_campaign_streaming(MagicMock(), 1)
+            first = await stream.__anext__()
+            # Let the engine fill the bounded queue before the client leaves
+            await asyncio.sleep(0.01)
+            await stream.aclose()
+            await asyncio.wait_for(engine_finished.wait(), timeout=1.0)
+            return first
+
+        first = asyncio.run(read_one_then_disconnect())
+        assert first["data"]["id"] == 0
+
+    def test_streaming_coalesces_rapid_progress(self):
+        """Test rapid progress ticks of one phase collapse to the latest, without delaying other events."""
+        from app.services.reddit.streaming_poll import StreamingPollService
+
+        async def fake_run_poll(db, campaign_id, trigger, callbacks, bypass_cache):
+            for i in range(1, 100):
+                await callbacks.on_progress("scoring", i, 200, f"Scored {i}")
+            # Held-back ticks are flushed once the window passes...
+            await asyncio.sleep(0.3)
+            await callbacks.on_progress("scoring", 150, 200, "Scored 150")
+            await callbacks.on_progress("scoring", 160, 200, "Scored 160")
+            # ...or right before a lead, and errors are never merged
+            await callbacks.on_lead_created(MagicMock(id=7))
+            await callbacks.on_progress("fetching", 2, 3, "boom", error="boom")
+            await callbacks.on_progress("scoring", 200, 200, "Scored 200")
+            await callbacks.on_complete({"total_leads": 1})
+
+        with patch.object(StreamingPollService, "__init__", lambda self: None):
+            service = StreamingPollService()
+        service.engine = MagicMock()
+        service.engine.run_poll = fake_run_poll
+
+        async def collect():
+            return [e async for e in service.poll_campaign_streaming(MagicMock(), 1)]
+
+        events = asyncio.run(collect())
+        summary = [
+            (e["type"], e["data"].get("current", e["data"].get("id")))
+            for e in events
+        ]
+        assert summary == [
+            ("progress", 1),
+            ("progress", 99),
+            ("progress", 150),
+            ("progress", 160),
+            ("lead", 7),
+            ("progress", 2),
+            ("progress", 200),
+            ("complete", None),
+        ]
+
     def test_sync_wrapper_imports(self):
         """Test that poll_campaign_with_batch_scoring can be imported."""
         from app.services.reddit.streaming_poll import poll_campaign_with_batch_scoring
@@ -0,0 +1,55 @@
+"""
+Tests for the shared HTTP clients of the Reddit providers.
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.providers.reddit.apify import ApifyRedditProvider
+from app.providers.reddit.rapidapi import RapidAPIRedditProvider
+
+
+@pytest.mark.parametrize("provider_cls", [ApifyRedditProvider, RapidAPIRedditProvider])
+class TestProviderClients:
+    """Tests for client reuse across calls, threads and event loops."""
+
+    def test_sync_client_is_built_once(self, provider_cls):
+        """Test _get_client builds a real client and reuses it."""
+        provider = provider_cls()
+        client = provider._get_client()
+
+        assert isinstance(client, httpx.Client)
+        assert provider._get_client() is client
+        client.close()
+
+    def test_async_client_per_event_loop(self, provider_cls):
+        """Test each thread's loop gets its own client, reused within that loop."""
+        provider = provider_cls()
+        clients = {}
+
+        async def get_twice():
+            first = provider._get_async_client()
+            assert provider._get_async_client() is first
+            return first
+
+        def run_in_thread(name):
+            loop = asyncio.new_event_loop()
+            try:
+                clients[name] = loop.run_until_complete(get_twice())
+                loop.run_until_complete(provider.aclose_async_client())
+            finally:
+                loop.close()
+
+        threads = [threading.Thread(target=run_in_thread, args=(n,)) for n in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert isinstance(clients["a"], httpx.AsyncClient)
+        assert clients["a"] is not clients["b"]
+        assert clients["a"].is_closed and clients["b"].is_closed
+        assert len(provider._async_clients) == 0
@@ -0,0 +1,39 @@
+"""
+Tests for the legacy Reddit scoring funnel.
+"""
+
+from unittest.mock import patch
+
+from app.services.reddit.scoring import LLM_FUNNEL_TOP_K, RedditScoringService
+
+
+KEYWORDS = {"positive": [f"kw{i}" for i in range(10)], "negative": []}
+
+
+def make_service() -> RedditScoringService:
+    # Skip __init__: no LLM backend is needed with llm_analyze patched
+    service = object.__new__(RedditScoringService)
+    service.use_langchain = False
+    return service
+
+
+class TestBatchScoringFunnel:
+    """Tests for the keyword funnel in front of the LLM."""
+
+    def test_single_keyword_match_is_not_treated_as_no_match(self):
+        """Test a one-keyword match (score 1/10) still reaches the LLM in a large batch."""
+        service = make_service()
+        matched = [
+            {"id": f"m{i}", "title": "Looking for kw3 advice", "content": ""}
+            for i in range(LLM_FUNNEL_TOP_K + 1)
+        ]
+        unmatched = {"id": "none", "title": "Unrelated post", "content": ""}
+
+        assert service.keyword_filter(matched[0], KEYWORDS) == (True, 0.1, "Matched 1 keywords")
+
+        with patch.object(service, "extract_keywords", return_value=KEYWORDS), \
+                patch.object(service, "llm_analyze", return_value=(80, "relevant", "", "")):
+            scored = service.batch_score_posts(matched + [unmatched], "business")
+
+        passed = {post["id"] for post in scored if post["passed_filter"]}
+        assert passed == {post["id"] for post in matched}
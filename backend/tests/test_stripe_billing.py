@@ -2,11 +2,13 @@
 Tests for Stripe billing functionality.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from app.models.tables import User, SubscriptionTier
 from app.services.stripe_billing import (
@@ -17,6 +19,7 @@ from app.services.stripe_billing import (
     handle_subscription_updated,
     handle_subscription_deleted,
     handle_invoice_payment_failed,
+    run_webhook_handler,
     PRICE_ID_MAP,
     TIER_FROM_PRICE,
 )
@@ -27,7 +30,7 @@ class TestStripeCustomer:
 
     def test_get_existing_customer(self, db: Session, test_user_paid: User):
         """Test getting existing customer returns existing ID."""
-        customer_id = get_or_create_customer(test_user_paid, db)
+        customer_id = asyncio.run(get_or_create_customer(test_user_paid, db))
         assert customer_id == test_user_paid.stripe_customer_id
 
     def test_create_new_customer(self, db: Session, test_user: User, mock_stripe):
@@ -35,11 +38,74 @@ class TestStripeCustomer:
         # Ensure no customer ID
         assert test_user.stripe_customer_id is None
 
-        customer_id = get_or_create_customer(test_user, db)
+        customer_id = asyncio.run(get_or_create_customer(test_user, db))
 
         assert customer_id == "cus_test_new"
         db.refresh(test_user)
         assert test_user.stripe_customer_id == "cus_test_new"
+        assert mock_stripe["customer"].call_args.kwargs["idempotency_key"].startswith(f"cust-create-{test_user.id}-")
+
+    def test_customer_create_key_is_scoped_to_window_and_params(self):
+        """Test the idempotency key changes across windows and with the params sent."""
+        from app.services.stripe_billing import _customer_create_key, CUSTOMER_CREATE_KEY_WINDOW_SECONDS
+
+        with patch("app.services.stripe_billing.time.time", return_value=1_000_000):
+            key = _customer_create_key(1, "a@example.com", "A")
+            assert _customer_create_key(1, "a@example.com", "A") == key
+            assert _customer_create_key(1, "b@example.com", "A") != key
+        with patch("app.services.stripe_billing.time.time", return_value=1_000_000 + CUSTOMER_CREATE_KEY_WINDOW_SECONDS):
+            assert _customer_create_key(1, "a@example.com", "A") != key
+
+    def test_create_customer_losing_race_keeps_saved_customer(self, db: Session, test_user: User, mock_stripe):
+        """Test a customer saved while ours was being created wins, and ours is deleted."""
+        from app.services import stripe_billing
+
+        stale_user = MagicMock(id=test_user.id, stripe_customer_id=None, email=test_user.email, full_name=None)
+        test_user.stripe_customer_id = "cus_from_other_request"
+        db.commit()
+
+        with patch.object(stripe_billing, "_read_customer_id", return_value=None), \
+                patch("stripe.Customer.delete_async", new_callable=AsyncMock) as mock_delete:
+            customer_id = asyncio.run(get_or_create_customer(stale_user, db))
+
+        assert customer_id == "cus_from_other_request"
+        mock_delete.assert_awaited_once_with("cus_test_new")
+        db.refresh(test_user)
+        assert test_user.stripe_customer_id == "cus_from_other_request"
+
+    def test_create_customer_rechecks_after_concurrent_create(self, db: Session, test_user: User, mock_stripe):
+        """Test a customer saved by a racing request is reused instead of creating another."""
+        stale_user = MagicMock(id=test_user.id, stripe_customer_id=None)
+        test_user.stripe_customer_id = "cus_from_other_request"
+        db.commit()
+
+        customer_id = asyncio.run(get_or_create_customer(stale_user, db))
+
+        assert customer_id == "cus_from_other_request"
+        mock_stripe["customer"].assert_not_called()
+
+    def test_create_customer_db_work_runs_off_event_loop(self, db: Session, test_user: User, mock_stripe):
+        """Test the re-read and save run in the threadpool, not on the event loop thread."""
+        import threading
+        from app.services import stripe_billing
+
+        threads = []
+        real_read, real_save = stripe_billing._read_customer_id, stripe_billing._save_customer_id
+
+        def read(*args):
+            threads.append(threading.current_thread())
+            return real_read(*args)
+
+        def save(*args):
+            threads.append(threading.current_thread())
+            return real_save(*args)
+
+        with patch.object(stripe_billing, "_read_customer_id", read), \
+                patch.object(stripe_billing, "_save_customer_id", save):
+            asyncio.run(get_or_create_customer(test_user, db))
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
 
 
 class TestCheckoutSession:
@@ -48,13 +114,13 @@ class TestCheckoutSession:
     def test_create_checkout_session_starter(self, db: Session, test_user: User, mock_stripe):
         """Test creating checkout session for Starter plan."""
         with patch("app.services.stripe_billing.settings.STRIPE_PRICE_STARTER_MONTHLY", "price_starter_monthly"):
-            result = create_checkout_session(
+            result = asyncio.run(create_checkout_session(
                 user=test_user,
                 tier_code="STARTER_MONTHLY",
                 db=db,
                 success_url="http://localhost:3000/success",
                 cancel_url="http://localhost:3000/cancel",
-            )
+            ))
 
         assert "checkout_url" in result
         assert result["checkout_url"] == "https://checkout.stripe.com/test"
@@ -62,37 +128,37 @@ class TestCheckoutSession:
     def test_create_checkout_session_growth(self, db: Session, test_user: User, mock_stripe):
         """Test creating checkout session for Growth plan."""
         with patch("app.services.stripe_billing.settings.STRIPE_PRICE_GROWTH_ANNUALLY", "price_growth_annually"):
-            result = create_checkout_session(
+            result = asyncio.run(create_checkout_session(
                 user=test_user,
                 tier_code="GROWTH_ANNUALLY",
                 db=db,
                 success_url="http://localhost:3000/success",
                 cancel_url="http://localhost:3000/cancel",
-            )
+            ))
 
         assert "checkout_url" in result
 
     def test_create_checkout_invalid_tier(self, db: Session, test_user: User):
         """Test creating checkout with invalid tier fails."""
         with pytest.raises(ValueError, match="Invalid tier code"):
-            create_checkout_session(
+            asyncio.run(create_checkout_session(
                 user=test_user,
                 tier_code="INVALID_TIER",
                 db=db,
                 success_url="http://localhost:3000/success",
                 cancel_url="http://localhost:3000/cancel",
-            )
+            ))
 
     def test_create_checkout_trial_eligibility(self, db: Session, test_user: User, mock_stripe):
         """Test trial period is added for Starter plan on FREE_TRIAL users."""
         with patch("app.services.stripe_billing.settings.STRIPE_PRICE_STARTER_MONTHLY", "price_starter_monthly"):
-            create_checkout_session(
+            asyncio.run(create_checkout_session(
                 user=test_user,
                 tier_code="STARTER_MONTHLY",
                 db=db,
                 success_url="http://localhost:3000/success",
                 cancel_url="http://localhost:3000/cancel",
-            )
+            ))
 
         # Check that trial_period_days was passed
         call_kwargs = mock_stripe["checkout"].call_args[1]
@@ -104,11 +170,11 @@ class TestCustomerPortal:
 
     def test_create_portal_session(self, db: Session, test_user_paid: User, mock_stripe):
         """Test creating customer portal session."""
-        result = create_customer_portal_session(
+        result = asyncio.run(create_customer_portal_session(
             user=test_user_paid,
             db=db,
             return_url="http://localhost:3000/reddit",
-        )
+        ))
 
         assert "portal_url" in result
         assert result["portal_url"] == "https://billing.stripe.com/test"
@@ -116,11 +182,11 @@ class TestCustomerPortal:
     def test_create_portal_no_customer(self, db: Session, test_user: User):
         """Test portal creation fails without customer ID."""
         with pytest.raises(ValueError, match="no Stripe customer ID"):
-            create_customer_portal_session(
+            asyncio.run(create_customer_portal_session(
                 user=test_user,
                 db=db,
                 return_url="http://localhost:3000/reddit",
-            )
+            ))
 
 
 class TestWebhookHandlers:
@@ -137,12 +203,58 @@ class TestWebhookHandlers:
         mock_session.subscription = "sub_test_123"
         mock_session.id = "cs_test_123"
 
-        handle_checkout_completed(mock_session, db)
+        asyncio.run(handle_checkout_completed(mock_session, db))
 
         db.refresh(test_user)
         assert test_user.subscription_tier == SubscriptionTier.STARTER_MONTHLY
         assert test_user.stripe_subscription_id == "sub_test_123"
         assert test_user.trial_ends_at is None
+        # No subscription event has set the end date yet, so it is retrieved
+        mock_stripe["subscription"].assert_awaited_once_with("sub_test_123")
+        assert test_user.subscription_ends_at > datetime.utcnow() + timedelta(days=29)
+
+    def test_handle_checkout_completed_retrieve_failure_leaves_end_date_unset(
+        self, db: Session, test_user: User, mock_stripe
+    ):
+        """Test a failed fallback retrieve is logged and keeps the applied subscription."""
+        mock_session = MagicMock()
+        mock_session.metadata = {"user_id": str(test_user.id), "tier_code": "STARTER_MONTHLY"}
+        mock_session.subscription = "sub_test_123"
+        mock_session.id = "cs_test_123"
+        mock_stripe["subscription"].side_effect = Exception("Stripe unavailable")
+
+        with patch("app.services.stripe_billing.logger") as mock_logger:
+            asyncio.run(handle_checkout_completed(mock_session, db))
+
+        db.refresh(test_user)
+        assert test_user.subscription_tier == SubscriptionTier.STARTER_MONTHLY
+        assert test_user.subscription_ends_at is None
+        assert "sub_test_123" in mock_logger.error.call_args.args[0]
+
+    def test_handle_checkout_completed_clears_past_end_date(self, db: Session, test_user: User, mock_stripe):
+        """Test a resubscribing user's past end date is replaced, but a future one is kept."""
+        mock_session = MagicMock()
+        mock_session.metadata = {"user_id": str(test_user.id), "tier_code": "STARTER_MONTHLY"}
+        mock_session.subscription = "sub_resubscribe_123"
+        mock_session.id = "cs_resubscribe_123"
+
+        # Left behind by handle_subscription_deleted for the old subscription
+        test_user.subscription_ends_at = datetime.utcnow() - timedelta(days=2)
+        db.commit()
+        asyncio.run(handle_checkout_completed(mock_session, db))
+        db.refresh(test_user)
+        assert test_user.subscription_ends_at > datetime.utcnow()
+        mock_stripe["subscription"].assert_awaited_once_with("sub_resubscribe_123")
+
+        # customer.subscription.created arrived first and set the real end date
+        mock_stripe["subscription"].reset_mock()
+        period_end = datetime.utcnow().replace(microsecond=0) + timedelta(days=20)
+        test_user.subscription_ends_at = period_end
+        db.commit()
+        asyncio.run(handle_checkout_completed(mock_session, db))
+        db.refresh(test_user)
+        assert test_user.subscription_ends_at == period_end
+        mock_stripe["subscription"].assert_not_called()
 
     def test_handle_subscription_updated(self, db: Session, test_user_paid: User):
         """Test customer.subscription.updated webhook handler."""
@@ -158,18 +270,80 @@ class TestWebhookHandlers:
         db.refresh(test_user_paid)
         assert test_user_paid.stripe_subscription_id == "sub_updated_123"
 
+    def test_handle_subscription_updated_skips_stale_event(self, db: Session, test_user_paid: User):
+        """Test an update older than the applied watermark is skipped, a newer one applied."""
+        original_subscription_id = test_user_paid.stripe_subscription_id
+        mock_subscription = MagicMock()
+        mock_subscription.metadata = {"user_id": str(test_user_paid.id)}
+        mock_subscription.id = "sub_burst_123"
+        mock_subscription.status = "active"
+        mock_subscription.current_period_end = int((datetime.utcnow() + timedelta(days=30)).timestamp())
+        mock_subscription.items.data = []
+
+        redis_client = MagicMock()
+        with patch("app.workers.tasks.get_redis_client", return_value=redis_client):
+            redis_client.eval.return_value = 0
+            handle_subscription_updated(mock_subscription, db, event_created=1700000000)
+            db.refresh(test_user_paid)
+            assert test_user_paid.stripe_subscription_id == original_subscription_id
+
+            redis_client.eval.return_value = 1
+            handle_subscription_updated(mock_subscription, db, event_created=1700000100)
+            db.refresh(test_user_paid)
+            assert test_user_paid.stripe_subscription_id == "sub_burst_123"
+
+        keys_and_args = redis_client.eval.call_args.args[1:]
+        assert keys_and_args[:3] == (2, "stripe:evt:sub_burst_123", "stripe:evt:sub_burst_123:deleted")
+        assert keys_and_args[3] == 1700000100
+
+    def test_handle_subscription_deleted_sets_terminal_flag(self, db: Session, test_user_paid: User):
+        """Test a deletion is always applied and blocks later-delivered updates."""
+        mock_subscription = MagicMock()
+        mock_subscription.customer = test_user_paid.stripe_customer_id
+        mock_subscription.id = "sub_cancelled_456"
+
+        redis_client = MagicMock()
+        with patch("app.workers.tasks.get_redis_client", return_value=redis_client):
+            handle_subscription_deleted(mock_subscription, db)
+
+        redis_client.set.assert_called_once()
+        assert redis_client.set.call_args.args[0] == "stripe:evt:sub_cancelled_456:deleted"
+        db.refresh(test_user_paid)
+        assert test_user_paid.subscription_tier == SubscriptionTier.EXPIRED
+
     def test_handle_subscription_deleted(self, db: Session, test_user_paid: User):
         """Test customer.subscription.deleted webhook handler."""
         mock_subscription = MagicMock()
         mock_subscription.customer = test_user_paid.stripe_customer_id
         mock_subscription.id = "sub_cancelled_123"
 
-        handle_subscription_deleted(mock_subscription, db)
+        with patch("app.workers.tasks.get_redis_client", return_value=MagicMock()):
+            handle_subscription_deleted(mock_subscription, db)
 
         db.refresh(test_user_paid)
         assert test_user_paid.subscription_tier == SubscriptionTier.EXPIRED
         assert test_user_paid.stripe_subscription_id is None
 
+    def test_webhook_handlers_run_on_dedicated_pool(self, db: Session, test_user_paid: User):
+        """Test sync handlers run off the event loop on the stripe-webhook threads."""
+        import threading
+
+        mock_subscription = MagicMock()
+        mock_subscription.customer = test_user_paid.stripe_customer_id
+        mock_subscription.id = "sub_cancelled_789"
+        threads = []
+
+        def handler(subscription, session):
+            threads.append(threading.current_thread().name)
+            handle_subscription_deleted(subscription, session)
+
+        with patch("app.workers.tasks.get_redis_client", return_value=MagicMock()):
+            asyncio.run(run_webhook_handler(handler, mock_subscription, db))
+
+        assert threads[0].startswith("stripe-webhook")
+        db.refresh(test_user_paid)
+        assert test_user_paid.subscription_tier == SubscriptionTier.EXPIRED
+
     def test_handle_invoice_payment_failed(self, db: Session, test_user_paid: User):
         """Test invoice.payment_failed webhook handler."""
         mock_invoice = MagicMock()
@@ -256,7 +430,7 @@ class TestBillingAPI:
 
         with patch("app.core.config.settings.STRIPE_WEBHOOK_SECRET", "whsec_test"), \
              patch("stripe.Webhook.construct_event") as mock_construct, \
-             patch("stripe.Subscription.retrieve") as mock_sub:
+             patch("stripe.Subscription.retrieve_async", new_callable=AsyncMock) as mock_sub:
             mock_construct.return_value = event_data
             mock_sub.return_value = MagicMock(
                 current_period_end=int((datetime.utcnow() + timedelta(days=30)).timestamp())
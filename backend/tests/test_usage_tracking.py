@@ -0,0 +1,174 @@
+"""
+Tests for API usage tracking.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.tables import User, UsageTracking, APIType
+from app.services.usage_tracking import (
+    flush_buffered_usage,
+    get_all_users_usage,
+    get_user_usage_summary,
+    track_api_call,
+    track_api_calls_bulk,
+)
+
+
+class FakeRedis:
+    """Just enough of redis-py's hash and pipeline API for the usage counters."""
+
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def scan_iter(self, match="*", count=None):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.hashes) if key.startswith(prefix)]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hincrby(self, key, field, amount):
+        self.commands.append(lambda: self.redis.hashes[key].__setitem__(
+            field, str(int(self.redis.hashes[key].get(field, 0)) + amount)
+        ))
+
+    def expire(self, key, ttl):
+        self.commands.append(lambda: True)
+
+    def hgetall(self, key):
+        self.commands.append(lambda: dict(self.redis.hashes.get(key, {})))
+
+    def delete(self, key):
+        self.commands.append(lambda: self.redis.hashes.pop(key, None) is not None)
+
+    def execute(self):
+        return [command() for command in self.commands]
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch("app.workers.tasks.get_redis_client", return_value=redis):
+        yield redis
+
+
+class TestTrackApiCallsBulk:
+    """Tests for buffered usage tracking."""
+
+    def test_bulk_creates_one_row_per_type(self, db: Session, test_user: User):
+        """Test buffered counts are written as a single row per API type."""
+        track_api_calls_bulk(db, test_user.id, {
+            APIType.REDDIT_APIFY: 3,
+            APIType.LLM_GEMINI: 5,
+            APIType.LLM_OPENAI: 0,
+        })
+
+        rows = {
+            r.api_type: r.call_count
+            for r in db.query(UsageTracking).filter(UsageTracking.user_id == test_user.id).all()
+        }
+        assert rows == {APIType.REDDIT_APIFY: 3, APIType.LLM_GEMINI: 5}
+
+    def test_bulk_increments_existing_row(self, db: Session, test_user: User):
+        """Test buffered counts add onto today's existing row."""
+        with patch("app.workers.tasks.get_redis_client", side_effect=ConnectionError("redis down")):
+            track_api_call(db, test_user.id, APIType.REDDIT_APIFY)
+        track_api_calls_bulk(db, test_user.id, {APIType.REDDIT_APIFY: 4})
+
+        rows = db.query(UsageTracking).filter(UsageTracking.user_id == test_user.id).all()
+        assert len(rows) == 1
+        assert rows[0].call_count == 5
+
+
+class TestTrackApiCall:
+    """Tests for single-call usage tracking."""
+
+    def test_repeated_calls_accumulate_in_one_row(self, db: Session, test_user: User):
+        """Test without Redis, calls on the same day are upserted onto one row, tokens included."""
+        with patch("app.workers.tasks.get_redis_client", side_effect=ConnectionError("redis down")):
+            track_api_call(db, test_user.id, APIType.LLM_OPENAI, input_tokens=100, output_tokens=20)
+            track_api_call(db, test_user.id, APIType.LLM_OPENAI, input_tokens=50, output_tokens=5)
+
+        rows = db.query(UsageTracking).filter(UsageTracking.user_id == test_user.id).all()
+        assert len(rows) == 1
+        assert (rows[0].call_count, rows[0].input_tokens, rows[0].output_tokens) == (2, 150, 25)
+
+    def test_calls_buffered_in_redis_until_flushed(self, db: Session, test_user: User, fake_redis):
+        """Test calls only touch Redis, and one flush writes the summed counters."""
+        track_api_call(db, test_user.id, APIType.LLM_OPENAI, input_tokens=100, output_tokens=20)
+        track_api_call(db, test_user.id, APIType.LLM_OPENAI, input_tokens=50, output_tokens=5)
+        track_api_call(db, test_user.id, APIType.REDDIT_APIFY)
+        track_api_calls_bulk(db, test_user.id, {APIType.REDDIT_APIFY: 2})
+
+        assert db.query(UsageTracking).filter(
+            UsageTracking.api_type == APIType.LLM_OPENAI
+        ).count() == 0
+
+        assert flush_buffered_usage(db) == 2
+        assert fake_redis.hashes == {}
+
+        rows = {
+            r.api_type: (r.call_count, r.input_tokens, r.output_tokens)
+            for r in db.query(UsageTracking).filter(UsageTracking.user_id == test_user.id).all()
+        }
+        assert rows == {
+            APIType.LLM_OPENAI: (2, 150, 25),
+            APIType.REDDIT_APIFY: (3, 0, 0),
+        }
+        assert flush_buffered_usage(db) == 0
+
+    def test_failed_flush_rebuffers_each_counter_and_keeps_db_error(
+        self, db: Session, test_user: User, fake_redis
+    ):
+        """Test a Redis failure while re-buffering one counter neither hides the DB error nor stops the rest."""
+        track_api_call(db, test_user.id, APIType.LLM_OPENAI)
+        track_api_call(db, test_user.id, APIType.REDDIT_APIFY)
+
+        with patch("app.services.usage_tracking._upsert_usage", side_effect=RuntimeError("db down")), \
+                patch("app.services.usage_tracking._buffer_usage",
+                      side_effect=[ConnectionError("redis down"), None]) as mock_buffer:
+            with pytest.raises(RuntimeError, match="db down"):
+                flush_buffered_usage(db)
+
+        assert mock_buffer.call_count == 2
+
+
+class TestUsageSummaries:
+    """Tests for the usage aggregation queries."""
+
+    def test_summaries_respect_date_range(self, db: Session, test_user: User):
+        """Test per-type and per-user sums only count rows inside the range."""
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        db.add_all([
+            UsageTracking(user_id=test_user.id, api_type=APIType.LLM_GEMINI, date=today,
+                          call_count=3, input_tokens=30, output_tokens=3),
+            UsageTracking(user_id=test_user.id, api_type=APIType.REDDIT_APIFY, date=today,
+                          call_count=2, input_tokens=0, output_tokens=0),
+            UsageTracking(user_id=test_user.id, api_type=APIType.LLM_GEMINI, date=today - timedelta(days=10),
+                          call_count=7, input_tokens=70, output_tokens=7),
+        ])
+        db.commit()
+
+        since = (today - timedelta(days=1)).date()
+        assert get_user_usage_summary(db, test_user.id, start_date=since) == {
+            "LLM_GEMINI": {"calls": 3, "input_tokens": 30, "output_tokens": 3},
+            "REDDIT_APIFY": {"calls": 2, "input_tokens": 0, "output_tokens": 0},
+        }
+        assert get_all_users_usage(db, start_date=since, end_date=today.date()) == [{
+            "user_id": test_user.id,
+            "total_calls": 5,
+            "total_input_tokens": 30,
+            "total_output_tokens": 3,
+        }]
+        assert get_all_users_usage(db)[0]["total_calls"] == 12
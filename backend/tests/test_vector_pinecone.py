@@ -0,0 +1,38 @@
+"""
+Tests for Pinecone response normalization.
+"""
+
+from app.services.vector.pinecone import _normalize_matches
+
+
+class TestNormalizeSearchHits:
+    """Tests for converting search() hits to the query() match format."""
+
+    def test_metadata_merge_order(self):
+        """Test fields < _metadata < metadata, with top-level keys only filling gaps."""
+        hit = {
+            "_id": "rec-1",
+            "_score": 0.9,
+            "fields": {"a": "fields", "b": "fields", "c": "fields"},
+            "_metadata": {"b": "_metadata", "c": "_metadata"},
+            "metadata": {"c": "metadata"},
+            "a": "top-level",
+            "d": "top-level",
+            "text": "not metadata",
+        }
+
+        matches = _normalize_matches({"result": {"hits": [hit]}})
+
+        assert matches == [{
+            "id": "rec-1",
+            "score": 0.9,
+            "metadata": {"a": "fields", "b": "_metadata", "c": "metadata", "d": "top-level"},
+        }]
+
+    def test_top_level_keys_merged_without_fields(self):
+        """Test a hit with no metadata containers still picks up top-level keys."""
+        hit = {"id": "rec-2", "score": 0.5, "title": "Founder", "_metadata": None}
+
+        matches = _normalize_matches({"result": {"hits": [hit]}})
+
+        assert matches[0]["metadata"] == {"title": "Founder"}